@@ -1,2 +1,20 @@
-from ._if97 import if97, saturationP, saturationT
-from .visco import visc
\ No newline at end of file
+from ._if97 import STATUS, if97, saturationP, saturationT
+from ._region import region_of
+from .constants import *
+from .visco import visc
+
+
+def __getattr__(name):
+    """Import array interfaces on first access, they need numpy which is not imported by single-point calls."""
+
+    if name == "if97_grid":
+        from ._grid import if97_grid as value
+    elif name == "jacobian":
+        from ._jacobian import jacobian as value
+    elif name == "if97_many":
+        from ._many import if97_many as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
\ No newline at end of file
@@ -0,0 +1,141 @@
+import numpy as np
+from .cores.backwardPT import Region3VPT
+from .cores.basic import Region1, Region2, Region3, Region4, Region5
+from .cores.boundary import Boundary23
+from ._if97 import _PROPS, _select
+from .visco import visc
+
+
+def _regionCodes(p, t):
+    """Find region of every state, using the same limits as singlephase.
+
+    Parameters
+    ----------
+    p: ndarray
+        pressure (KPa).
+    t: ndarray
+        temperature (K), broadcast against pressure.
+
+    Returns
+    -------
+    codes: ndarray
+        region number (1, 2, 3 or 5) of every state, 0 if state is not in range of limits.
+    """
+
+    t = np.asarray(t, dtype=float)
+    psat = Region4.getSaturPressArray(tsat=t)[0]
+    p23 = Boundary23.getPressArray(t)[0]
+    p, t, psat, p23 = np.broadcast_arrays(p, t, psat, p23)
+
+    low = (273.15 <= t) & (t <= 623.15)
+    mid = (623.15 < t) & (t <= 863.15)
+
+    codes = np.zeros(p.shape, dtype=int)
+    codes[low & (0 < p) & (p < psat)] = 2
+    codes[low & (psat <= p) & (p <= 1e5)] = 1
+    codes[mid & (0 < p) & (p <= p23)] = 2
+    codes[mid & (p23 < p) & (p <= 1e5)] = 3
+    codes[(863.15 < t) & (t <= 1073.15) & (0 < p) & (p <= 1e5)] = 2
+    codes[(1073.15 < t) & (t <= 2273.15) & (0 < p) & (p <= 5e4)] = 5
+    return codes
+
+
+def if97_grid(p_values, t_values, dtype=np.float64, exact=False, props=None):
+    """Calculate properties of ordinary/pure water at single phase on full grid of pressures and temperatures.
+
+    Every basic equation of region 1, 2 and 5 is sum of separable terms n*f(pi)**I*g(tau)**J, so on grid each
+    property is evaluated as matrix products over coefficients instead of state by state. Each region is evaluated
+    on the smallest sub-grid which covers its cells, then cells of other regions are masked out and filled from
+    their own region. Cells in region 3 are grouped by subregion and their densities are evaluated from backward
+    equations with one vectorized call per subregion, see Region3VPT.singleRho.
+
+    With dtype numpy.float32 regions 1, 2 and 5 and viscosity are evaluated in float32 on rescaled variables, see
+    coefficients.PolyTable.scaled, which halves memory and bandwidth of very large grids. Largest relative error
+    against float64 measured over each region (benchmarks/bench_float32.py) is about 2e-5 for v and 3e-3 for
+    other properties in region 1, 5e-5 in region 2, 2e-6 in region 5 and 2e-5 for mu. u, h, s, g and f of region 1
+    vanish at reference state (liquid at triple point), near it their error is absolute, about 1e-6 of their
+    largest magnitude in region 1. Region 3 is evaluated in float64 and stored as float32.
+
+    Available Properties
+    --------------------
+    v: ndarray
+        specific volume (m^3/Kg).
+    u: ndarray
+        specific internal energy (KJ/Kg).
+    h: ndarray
+        specific enthalpy (KJ/Kg).
+    s: ndarray
+        specific entropy (KJ/Kg*K).
+    cp: ndarray
+        specific isobaric heat capacity (KJ/Kg*K).
+    cv: ndarray
+        specific isochoric heat capacity (KJ/Kg*K).
+    w, kappa_t, alpha_v, mu_jt, k_s, g, f: ndarray
+        speed of sound (m/s), isothermal compressibility (1/KPa), isobaric cubic expansion coefficient (1/K),
+        Joule-Thomson coefficient (K/KPa), isentropic exponent and specific Gibbs and Helmholtz free energy (KJ/Kg).
+    mu: ndarray
+        dynamic viscosity (Pa*s), nan for t > 1173.15 K.
+
+    Limits
+    ------
+    Same as singlephase, cells out of range of limits are nan.
+
+    Parameters
+    ----------
+    p_values: array_like
+        1-D array of pressures (KPa), with m elements.
+    t_values: array_like
+        1-D array of temperatures (K), with k elements.
+    dtype: dtype, optional
+        floating point type of evaluation and of returned arrays, numpy.float64 (default) or numpy.float32.
+    exact: bool, optional
+        solve basic equation for density of cells in region 3, see singlephase, default False.
+    props: collection of str or str or None, optional
+        names of properties to return, only these properties (and derivatives they need) are evaluated, see if97,
+        default None for all available properties.
+
+    Returns
+    -------
+    props: dict
+        all available properties (or requested props) as arrays of shape (m, k), element [i, j] at p_values[i] and t_values[j].
+    """
+
+    p = np.asarray(p_values, dtype=float).ravel()
+    t = np.asarray(t_values, dtype=float).ravel()
+    codes = _regionCodes(p[:, None], t[None, :])
+
+    keys, out, names = _select(props)
+    keys = _PROPS if keys is None else keys
+    props = {key: np.full(codes.shape, np.nan, dtype=dtype) for key in keys}
+    pd = p.astype(dtype)
+    td = t.astype(dtype)
+
+    for region, cls in ((1, Region1), (2, Region2), (5, Region5)):
+        cells = codes == region
+        rows = cells.any(axis=1)
+        cols = cells.any(axis=0)
+        if not rows.any() or not keys:
+            continue
+
+        sub = cells[np.ix_(rows, cols)]
+        #cells of other regions in sub-grid can be out of range of equation and are masked out
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            ans = cls.props_all(pd[rows][:, None], td[cols][None, :], props=keys)
+        for key in keys:
+            block = props[key][np.ix_(rows, cols)]
+            block[sub] = ans[key][sub]
+            props[key][np.ix_(rows, cols)] = block
+
+    i, j = np.nonzero(codes == 3)
+    if i.size and keys:
+        rho = Region3VPT.singleRho(p[i], t[j], exact=exact)
+        ans = Region3.props_all(rho, t[j], props=keys)
+        for key in keys:
+            props[key][i, j] = ans[key]
+
+    ans = {key: props[key] for key in out}
+    if "mu" in names:
+        tgrid = np.broadcast_to(td[None, :], codes.shape)
+        with np.errstate(invalid="ignore"):
+            ans["mu"] = np.where(tgrid <= 1173.15, visc(1/props["v"], tgrid), np.nan).astype(dtype, copy=False)
+    return ans
@@ -1,12 +1,144 @@
-import math
-from .cores.backwardPT import Region3VPT
-from .cores.basic import Region1, Region2, SuppRegion2, Region3, Region4, Region5
+from .cores.backwardPT import Region3VPT, _classify
+from .cores.basic import PSAT273, PSAT623, Region1, Region2, SuppRegion2, Region3, Region4, Region5
 from .cores.boundary import Boundary23
+from .cores.critical import NearCritical
 from .visco import visc
 from .constants import PRESSC, RHOC, TEMPC
 
 
-def saturationT(tsat):
+#properties of single phase taken from property equations of regions, mu is added from viscosity equation
+_PROPS = ("v", "u", "h", "s", "cv", "cp", "w", "kappa_t", "alpha_v", "mu_jt", "k_s", "g", "f")
+
+#every property of if97, see _select
+_ALL = frozenset(_PROPS+("mu", "psat", "tsat"))
+
+#selections of properties of requested props, see _select
+_selections = dict()
+
+#reasons why state has no properties, status code is index in STATUS, 0 is valid state, see if97_many
+STATUS = ("ok", "input", "quality", "saturation temperature", "saturation pressure", "temperature", "pressure", "state",
+          "convergence")
+
+#messages of ValueError for every status code
+MESSAGES = (
+    "",
+    "Value of inputs are not finite numbers",
+    "Quality(x) value exceed and/or is not in range of limits",
+    "Value of saturation temperature(t) exceed and/or is not in range of limits",
+    "Value of saturation pressure(p) exceed and/or is not in range limit",
+    "Value of temperature(t) exceed and/or is not in range of limits",
+    "Value of pressure(p) exceed and/or is not in range of limits",
+    "Value of pressure(p) or temperature(t) exceed and/or are not in range of limits",
+    "Density of region 3 did not converge",
+)
+
+
+def _select(props):
+    """Properties to evaluate for requested props of if97, see props of if97.
+
+    Returns
+    -------
+    keys: tuple or None
+        properties of region equations to evaluate, with v if mu is requested (viscosity needs density), None for
+        all properties.
+    out: tuple
+        requested properties of region equations, in order of _PROPS.
+    names: frozenset
+        all requested properties, with mu, psat and tsat.
+    """
+
+    if props is None:
+        return None, _PROPS, _ALL
+    if isinstance(props, str):
+        props = (props,)
+
+    key = tuple(props)
+    if (ans := _selections.get(key)) is None:
+        names = frozenset(prop.lower() for prop in key if prop)
+        keys = tuple(prop for prop in _PROPS if prop in names or (prop == "v" and "mu" in names))
+        ans = keys, tuple(prop for prop in keys if prop in names), names
+        if len(_selections) < 256:
+            _selections[key] = ans
+    return ans
+
+
+def _sat(psat, tsat, names):
+    """Saturation pressure and temperature if requested."""
+
+    if names is _ALL:
+        return {"psat": psat, "tsat": tsat}
+    return {key: val for key, val in (("psat", psat), ("tsat", tsat)) if key in names}
+
+
+def _critical(out, names):
+    """Properties at critical point as pairs [liq, vap], with psat, tsat and viscosity, see NearCritical.limits."""
+
+    crit = NearCritical.limits()
+    props = _sat(PRESSC, TEMPC, names)
+    props.update({key: [crit[key], crit[key]] for key in out})
+    if "mu" in names:
+        props["mu"] = [visc(rho=RHOC, t=TEMPC)]*2
+    return props
+
+
+def _phases(psat, tsat, region3, keys):
+    """Properties keys of liquid and vapor phase at saturation below critical point, from region 3 if region3 is
+    True else from region 1 and 2."""
+
+    if region3:
+        rhof, rhog = Region3.saturRho(psat, tsat)
+        return Region3.props_all(rho=rhof, t=tsat, props=keys), Region3.props_all(rho=rhog, t=tsat, props=keys)
+    return Region1.props_all(p=psat, t=tsat, props=keys), Region2.props_all(p=psat, t=tsat, props=keys)
+
+
+def _pairs(psat, tsat, region3, props):
+    """Properties at saturation below critical point as pairs [liq, vap], see saturationT."""
+
+    keys, out, names = _select(props)
+    ans = _sat(psat, tsat, names)
+    if keys != ():
+        liq, vap = _phases(psat, tsat, region3, keys)
+        ans.update({key: [liq[key], vap[key]] for key in out})
+        if "mu" in names:
+            ans["mu"] = [visc(rho=1/liq["v"], t=tsat), visc(rho=1/vap["v"], t=tsat)]
+    return ans
+
+
+def _mixed(psat, tsat, x, region3, props):
+    """Properties of mixed phase at quality x, interpolated between liquid and vapor phase, see if97."""
+
+    keys, out, names = _select(props)
+    mix = {}
+    if tsat == TEMPC:
+        #phases are equal, cp, kappa_t and alpha_v are inf and are not interpolated
+        crit = NearCritical.limits()
+        mix = {key: crit[key] for key in _PROPS}
+    elif keys != ():
+        liq, vap = _phases(psat, tsat, region3, keys)
+        mix = {key: liq[key]+x*(vap[key]-liq[key]) for key in (keys or _PROPS)}
+
+    ans = _sat(psat, tsat, names)
+    ans.update(mix if keys is None else {key: mix[key] for key in out})
+    if "mu" in names:
+        ans["mu"] = visc(1/mix["v"], tsat)
+    return ans
+
+
+def _reason(p, t, x):
+    """Status code of inputs of if97 out of range of limits, see STATUS."""
+
+    if x is not None:
+        if not 0 <= x <= 1:
+            return 2
+        return 3 if p is None else 4
+    elif 0 < p <= 1e5 and not 273.15 <= t <= 1073.15 and not (1073.15 < t <= 2273.15 and p <= 5e4):
+        return 5
+    elif 273.15 <= t <= 2273.15 and (p <= 0 or p > 1e5 or (1073.15 < t and p > 5e4)):
+        return 6
+    return 7
+
+
+def saturationT(tsat, props=None):
     """Calculate properties of ordinary/pure water at saturation phase using saturation temperature as input.
 
     Available Properties
@@ -24,13 +156,25 @@ def saturationT(tsat):
     s: float
         specific entropy of liquid and vapor phase (KJ/Kg*K).
     cp: float or inf
-        specific isobaric heat capacity of liquid and vapor phase (KJ/Kg*K),
-        return inf when tsat near critical temperature, because near critical temperature value of cp is not accurate.
-    cv: float or inf
-        specific isohoric heat capacity of liquid and vapor phase (KJ/Kg*K),
-        return inf when tsat near critical temperature, because near critical temperature value of cv is not accurate.
-    mu: float or inf
-        dynamic viscosity (Pa*s), return inf when tsat near critical temperature, because near critical temperature value of mu is not accurate.
+        specific isobaric heat capacity of liquid and vapor phase (KJ/Kg*K), return inf at critical point.
+    cv: float
+        specific isohoric heat capacity of liquid and vapor phase (KJ/Kg*K), finite limit at critical point.
+    w: float
+        speed of sound of liquid and vapor phase (m/s).
+    kappa_t: float or inf
+        isothermal compressibility of liquid and vapor phase (1/KPa), return inf at critical point.
+    alpha_v: float or inf
+        isobaric cubic expansion coefficient of liquid and vapor phase (1/K), return inf at critical point.
+    mu_jt: float
+        Joule-Thomson coefficient of liquid and vapor phase (K/KPa), finite limit at critical point.
+    k_s: float
+        isentropic exponent of liquid and vapor phase.
+    g: float
+        specific Gibbs free energy of liquid and vapor phase (KJ/Kg).
+    f: float
+        specific Helmholtz free energy of liquid and vapor phase (KJ/Kg).
+    mu: float
+        dynamic viscosity (Pa*s), without critical enhancement, finite at critical point.
 
     Limit
     -----
@@ -41,63 +185,26 @@ def saturationT(tsat):
     ----------
     tsat: float
        saturation temperature (K).
+    props: collection of str or str or None, optional
+        names of properties to return, only these properties (and derivatives they need) are evaluated, names are
+        not case sensitive and unknown names are ignored, default None for all available properties.
 
     Returns
     -------
     props: dict or None
-        return all available properties, see Available Properties,
+        return all available properties (or requested props), see Available Properties,
         if value of saturation temperature(tsat) exceed and/or is not in range of limit return None instead, see Limit.
     """
 
-    if (psat := Region4.getSaturPress(tsat=tsat)) is not None and 273.15 <= tsat <= 623.15:
-        vf = Region1.props(p=psat, t=tsat, desc="v")
-        vg = Region2.props(p=psat, t=tsat, desc="v")
-        rhof = 1/vf
-        rhog = 1/vg
-        props = {
-            "psat": psat,
-            "tsat": tsat,
-            "v": [vf, vg],
-            "u": [Region1.props(p=psat, t=tsat, desc="u"), Region2.props(p=psat, t=tsat, desc="u")],
-            "h": [Region1.props(p=psat, t=tsat, desc="h"), Region2.props(p=psat, t=tsat, desc="h")],
-            "s": [Region1.props(p=psat, t=tsat, desc="s"), Region2.props(p=psat, t=tsat, desc="s")],
-            "cv": [Region1.props(p=psat, t=tsat, desc="cv"), Region2.props(p=psat, t=tsat, desc="cv")],
-            "cp": [Region1.props(p=psat, t=tsat, desc="cp"), Region2.props(p=psat, t=tsat, desc="cp")],
-            "mu": [visc(rho=rhof, t=tsat), visc(rho=rhog, t=tsat)]
-        }
-        return props
-    elif (psat := Region4.getSaturPress(tsat=tsat)) is not None and 623.15 < tsat < TEMPC:
-        rhof, rhog = Region3.saturRho(psat, tsat)
-        props = {
-                "psat": psat,
-                "tsat": tsat,
-                "v": [1/rhof, 1/rhog],
-                "u": [Region3.props(rho=rhof, t=tsat, desc="u"), Region3.props(rho=rhog, t=tsat, desc="u")],
-                "h": [Region3.props(rho=rhof, t=tsat, desc="h"), Region3.props(rho=rhog, t=tsat, desc="h")],
-                "s": [Region3.props(rho=rhof, t=tsat, desc="s"), Region3.props(rho=rhog, t=tsat, desc="s")],
-                "cv": [Region3.props(rho=rhof, t=tsat, desc="cv"), Region3.props(rho=rhog, t=tsat, desc="cv")],
-                "cp": [Region3.props(rho=rhof, t=tsat, desc="cp"), Region3.props(rho=rhog, t=tsat, desc="cp")],
-                "mu": [visc(rho=rhof, t=tsat), visc(rho=rhog, t=tsat)]
-        }
-        return props
+    if 273.15 <= tsat < TEMPC:
+        return _pairs(Region4.getSaturPress(tsat=tsat), tsat, 623.15 < tsat, props)
     elif tsat == TEMPC:
-        props = {
-                "psat": PRESSC,
-                "tsat": tsat,
-                "v": [1/RHOC, 1/RHOC],
-                "u": [Region3.props(rho=RHOC, t=tsat, desc="u"), Region3.props(rho=RHOC, t=tsat, desc="u")],
-                "h": [Region3.props(rho=RHOC, t=tsat, desc="h"), Region3.props(rho=RHOC, t=tsat, desc="h")],
-                "s": [Region3.props(rho=RHOC, t=tsat, desc="s"), Region3.props(rho=RHOC, t=tsat, desc="s")],
-                "cv": [math.inf, math.inf],
-                "cp": [math.inf, math.inf],
-                "mu": [math.inf, math.inf]
-        }
-        return props
+        return _critical(*_select(props)[1:])
     else:
         return None
 
 
-def saturationP(psat):
+def saturationP(psat, props=None):
     """Calculate properties of ordinary/pure water at saturation phase using saturation pressure as input.
 
     Available Properties
@@ -115,13 +222,25 @@ def saturationP(psat):
     s: float
         specific entropy of liquid and vapor phase (KJ/Kg*K).
     cp: float or inf
-        specific isobaric heat capacity of liquid and vapor phase (KJ/Kg*K),
-        return inf when psat near critical temperature, because near critical temperature value of cp is not accurate.
-    cv: float or inf
-        specific isohoric heat capacity of liquid and vapor phase (KJ/Kg*K),
-        return inf when psat near critical temperature, because near critical temperature value of cv is not accurate.
-    mu: float or inf
-        dynamic viscosity (Pa*s), return inf when tsat near critical temperature, because near critical temperature value of mu is not accurate.
+        specific isobaric heat capacity of liquid and vapor phase (KJ/Kg*K), return inf at critical point.
+    cv: float
+        specific isohoric heat capacity of liquid and vapor phase (KJ/Kg*K), finite limit at critical point.
+    w: float
+        speed of sound of liquid and vapor phase (m/s).
+    kappa_t: float or inf
+        isothermal compressibility of liquid and vapor phase (1/KPa), return inf at critical point.
+    alpha_v: float or inf
+        isobaric cubic expansion coefficient of liquid and vapor phase (1/K), return inf at critical point.
+    mu_jt: float
+        Joule-Thomson coefficient of liquid and vapor phase (K/KPa), finite limit at critical point.
+    k_s: float
+        isentropic exponent of liquid and vapor phase.
+    g: float
+        specific Gibbs free energy of liquid and vapor phase (KJ/Kg).
+    f: float
+        specific Helmholtz free energy of liquid and vapor phase (KJ/Kg).
+    mu: float
+        dynamic viscosity (Pa*s), without critical enhancement, finite at critical point.
 
     Limit
     -----
@@ -132,62 +251,47 @@ def saturationP(psat):
     ----------
     psat: float
        saturation pressure (KPa).
+    props: collection of str or str or None, optional
+        names of properties to return, only these properties (and derivatives they need) are evaluated, names are
+        not case sensitive and unknown names are ignored, default None for all available properties.
 
     Returns
     -------
     props: dict or None
-        return all available properties, see Available Properties
+        return all available properties (or requested props), see Available Properties
         if value of saturation pressure(psat) exceed and/or is not in range of limit return None instead, see Limit.
     """
 
-    if (tsat := Region4.getSaturTemp(psat=psat)) is not None and Region4.getSaturPress(tsat=273.15) <= psat <= Region4.getSaturPress(tsat=623.15):
-        vf, vg = Region1.props(p=psat, t=tsat, desc="v"), Region2.props(p=psat, t=tsat, desc="v")
-        rhof, rhog = 1/vf, 1/vg
-        props = {
-                "psat": psat,
-                "tsat": tsat,
-                "v": [vf, vg],
-                "u": [Region1.props(p=psat, t=tsat, desc="u"), Region2.props(p=psat, t=tsat, desc="u")],
-                "h": [Region1.props(p=psat, t=tsat, desc="h"), Region2.props(p=psat, t=tsat, desc="h")],
-                "s": [Region1.props(p=psat, t=tsat, desc="s"), Region2.props(p=psat, t=tsat, desc="s")],
-                "cv": [Region1.props(p=psat, t=tsat, desc="cv"), Region2.props(p=psat, t=tsat, desc="cv")],
-                "cp": [Region1.props(p=psat, t=tsat, desc="cp"), Region2.props(p=psat, t=tsat, desc="cp")],
-                "mu": [visc(rho=rhof, t=tsat), visc(rho=rhog, t=tsat)]
-
-        }
-        return props
-    elif (tsat := Region4.getSaturTemp(psat=psat)) is not None and Region4.getSaturPress(tsat=623.15) < psat < PRESSC:
-        rhof, rhog = Region3.saturRho(psat, tsat)
-        props = {
-                "psat": psat,
-                "tsat": tsat,
-                "v": [1/rhof, 1/rhog],
-                "u": [Region3.props(rho=rhof, t=tsat, desc="u"), Region3.props(rho=rhog, t=tsat, desc="u")],
-                "h": [Region3.props(rho=rhof, t=tsat, desc="h"), Region3.props(rho=rhog, t=tsat, desc="h")],
-                "s": [Region3.props(rho=rhof, t=tsat, desc="s"), Region3.props(rho=rhog, t=tsat, desc="s")],
-                "cv": [Region3.props(rho=rhof, t=tsat, desc="cv"), Region3.props(rho=rhog, t=tsat, desc="cv")],
-                "cp": [Region3.props(rho=rhof, t=tsat, desc="cp"), Region3.props(rho=rhog, t=tsat, desc="cp")],
-                "mu": [visc(rho=rhof, t=tsat), visc(rho=rhog, t=tsat)]
-        }
-        return props
+    if PSAT273 <= psat < PRESSC:
+        return _pairs(psat, Region4.getSaturTemp(psat=psat), PSAT623 < psat, props)
     elif psat == PRESSC:
-        props = {
-                "psat": psat,
-                "tsat": TEMPC,
-                "v": [1/RHOC, 1/RHOC],
-                "u": [Region3.props(rho=RHOC, t=TEMPC, desc="u"), Region3.props(rho=RHOC, t=TEMPC, desc="u")],
-                "h": [Region3.props(rho=RHOC, t=TEMPC, desc="h"), Region3.props(rho=RHOC, t=TEMPC, desc="h")],
-                "s": [Region3.props(rho=RHOC, t=TEMPC, desc="s"), Region3.props(rho=RHOC, t=TEMPC, desc="s")],
-                "cv": [math.inf, math.inf],
-                "cp": [math.inf, math.inf],
-                "mu": [math.inf, math.inf]
-        }
-        return props
+        return _critical(*_select(props)[1:])
     else:
         return None
 
 
-def singlephase(p, t):
+def _region3(p, t, exact, keys, out, names):
+    """Properties of single phase in region 3, p and t in range of limit, see singlephase."""
+
+    if p == PRESSC and t == TEMPC:
+        rho = RHOC
+        ans = NearCritical.limits()
+    elif exact and NearCritical.inBand(p, t):
+        rho, _ = NearCritical.rho(p, t)
+        ans = Region3.props_all(rho, t, props=keys)
+    else:
+        #state is in range of limit of region 3, subregion is found without checking it again
+        rho = 1/Region3VPT.volPT(p, t, _classify(float(p), t))
+        if exact:
+            rho, _ = Region3.solveRho(p, t, rho)
+        ans = Region3.props_all(rho, t, props=keys)
+    props = {key: ans[key] for key in out}
+    if "mu" in names:
+        props["mu"] = visc(rho, t)
+    return props
+
+
+def singlephase(p, t, exact=False, props=None):
     """Calculate properties of ordinary/pure water at single phase using pressure and temperature as inputs.
 
     Available Properties
@@ -204,6 +308,20 @@ def singlephase(p, t):
         specific isobaric heat capacity (KJ/Kg*K).
     cv: float
         specific isochoric heat capacity (KJ/Kg*K).
+    w: float
+        speed of sound (m/s).
+    kappa_t: float
+        isothermal compressibility (1/KPa).
+    alpha_v: float
+        isobaric cubic expansion coefficient (1/K).
+    mu_jt: float
+        Joule-Thomson coefficient (K/KPa).
+    k_s: float
+        isentropic exponent.
+    g: float
+        specific Gibbs free energy (KJ/Kg).
+    f: float
+        specific Helmholtz free energy (KJ/Kg).
     mu: float or None
         dynamic viscosity (Pa*s), if value of temperature(t) exceed and/or not in range limit return None instead, see Limits.
 
@@ -223,107 +341,48 @@ def singlephase(p, t):
         pressure (KPa).
     t: float
         temperature (K).
+    exact: bool, optional
+        in region 3 polish density from backward equations by Newton iteration on basic equation, so that
+        properties are consistent with basic equation, see Region3VPT.singleRho, default False. Inside near-critical
+        band (NearCritical.inBand) density is solved with bounded number of evaluations, see NearCritical.rho.
+        At critical point properties are limits of basic equation, with cp, kappa_t and alpha_v inf, see
+        NearCritical.limits.
+    props: collection of str or str or None, optional
+        names of properties to return, only these properties (and derivatives they need) are evaluated, names are
+        not case sensitive and unknown names are ignored, default None for all available properties.
 
     Returns
     -------
     props: dict or None
-        return all available properties, see Available Properties,
+        return all available properties (or requested props), see Available Properties,
         if value of pressure(p) and temperature(t) exceed and/or are not in range of limits return None instead, see Limits.
     """
 
-    if 0 < p < Region4.getSaturPress(tsat=t) and 273.15 <= t <= 623.15:
-        v = Region2.props(p, t, desc="v")
-        rho = 1/v
-        props = {
-                "v": v,
-                "u": Region2.props(p, t, desc="u"),
-                "h": Region2.props(p, t, desc="h"),
-                "s": Region2.props(p, t, desc="s"),
-                "cv": Region2.props(p, t, desc="cv"),
-                "cp": Region2.props(p, t, desc="cp"),
-                "mu": visc(rho, t)
-        }
-        return props
-    elif Region4.getSaturPress(tsat=t) <= p <= 1e5 and 273.15 <= t <= 623.15:
-        v = Region1.props(p, t, desc="v")
-        rho = 1/v
-        props = {
-                "v": v,
-                "u": Region1.props(p, t, desc="u"),
-                "h": Region1.props(p, t, desc="h"),
-                "s": Region1.props(p, t, desc="s"),
-                "cv": Region1.props(p, t, desc="cv"),
-                "cp": Region1.props(p, t, desc="cp"),
-                "mu": visc(rho, t)
-        }
-        return props
-    elif (p23 := Boundary23.getPress(t)) is not None and 0 < p <= p23 and 623.15 < t <= 863.15:
-        v = Region2.props(p, t, desc="v")
-        rho = 1/v
-        props = {
-                "v": v,
-                "u": Region2.props(p, t, desc="u"),
-                "h": Region2.props(p, t, desc="h"),
-                "s": Region2.props(p, t, desc="s"),
-                "cv": Region2.props(p, t, desc="cv"),
-                "cp": Region2.props(p, t, desc="cp"),
-                "mu": visc(rho, t)
-        }
-        return props
-    elif (p23 := Boundary23.getPress(t)) is not None and (t23 := Boundary23.getTemp(p)) is not None and p23 < p <= 1e5 and 623.15 < t <= t23:
-        rho = Region3VPT.singleRho(p, t)
-        props = {
-                "v": 1/rho,
-                "u": Region3.props(rho, t, desc="u"),
-                "h": Region3.props(rho, t, desc="h"),
-                "s": Region3.props(rho, t, desc="s"),
-                "cv": Region3.props(rho, t, desc="cv"),
-                "cp": Region3.props(rho, t, desc="cp"),
-                "mu": visc(rho, t)
-        }
-        return props
-    elif 0 < p <= 1e5 and 863.15 < t <= 1073.15:
-        v = Region2.props(p, t, desc="v")
-        rho = 1/v
-        props = {
-                "v": v,
-                "u": Region2.props(p, t, desc="u"),
-                "h": Region2.props(p, t, desc="h"),
-                "s": Region2.props(p, t, desc="s"),
-                "cv": Region2.props(p, t, desc="cv"),
-                "cp": Region2.props(p, t, desc="cp"),
-                "mu": visc(rho, t)
-        }
-        return props
-    elif 0 < p <= 5e4 and 1073.15 < t <= 1173.15:
-        v = Region5.props(p, t, desc="v")
-        rho = 1/v
-        props = {
-                "v": v,
-                "u": Region5.props(p, t, desc="u"),
-                "h": Region5.props(p, t, desc="h"),
-                "s": Region5.props(p, t, desc="s"),
-                "cv": Region5.props(p, t, desc="cv"),
-                "cp": Region5.props(p, t, desc="cp"),
-                "mu": visc(rho, t)
-        }
-        return props
-    elif 0 < p <= 5e4 and 1173.15 < t <= 2273.15:
-        props = {
-                "v" : Region5.props(p, t, desc="v"),
-                "u" : Region5.props(p, t, desc="u"),
-                "h" : Region5.props(p, t, desc="h"),
-                "s" : Region5.props(p, t, desc="s"),
-                "cv": Region5.props(p, t, desc="cv"),
-                "cp": Region5.props(p, t, desc="cp"),
-                "mu": None
-        }
-        return props
+    keys, out, names = _select(props)
+    if not 0 < p <= 1e5:
+        return None
+    elif 273.15 <= t <= 623.15:
+        cls = Region2 if p < Region4.getSaturPress(tsat=t) else Region1
+    elif 623.15 < t <= 863.15:
+        if p <= Boundary23.getPress(t):
+            cls = Region2
+        else:
+            return _region3(p, t, exact, keys, out, names)
+    elif 863.15 < t <= 1073.15:
+        cls = Region2
+    elif 1073.15 < t <= 2273.15 and p <= 5e4:
+        cls = Region5
     else:
         return None
 
+    ans = cls.props_all(p, t, props=keys)
+    result = {key: ans[key] for key in out}
+    if "mu" in names:
+        result["mu"] = visc(1/ans["v"], t) if t <= 1173.15 else None
+    return result
+
 
-def if97(*, p=None, t=None, x=None):
+def if97(*, p=None, t=None, x=None, exact=False, props=None):
     """Calculate properties of ordinary/pure water at mixed or single phase.
 
     Available Properties
@@ -337,14 +396,29 @@ def if97(*, p=None, t=None, x=None):
     s: float
         specific entropy (KJ/Kg*K).
     cp: float or inf
-        specific isobaric heat capacity (KJ/Kg*K),
-        return inf when t near critical temperature, because near critical temperature value of cp is not accurate.
-    cv: float or inf
-        specific isohoric heat capacity (KJ/Kg*K),
-        return inf when t near critical temperature, because near critical temperature value of cv is not accurate.
+        specific isobaric heat capacity (KJ/Kg*K), return inf at critical point.
+    cv: float
+        specific isohoric heat capacity (KJ/Kg*K), finite limit at critical point.
+    w: float
+        speed of sound (m/s).
+    kappa_t: float or inf
+        isothermal compressibility (1/KPa).
+    alpha_v: float or inf
+        isobaric cubic expansion coefficient (1/K).
+    mu_jt: float
+        Joule-Thomson coefficient (K/KPa).
+    k_s: float
+        isentropic exponent.
+    g: float
+        specific Gibbs free energy (KJ/Kg).
+    f: float
+        specific Helmholtz free energy (KJ/Kg).
     mu: float or None
         dynamic viscosity (Pa*s), if value of temperature(t) exceed and/or not in range of limit return None instead, see Limits.
 
+    Properties of mixed phase are interpolated linearly by quality between liquid and vapor phase, cp, kappa_t and
+    alpha_v return inf at critical point, where they diverge, other properties and mu return their finite limits.
+
     Limits
     ------
     Mixed phase:
@@ -364,107 +438,34 @@ def if97(*, p=None, t=None, x=None):
         temperature (K).
     x: float or None
         quality of vapor.
+    exact: bool, optional
+        at single phase in region 3 solve basic equation for density instead of using backward equations only, see
+        singlephase, default False.
+    props: collection of str or str or None, optional
+        names of properties to return, only these properties (and derivatives they need) are evaluated, names are
+        not case sensitive and unknown names are ignored, default None for all available properties.
 
     Returns
     -------
     props: dict
-        return all available properties, see Available Properties.
+        return all available properties (or requested props), see Available Properties.
 
     Raises
     ------
     ValueError
-        if value of inputs exceed and/or are not in range of limits, see Limits.
+        if inputs are not p and t, or x with one of p and t, or if value of inputs exceed and/or are not in range of
+        limits, see Limits.
     """
 
-    props = dict()
-    if p is None and 273.15 <= t < TEMPC and 0. <= x <= 1. and (ans := saturationT(tsat=t)) is not None:
-        v = ans["v"]
-        u = ans["u"]
-        h = ans["h"]
-        s = ans["s"]
-        cp = ans["cp"]
-        cv = ans["cv"]
-        vmix = v[0]+x*(v[1]-v[0])
-        rho = 1/vmix
-        props["psat"] = ans["psat"]
-        props["tsat"] = ans["tsat"]
-        props["v"] = vmix
-        props["u"] = u[0]+x*(u[1]-u[0])
-        props["s"] = s[0]+x*(s[1]-s[0])
-        props["h"] = h[0]+x*(h[1]-h[0])
-        props["cp"] = cp[0]+x*(cp[1]-cp[0])
-        props["cv"] = cv[0]+x*(cv[1]-cv[0])
-        props["mu"] = visc(rho, t)
-        return props
-    elif p is None and t == TEMPC and 0. <= x <= 1. and (ans := saturationT(tsat=t)) is not None:
-        v = ans["v"]
-        u = ans["u"]
-        h = ans["h"]
-        s = ans["s"]
-        vmix = v[0]+x*(v[1]-v[0])
-        props["psat"] = ans["psat"]
-        props["tsat"] = ans["tsat"]
-        props["v"] = vmix
-        props["u"] = u[0]+x*(u[1]-u[0])
-        props["s"] = s[0]+x*(s[1]-s[0])
-        props["h"] = h[0]+x*(h[1]-h[0])
-        props["cp"] = math.inf
-        props["cv"] = math.inf
-        props["mu"] = math.inf
-        return props
-    elif t is None and 0.6112127 <= p < PRESSC and 0. <= x <= 1. and (ans := saturationP(psat=p)) is not None:
-        v = ans["v"]
-        u = ans["u"]
-        h = ans["h"]
-        s = ans["s"]
-        cp = ans["cp"]
-        cv = ans["cv"]
-        tsat = ans["tsat"]
-        vmix = v[0]+x*(v[1]-v[0])
-        rho = 1/vmix
-        props["psat"] = ans["psat"]
-        props["tsat"] = tsat
-        props["v"] = vmix
-        props["u"] = u[0]+x*(u[1]-u[0])
-        props["s"] = s[0]+x*(s[1]-s[0])
-        props["h"] = h[0]+x*(h[1]-h[0])
-        props["cp"] = cp[0]+x*(cp[1]-cp[0])
-        props["cv"] = cv[0]+x*(cv[1]-cv[0])
-        props["mu"] = visc(rho, tsat)
-        return props
-    elif t is None and p == PRESSC and 0. <= x <= 1. and (ans := saturationT(tsat=t)) is not None:
-        v = ans["v"]
-        u = ans["u"]
-        h = ans["h"]
-        s = ans["s"]
-        vmix = v[0]+x*(v[1]-v[0])
-        props["psat"] = ans["psat"]
-        props["tsat"] = ans["tsat"]
-        props["v"] = vmix
-        props["u"] = u[0]+x*(u[1]-u[0])
-        props["s"] = s[0]+x*(s[1]-s[0])
-        props["h"] = h[0]+x*(h[1]-h[0])
-        props["cp"] = math.inf
-        props["cv"] = math.inf
-        props["mu"] = math.inf
-        return props
-    elif x is None and 273.15 <= t <= 1073.15 and 0 < p <= 1e5 and (props := singlephase(p, t)) is not None:
-        return props
-    elif x is None and 1073.15 < t <= 2273.15 and 0 < p <= 5e4 and (props := singlephase(p, t)) is not None:
-        return props
-    elif ((p is not None) or (t is not None)) and x is not None and (x < 0 or x > 1):
-        raise ValueError("Quality(x) value exceed and/or is not in range of limits")
-    elif p is None and x is not None and (t < 273.15 or t > TEMPC):
-        raise ValueError("Value of saturation temperature(t) exceed and/or is not in range of limits")
-    elif t is None and x is not None and (p < 0.6112127 or p > PRESSC):
-        raise ValueError("Value of saturation pressure(p) exceed and/or is not in range limit")
-    elif (t < 273.15 or t > 1073.15) and 0 < p <= 1e5 and x is None:
-        raise ValueError("Value of temperature(t) exceed and/or is not in range of limits")
-    elif (t < 1073.15 or t > 2273.15) and 0 < p <= 5e4 and x is None:
-        raise ValueError("Value of temperature(t) exceed and/or is not in range of limits")
-    elif 273.15 <= t <= 1073.15 and (p <= 0 or p > 1e5) and x is None:
-        raise ValueError("Value of pressure(p) exceed and/or is not in range of limits")
-    elif 1073.15 < t <= 2273.15 and (p <= 0 or p > 5e4) and x is None:
-        raise ValueError("Value of pressure(p) exceed and/or is not in range of limits")
-    elif (t < 273.15 or t > 2273.15) or (p <= 0. or p > 1e5) and x is None:
-        raise ValueError("Value of pressure(p) or temperature(t) exceed and/or are not in range of limits")
\ No newline at end of file
+    if x is None and p is not None and t is not None:
+        if (ans := singlephase(p, t, exact=exact, props=props)) is not None:
+            return ans
+    elif x is not None and p is None and t is not None:
+        if 0. <= x <= 1. and 273.15 <= t <= TEMPC:
+            return _mixed(Region4.getSaturPress(tsat=t) if t < TEMPC else PRESSC, t, x, 623.15 < t, props)
+    elif x is not None and t is None and p is not None:
+        if 0. <= x <= 1. and PSAT273 <= p <= PRESSC:
+            return _mixed(p, Region4.getSaturTemp(psat=p) if p < PRESSC else TEMPC, x, PSAT623 < p, props)
+    else:
+        raise ValueError("Inputs must be pressure(p) and temperature(t), or quality(x) with pressure(p) or temperature(t)")
+    raise ValueError(MESSAGES[_reason(p, t, x)])
@@ -0,0 +1,69 @@
+import numpy as np
+from .cores.backwardPT import Region3VPT
+from .cores.basic import Region1, Region2, Region3, Region5
+from ._grid import _regionCodes
+
+
+#properties of region equations needed by partial derivatives
+_KEYS = ("v", "cp", "kappa_t", "alpha_v")
+
+
+def jacobian(p, t):
+    """Calculate analytic partial derivatives of enthalpy, density and entropy to pressure and temperature at single phase.
+
+    Every derivative is taken in closed form from second derivatives of basic equation of region of state, with
+    v specific volume, rho density, cp isobaric heat capacity, kappa_t isothermal compressibility and alpha_v
+    isobaric cubic expansion coefficient:
+
+        dh/dp = v*(1-t*alpha_v),    dh/dt = cp,
+        drho/dp = rho*kappa_t,      drho/dt = -rho*alpha_v,
+        ds/dp = -v*alpha_v,         ds/dt = cp/t.
+
+    Limits
+    ------
+    Same as singlephase, states out of range of limits are nan.
+
+    Parameters
+    ----------
+    p: float or array_like
+        pressure (KPa).
+    t: float or array_like
+        temperature (K), broadcast against pressure.
+
+    Returns
+    -------
+    jac: ndarray
+        Jacobian block of every state with shape (..., 3, 2), where ... is broadcast shape of p and t, rows are
+        h (KJ/Kg), rho (Kg/m^3) and s (KJ/Kg*K) and columns are derivatives to p (KPa) and t (K).
+    """
+
+    p, t = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(t, dtype=float))
+    shape = p.shape
+    p = p.ravel()
+    t = t.ravel()
+    codes = _regionCodes(p, t)
+
+    ans = {key: np.full(p.shape, np.nan) for key in _KEYS}
+    for region, cls in ((1, Region1), (2, Region2), (5, Region5)):
+        cells = codes == region
+        if cells.any():
+            sub = cls.props_all(p[cells], t[cells], props=_KEYS)
+            for key in _KEYS:
+                ans[key][cells] = sub[key]
+
+    cells = codes == 3
+    if cells.any():
+        rho = Region3VPT.singleRho(p[cells], t[cells])
+        sub = Region3.props_all(rho, t[cells], props=_KEYS)
+        for key in _KEYS:
+            ans[key][cells] = sub[key]
+
+    v, cp, kappa, alpha = (ans[key] for key in _KEYS)
+    jac = np.empty(p.shape+(3, 2))
+    jac[:, 0, 0] = v*(1-t*alpha)
+    jac[:, 0, 1] = cp
+    jac[:, 1, 0] = kappa/v
+    jac[:, 1, 1] = -1*alpha/v
+    jac[:, 2, 0] = -1*v*alpha
+    jac[:, 2, 1] = cp/t
+    return jac.reshape(shape+(3, 2))
@@ -0,0 +1,206 @@
+import numpy as np
+from .cores.backwardPT import Region3VPT
+from .cores.basic import Region1, Region2, Region3, Region4, Region5
+from .cores.critical import NearCritical
+from .constants import PRESSC, TEMPC
+from ._grid import _regionCodes
+from ._if97 import MESSAGES, _PROPS, _select
+from .visco import visc
+
+
+def _fill(props, cells, ans):
+    """Scatter properties ans of states cells into columns props."""
+
+    for key, column in props.items():
+        column[cells] = ans[key]
+
+
+def _singlephase(p, t, exact, keys, out, names):
+    """Properties of 1-D arrays of states at single phase, with region codes and states of region 3 which have no
+    density (exact did not converge), see if97_many."""
+
+    codes = _regionCodes(p, t)
+    props = {key: np.full(p.shape, np.nan) for key in keys}
+    failed = np.zeros(p.shape, dtype=bool)
+
+    for region, cls in ((1, Region1), (2, Region2), (5, Region5)):
+        cells = np.flatnonzero(codes == region)
+        if cells.size and keys:
+            _fill(props, cells, cls.props_all(p[cells], t[cells], props=keys))
+
+    cells = np.flatnonzero(codes == 3)
+    if cells.size:
+        rho = Region3VPT.singleRho(p[cells], t[cells], exact=exact)
+        failed[cells] = np.isnan(rho)
+        if keys:
+            _fill(props, cells, Region3.props_all(rho, t[cells], props=keys))
+
+    cells = np.flatnonzero((codes == 3) & (p == PRESSC) & (t == TEMPC))
+    if cells.size:
+        _fill(props, cells, NearCritical.limits())
+
+    ans = {key: props[key] for key in out}
+    if "mu" in names:
+        with np.errstate(invalid="ignore"):
+            ans["mu"] = np.where(t <= 1173.15, visc(1/props["v"], t), np.nan)
+    return ans, codes, failed
+
+
+def _singleStatus(p, t, codes, failed):
+    """Status codes of 1-D arrays of states at single phase, same reasons as ValueError of if97, see STATUS."""
+
+    inrange = (0 < p) & (p <= 1e5)
+    low = (273.15 <= t) & (t <= 1073.15)
+    high = (1073.15 < t) & (t <= 2273.15)
+    conditions = (
+        codes > 0,
+        ~(np.isfinite(p) & np.isfinite(t)),
+        inrange & ~low & ~(high & (p <= 5e4)),
+        (low | high) & ~(inrange & ~(high & (p > 5e4))),
+    )
+    status = np.select(conditions, (0, 1, 5, 6), 7)
+    #states in region 3 with density which did not converge (exact)
+    status[failed] = 8
+    return status
+
+
+def _saturation(psat, tsat, x, keys, out, names):
+    """Properties of 1-D arrays of states at mixed phase, psat and tsat in range of limit or nan, see if97_many."""
+
+    valid = ~np.isnan(psat) & ~np.isnan(tsat) & (0 <= x) & (x <= 1)
+    liq = {key: np.full(x.shape, np.nan) for key in keys}
+    vap = {key: np.full(x.shape, np.nan) for key in keys}
+
+    cells = np.flatnonzero(valid & (tsat <= 623.15))
+    if cells.size and keys:
+        _fill(liq, cells, Region1.props_all(psat[cells], tsat[cells], props=keys))
+        _fill(vap, cells, Region2.props_all(psat[cells], tsat[cells], props=keys))
+
+    cells = np.flatnonzero(valid & (623.15 < tsat))
+    if cells.size and keys:
+        rhof, rhog = Region3.saturRho(psat[cells], tsat[cells])
+        _fill(liq, cells, Region3.props_all(rhof, tsat[cells], props=keys))
+        _fill(vap, cells, Region3.props_all(rhog, tsat[cells], props=keys))
+
+    cells = np.flatnonzero(valid & (tsat == TEMPC))
+    if cells.size:
+        crit = NearCritical.limits()
+        _fill(liq, cells, crit)
+        _fill(vap, cells, crit)
+
+    #equal phases (inf at critical point) are not interpolated
+    with np.errstate(invalid="ignore"):
+        mix = {key: np.where(liq[key] == vap[key], liq[key], liq[key]+x*(vap[key]-liq[key])) for key in keys}
+        props = {key: mix[key] for key in out}
+        if "mu" in names:
+            props["mu"] = visc(1/mix["v"], tsat)
+    if "psat" in names:
+        props["psat"] = np.where(valid, psat, np.nan)
+    if "tsat" in names:
+        props["tsat"] = np.where(valid, tsat, np.nan)
+    return props
+
+
+def if97_many(*, p=None, t=None, x=None, exact=False, errors="nan", props=None):
+    """Calculate properties of ordinary/pure water at mixed or single phase for arrays of states.
+
+    Array version of if97, inputs are broadcast against each other and every state is classified once, then states
+    of each region are evaluated together by one vectorized call of region equations and properties are scattered
+    back into one array (column) for each property. Single phase takes p and t, mixed phase takes x with p or t.
+    Properties of mixed phase are interpolated linearly by quality between liquid and vapor phase, as if97.
+
+    States which have no properties are never evaluated one by one, reason of every state is given by integer
+    status code (index in STATUS) in returned "status", with the same reasons as ValueError of if97:
+
+        0 ok, 1 input (not finite number), 2 quality, 3 saturation temperature, 4 saturation pressure,
+        5 temperature, 6 pressure, 7 state (pressure and temperature), 8 convergence (density of region 3 with
+        exact True).
+
+    Available Properties
+    --------------------
+    Same as if97, psat and tsat for mixed phase only, see if97.
+    status: ndarray
+        status code of every state, 0 for valid states.
+
+    Limits
+    ------
+    Same as if97, mu is nan for t > 1173.15 K. With exact True states in region 3 are solved by
+    Region3.solveRho from backward equations, also inside near-critical band where if97 uses NearCritical.rho, both
+    converge to same density.
+
+    Parameters
+    ----------
+    p: array_like or None
+        pressure (KPa).
+    t: array_like or None
+        temperature (K).
+    x: array_like or None
+        quality of vapor.
+    exact: bool, optional
+        at single phase in region 3 solve basic equation for density instead of using backward equations only, see
+        if97, default False.
+    errors: str, optional
+        policy for states with nonzero status, default "nan":
+            "nan": properties of these states are nan.
+            "raise": raise one ValueError for the first of these states, with reason and number of them.
+            "mask": properties are numpy.ma.MaskedArray, masked at these states and where value is nan (mu).
+    props: collection of str or str or None, optional
+        names of properties to return, only these properties (and derivatives they need) are evaluated, see if97,
+        default None for all available properties. status is always returned.
+
+    Returns
+    -------
+    props: dict
+        all available properties (or requested props) as arrays with broadcast shape of inputs.
+
+    Raises
+    ------
+    ValueError
+        if inputs are not p and t, or x with one of p and t, if errors is not one of policies, or with errors
+        "raise" if any state has nonzero status.
+    """
+
+    if errors not in ("nan", "raise", "mask"):
+        raise ValueError(f"errors must be 'nan', 'raise' or 'mask', not {errors!r}")
+    keys, out, names = _select(props)
+    keys = _PROPS if keys is None else keys
+
+    if x is None and p is not None and t is not None:
+        p, t = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(t, dtype=float))
+        shape = p.shape
+        p = p.ravel()
+        t = t.ravel()
+        props, codes, failed = _singlephase(p, t, exact, keys, out, names)
+        status = _singleStatus(p, t, codes, failed)
+    elif x is not None and (p is None) != (t is None):
+        if t is None:
+            p, x = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(x, dtype=float))
+            psat = p.ravel()
+            inputs, reason = psat, 4
+            tsat, valid = Region4.getSaturTempArray(psat=psat)
+            #critical pressure is critical point, as saturationP
+            tsat = np.where(psat == PRESSC, TEMPC, tsat)
+            psat = np.where(valid, psat, np.nan)
+        else:
+            t, x = np.broadcast_arrays(np.asarray(t, dtype=float), np.asarray(x, dtype=float))
+            tsat = t.ravel()
+            psat, valid = Region4.getSaturPressArray(tsat=tsat)
+            inputs, reason = tsat, 3
+        shape = x.shape
+        x = x.ravel()
+        props = _saturation(psat, tsat, x, keys, out, names)
+        status = np.select((~(np.isfinite(inputs) & np.isfinite(x)), ~((0 <= x) & (x <= 1)), ~valid), (1, 2, reason), 0)
+    else:
+        raise ValueError("Inputs must be pressure(p) and temperature(t), or quality(x) with pressure(p) or temperature(t)")
+
+    if errors == "raise" and (bad := np.flatnonzero(status)).size:
+        index = np.unravel_index(bad[0], shape)
+        raise ValueError(f"{MESSAGES[status[bad[0]]]} at index {tuple(map(int, index))}, {bad.size} of {status.size} "
+                         f"states have no properties")
+
+    props = {key: val.reshape(shape) for key, val in props.items()}
+    status = status.reshape(shape)
+    if errors == "mask":
+        props = {key: np.ma.masked_array(val, mask=(status > 0) | np.isnan(val)) for key, val in props.items()}
+    props["status"] = status
+    return props
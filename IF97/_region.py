@@ -0,0 +1,303 @@
+import math
+from bisect import bisect_left, bisect_right
+from .cores.backwardPT import Region3VPT, SUBREGIONS, _AUXBANDS, _BANDS, _boundary
+from .cores.basic import PSAT273, Region4
+from .cores.boundary import Boundary23
+from .constants import PRESSC, TEMPC
+
+
+#temperatures (K) where regions change at constant temperature, every one is upper bound of buckets below it
+TLIMITS = (273.15, 623.15, 863.15, 1073.15, 2273.15)
+
+#buckets over pressure (KPa) are (0, PLOW] and PBUCKETS buckets spaced geometrically from PLOW to 100 MPa, buckets
+#over temperature (K) are TSTEP wide
+PBUCKETS = 256
+PLOW = 0.5
+TSTEP = 5.
+
+#margin (K) of boundary curves, covers difference between backward and forward equations of boundaries
+TMARGIN = 1e-3
+
+#code of bucket crossed by boundary, region and subregion of other buckets are packed as region*32+subregion
+_DIRTY = 255
+
+
+def _edges():
+    """Edges of buckets over pressure (KPa) and temperature (K).
+
+    Buckets are (lower, upper] in both pressure and temperature as limits of regions. Every one of TLIMITS is edge,
+    so states at these temperatures need no boundary.
+    """
+
+    pedges = (0.,)+tuple(PLOW*(1e5/PLOW)**(k/PBUCKETS) for k in range(PBUCKETS))+(1e5,)
+
+    tedges = [TLIMITS[0]]
+    for lo, hi in zip(TLIMITS, TLIMITS[1:]):
+        n = round((hi-lo)/TSTEP)
+        tedges.extend(lo+TSTEP*k for k in range(1, n))
+        tedges.append(hi)
+    return pedges, tuple(tedges)
+
+
+PEDGES, TEDGES = _edges()
+_NCOLS = len(TEDGES)-1
+
+#buckets per unit of log(p/PLOW), see RegionIndex.lookup
+_PSCALE = PBUCKETS/math.log(1e5/PLOW)
+
+
+def _curves():
+    """Boundary curves t(p) as (name, lower, upper) pressure range, "23" is boundary between region 2 and 3.
+
+    Every curve increases monotonically with pressure over its range, so its temperatures over a bucket lie between
+    values at ends of pressure range of bucket.
+    """
+
+    curves = [("sat", PSAT273, PRESSC), ("23", 16.5291643e3, 1e5)]
+    for lo, hi, splits, _ in _BANDS+_AUXBANDS:
+        curves.extend((name, lo, hi) for name, _, _ in splits)
+    return curves
+
+
+def _lines():
+    """Constant pressures (KPa) where regions or bands of region 3 change, as (pressure, lower, upper) range of
+    temperature (K)."""
+
+    lines = [(5e4, 1073.15, 2273.15)]
+    for lo, hi, _, _ in _BANDS+_AUXBANDS:
+        lines.extend(((lo, 623.15, 863.15), (hi, 623.15, 863.15)))
+    return lines
+
+
+def _curveTemp(p, name):
+    """Temperature (K) of boundary curve name at pressure p."""
+
+    if name == "23":
+        return Boundary23.getTemp(p)
+    return _boundary(p, name)
+
+
+def _exact(p, t):
+    """Region and subregion of scalar state from boundary equations, see region_of."""
+
+    if not (273.15 <= t <= 2273.15 and 0 < p <= 1e5):
+        return None, None
+
+    if t < TEMPC:
+        psat = Region4.getSaturPress(tsat=t)
+        if p == psat:
+            return 4, None
+        if t <= 623.15:
+            return (2, None) if p < psat else (1, None)
+    if t <= 863.15:
+        if p <= Boundary23.getPress(t):
+            return 2, None
+        return 3, Region3VPT.subregion(p, t)
+    if t <= 1073.15:
+        return 2, None
+    if p <= 5e4:
+        return 5, None
+    return None, None
+
+
+def _exactArray(p, t):
+    """Array version of _exact, codes of subregions instead of keys and 0 for None."""
+
+    import numpy as np
+
+    psat = Region4.getSaturPressArray(tsat=t)[0]
+    p23 = Boundary23.getPressArray(t)[0]
+
+    regions = np.zeros(p.shape, dtype=int)
+    low = (273.15 <= t) & (t <= 623.15)
+    mid = (623.15 < t) & (t <= 863.15)
+    valid = (0 < p) & (p <= 1e5)
+
+    regions[valid & low & (p < psat)] = 2
+    regions[valid & low & (psat <= p)] = 1
+    regions[valid & mid & (p <= p23)] = 2
+    regions[valid & mid & (p23 < p)] = 3
+    regions[valid & (863.15 < t) & (t <= 1073.15)] = 2
+    regions[valid & (1073.15 < t) & (t <= 2273.15) & (p <= 5e4)] = 5
+    regions[valid & (273.15 <= t) & (t < TEMPC) & (p == psat)] = 4
+
+    codes = np.zeros(p.shape, dtype=int)
+    cells = np.flatnonzero(regions == 3)
+    if cells.size:
+        codes[cells] = Region3VPT.subregion(p[cells], t[cells])
+    return regions, codes
+
+
+class RegionIndex:
+    """Precomputed index of buckets over (p, t) plane for classification of states into regions.
+
+    Plane of limits of IF97 is divided into buckets by PEDGES and TEDGES. Every bucket which is not touched by any
+    boundary (saturation line, boundary between region 2 and 3, boundaries of subregions of region 3 and constant
+    pressures where they change) holds region and subregion of all its states, so state away from boundaries is
+    classified by one lookup, and only states in buckets crossed by boundary evaluate boundary equations.
+
+    classmethods
+    ------------
+    table(cls)
+        Packed codes of buckets, built on first call.
+    lookup(cls, p, t)
+        Region and subregion of scalar state.
+    lookupArray(cls, p, t)
+        Region and codes of subregions of arrays of states.
+    """
+
+    #packed codes of buckets row by row over pressure, see table
+    _table = None
+
+    @classmethod
+    def table(cls):
+        """Packed codes of buckets, row by row over pressure, built on first call in about 10 ms.
+
+        Bucket touched by boundary curve (with margin TMARGIN) or by constant pressure where regions or bands of
+        region 3 change is _DIRTY, other buckets between two such buckets or limit of temperature TLIMITS in the
+        same row share one region and subregion, which is classified once at center of the first bucket.
+
+        Returns
+        -------
+        table: bytearray
+            code of bucket [i, j] at i*(len(TEDGES)-1)+j, region*32+subregion code or _DIRTY.
+        """
+
+        if cls._table is not None:
+            return cls._table
+
+        curves = _curves()
+        lines = _lines()
+        ncols = _NCOLS
+        table = bytearray(ncols*(len(PEDGES)-1))
+        for i, (p0, p1) in enumerate(zip(PEDGES, PEDGES[1:])):
+            row = table[i*ncols:(i+1)*ncols]
+            spans = [(_curveTemp(max(lo, p0), name)-TMARGIN, _curveTemp(min(hi, p1), name)+TMARGIN)
+                     for name, lo, hi in curves if max(lo, p0) <= min(hi, p1)]
+            spans.extend((tlo, thi) for p, tlo, thi in lines if p0 <= p <= p1)
+            for tlo, thi in spans:
+                first = max(bisect_left(TEDGES, tlo)-1, 0)
+                last = min(bisect_right(TEDGES, thi)-1, ncols-1)
+                row[first:last+1] = bytes([_DIRTY])*max(last-first+1, 0)
+
+            code = None
+            for j in range(ncols):
+                if row[j] == _DIRTY:
+                    code = None
+                    continue
+                if code is None:
+                    region, desc = _exact(0.5*(p0+p1), 0.5*(TEDGES[j]+TEDGES[j+1]))
+                    code = 0 if region is None else 32*region+(SUBREGIONS.index(desc)+1 if desc else 0)
+                row[j] = code
+                if TEDGES[j+1] in TLIMITS:
+                    code = None
+            table[i*ncols:(i+1)*ncols] = row
+
+        cls._table = table
+        return table
+
+    @classmethod
+    def lookup(cls, p, t):
+        """Region and subregion of scalar state, see region_of.
+
+        Index is used only above boundary between region 2 and 3 (623.15 K < t <= 863.15 K), where it replaces
+        evaluation of subregion of region 3. Elsewhere _exact needs only saturation pressure or comparisons, which
+        are cheaper than lookup.
+        """
+
+        if not (623.15 < t <= 863.15 and 0 < p <= 1e5):
+            return _exact(p, t)
+        if p <= Boundary23.getPress(t):
+            return 2, None
+
+        #index of bucket from spacing of edges, corrected by one step as lookupArray
+        i = int(math.log(p/PLOW)*_PSCALE)+1 if p > PLOW else 0
+        if i > 0 and p <= PEDGES[i]:
+            i -= 1
+        elif p > PEDGES[i+1]:
+            i += 1
+        j = int((t-273.15)/TSTEP)
+        if j > 0 and t <= TEDGES[j]:
+            j -= 1
+        elif t > TEDGES[j+1]:
+            j += 1
+
+        code = (cls._table or cls.table())[i*_NCOLS+j]
+        if code != _DIRTY:
+            return code >> 5, SUBREGIONS[(code & 31)-1]
+        if t < TEMPC and p == Region4.getSaturPress(tsat=t):
+            return 4, None
+        return 3, Region3VPT.subregion(p, t)
+
+    @classmethod
+    def lookupArray(cls, p, t):
+        """Region and codes of subregions of arrays of states, see region_of."""
+
+        import numpy as np
+
+        p, t = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(t, dtype=float))
+        shape = p.shape
+        p = p.ravel()
+        t = t.ravel()
+
+        table = np.frombuffer(cls.table(), dtype=np.uint8).reshape(len(PEDGES)-1, _NCOLS)
+        pedges = np.array(PEDGES)
+        tedges = np.array(TEDGES)
+
+        #index of bucket from spacing of edges, rounding moves state at most one bucket and is corrected by edges
+        with np.errstate(invalid="ignore", divide="ignore"):
+            i = np.log(p/PLOW)*(PBUCKETS/math.log(1e5/PLOW))+1
+            j = (t-TLIMITS[0])/TSTEP
+        i = np.clip(np.nan_to_num(i, nan=0.), 0, table.shape[0]-1).astype(int)
+        j = np.clip(np.nan_to_num(j, nan=0.), 0, table.shape[1]-1).astype(int)
+        i -= (i > 0) & (p <= pedges[i])
+        i += (i < table.shape[0]-1) & (p > pedges[i+1])
+        j -= (j > 0) & (t <= tedges[j])
+        j += (j < table.shape[1]-1) & (t > tedges[j+1])
+        packed = table[i, j].astype(int)
+
+        #out of limits is 0, it is not in any bucket
+        valid = (273.15 <= t) & (t <= 2273.15) & (0 < p) & (p <= 1e5)
+        packed[~valid] = 0
+        regions = packed >> 5
+        codes = packed & 31
+
+        cells = np.flatnonzero(packed == _DIRTY)
+        if cells.size:
+            regions[cells], codes[cells] = _exactArray(p[cells], t[cells])
+        return regions.reshape(shape), codes.reshape(shape)
+
+
+def region_of(p, t):
+    """Find region of IF97 of state, with subregion in region 3, from precomputed index of buckets.
+
+    States away from boundaries of regions are classified by one lookup in index of buckets over (p, t) plane,
+    states near boundary (saturation line, boundary between region 2 and 3 and boundaries of subregions of region 3)
+    evaluate boundary equations, see RegionIndex. Regions are assigned as singlephase selects region equations,
+    except states exactly on saturation line p = psat(t) below critical temperature, which are region 4 (singlephase
+    evaluates them as liquid).
+
+    Limits
+    ------
+    Same as singlephase, states out of range of limits have no region.
+
+    Parameters
+    ----------
+    p: float or array_like
+        pressure (KPa).
+    t: float or array_like
+        temperature (K), broadcast against pressure.
+
+    Returns
+    -------
+    region: int or None or ndarray
+        region (1, 2, 3, 4 or 5) or None out of range of limits for scalars, array of regions with 0 out of range of
+        limits for arrays.
+    subregion: str or None or ndarray
+        key of subregion of region 3 ("3a" to "3z") or None for scalars, array of codes of subregions (index+1 of
+        key in SUBREGIONS, 0 out of region 3) for arrays, see Region3VPT.subregion.
+    """
+
+    if isinstance(p, (float, int)) and isinstance(t, (float, int)):
+        return RegionIndex.lookup(float(p), float(t))
+    return RegionIndex.lookupArray(p, t)
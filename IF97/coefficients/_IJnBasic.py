@@ -47,6 +47,15 @@ nReg4 = {
 }
 
 
+#auxiliary equations of saturated liquid (b, Ib) and vapor (c, Ic) density, IAPWS SR1-86(1992)
+nSatRho = {
+        "Ib": [1/3, 2/3, 5/3, 16/3, 43/3, 110/3],
+        "b": [1.99274064, 1.09965342, -0.510839303, -1.75493479, -45.5170352, -6.74694450e5],
+        "Ic": [2/6, 4/6, 8/6, 18/6, 37/6, 71/6],
+        "c": [-2.03150240, -2.68302940, -5.38626492, -17.2991605, -44.7586581, -63.9201063]
+}
+
+
 IJnReg5 = {
         "Jo": [0, 1, -3, -2, -1, 2],
         "no": [-0.13179983674201e2, 0.68540841634434e1, -0.24805148933466e-1, 0.36901534980333, -0.31161318213925e1, -0.32961626538917],
@@ -3,5 +3,19 @@
 
 from ._IJnBasic import *
 from ._IJnBound import *
-from ._IJnVPTReg3 import IJnVPTReg3
-from ._IJHVisc import *
\ No newline at end of file
+from ._IJHVisc import *
+from ._store import *
+
+
+def __getattr__(name):
+    """Load coefficients of backward equations v(p,T) of region 3 on first access, they are only used in region 3."""
+
+    if name == "IJnVPTReg3":
+        from ._IJnVPTReg3 import IJnVPTReg3 as value
+    elif name == "VPTREG3":
+        from ._store import VPTREG3 as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
\ No newline at end of file
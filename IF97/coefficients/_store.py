@@ -0,0 +1,312 @@
+"""This module compiles all coefficient tables into contiguous arrays and tuples once at import.
+
+Kernels read coefficients from these objects instead of looking up lists by string key on every call. Every table
+keeps tuples of plain floats for scalar loops and generated kernels, together with exponent ladders and coefficients
+pre-multiplied by their exponents for derivative sums. Contiguous float64/int64 arrays for array evaluation are built
+on first use, so that numpy is not imported by single-point calls. Tables of backward equations v(p,T) of region 3
+are compiled on first use of VPTREG3.
+"""
+
+from functools import cached_property
+from ._IJnBasic import IJnReg1, IJnReg2, IJnReg2Supp, IJnReg3, IJnReg5, nReg4, nSatRho
+from ._IJnBound import InBoundT3, nb23
+from ._IJHVisc import IJH
+
+
+__all__ = ["PolyTable", "IdealTable", "VPTTable", "BoundTable", "ViscTable", "REG1", "REG2", "REG2SUPP", "REG3", "REG5", "REG2IDEAL",
+           "REG2SUPPIDEAL", "REG5IDEAL", "N3LOG", "N4", "N23", "SATLIQ", "SATVAP", "BOUNDT3", "VISC"]
+
+
+class PolyTable:
+    """Compiled coefficients of sum(n*(x**I)*(y**J)).
+
+    Every power of x and y used by the sum and, if order is 2, by its first and second derivatives (exponents I, I-1,
+    I-2 and J, J-1, J-2) is collected once as exponent ladder, so that each power is computed only one time per
+    evaluation and reused by all sums.
+
+    Attributes
+    ----------
+    I, J: ndarray
+        exponents of x and y (int64).
+    n: ndarray
+        coefficients (float64).
+    order: int
+        highest order of derivatives, 0 or 2.
+    name: str
+        name of table, used to name generated kernels, see cores.codegen.
+    xexp, yexp: tuple
+        distinct exponents of x and y, ladders of powers.
+    xexparr, yexparr: ndarray
+        xexp and yexp as float64 arrays.
+    xidx, yidx: ndarray
+        index of x**(I-k) and y**(J-k) in ladders for k = 0 to order, arrays of shape (order+1, N).
+    coef: ndarray
+        n, n*I, n*I*(I-1), n*J, n*J*(J-1), n*I*J as array of shape (6, N), only n if order is 0.
+    rows: tuple
+        rows of coef as tuples of floats.
+    exponents: tuple
+        for every term (I, J) as ints.
+    terms: tuple
+        for every term (n, n*I, n*I*(I-1), n*J, n*J*(J-1), n*I*J, ix0, ix1, ix2, iy0, iy1, iy2) if order is 2,
+        or (n, ix0, iy0) if order is 0, used by scalar loops.
+    domain: tuple or None
+        ((xmin, xmax), (ymin, ymax)), range of magnitudes of x and y in region of equation, used by scaled.
+
+    Arrays are built on first access.
+    """
+
+    #order of derivative to x and y of each row of coef
+    SHIFTS = ((0, 0), (1, 0), (2, 0), (0, 1), (0, 2), (1, 1))
+
+    def __init__(self, I, J, n, order=2, name=None, domain=None):
+        self.name = name
+        self.domain = domain
+        self._scaled = dict()
+        self.order = order
+        self.exponents = tuple((int(Ii), int(Ji)) for Ii, Ji in zip(I, J))
+        n = [float(ni) for ni in n]
+
+        self.xexp = tuple(sorted({Ii-k for Ii, _ in self.exponents for k in range(order+1)}))
+        self.yexp = tuple(sorted({Ji-k for _, Ji in self.exponents for k in range(order+1)}))
+
+        xpos = {e: i for i, e in enumerate(self.xexp)}
+        ypos = {e: i for i, e in enumerate(self.yexp)}
+        self._xidx = tuple(tuple(xpos[Ii-k] for Ii, _ in self.exponents) for k in range(order+1))
+        self._yidx = tuple(tuple(ypos[Ji-k] for _, Ji in self.exponents) for k in range(order+1))
+
+        if order == 2:
+            self.rows = (tuple(n),
+                         tuple(ni*Ii for ni, (Ii, Ji) in zip(n, self.exponents)),
+                         tuple(ni*Ii*(Ii-1) for ni, (Ii, Ji) in zip(n, self.exponents)),
+                         tuple(ni*Ji for ni, (Ii, Ji) in zip(n, self.exponents)),
+                         tuple(ni*Ji*(Ji-1) for ni, (Ii, Ji) in zip(n, self.exponents)),
+                         tuple(ni*Ii*Ji for ni, (Ii, Ji) in zip(n, self.exponents)))
+        else:
+            self.rows = (tuple(n),)
+
+        self.terms = tuple(zip(*(self.rows+self._xidx+self._yidx)))
+
+    @cached_property
+    def I(self):
+        import numpy as np
+        return np.array([Ii for Ii, _ in self.exponents], dtype=np.int64)
+
+    @cached_property
+    def J(self):
+        import numpy as np
+        return np.array([Ji for _, Ji in self.exponents], dtype=np.int64)
+
+    @cached_property
+    def n(self):
+        import numpy as np
+        return np.array(self.rows[0], dtype=np.float64)
+
+    @cached_property
+    def coef(self):
+        import numpy as np
+        return np.array(self.rows, dtype=np.float64)
+
+    @cached_property
+    def xexparr(self):
+        import numpy as np
+        return np.array(self.xexp, dtype=np.float64)
+
+    @cached_property
+    def yexparr(self):
+        import numpy as np
+        return np.array(self.yexp, dtype=np.float64)
+
+    @cached_property
+    def xidx(self):
+        import numpy as np
+        return np.array(self._xidx, dtype=np.intp)
+
+    @cached_property
+    def yidx(self):
+        import numpy as np
+        return np.array(self._yidx, dtype=np.intp)
+
+    def _scales(self):
+        """Find scales sx and sy of x and y which keep both powers and scaled coefficients closest to one.
+
+        Logarithms of scales are searched on grid over domain, for every candidate the largest log of powers
+        (x/sx)**e and (y/sy)**e over domain and largest magnitude of log of scaled coefficients is minimized.
+        Underflow of powers only drops terms which are negligible at that state and is not penalized.
+        """
+
+        import numpy as np
+
+        (xa, xb), (ya, yb) = np.log(self.domain[0]), np.log(self.domain[1])
+        lsx = np.linspace(xa, xb, 41)[:, None]
+        lsy = np.linspace(ya, yb, 41)[None, :]
+
+        #powers can only overflow at upper bound for positive and at lower bound for negative exponents
+        worst = np.zeros((41, 41))
+        for e in (min(self.xexp), max(self.xexp)):
+            worst = np.maximum(worst, e*((xb if e > 0 else xa)-lsx))
+        for e in (min(self.yexp), max(self.yexp)):
+            worst = np.maximum(worst, e*((yb if e > 0 else ya)-lsy))
+        for row, (kx, ky) in zip(self.coef, self.SHIFTS):
+            for c, Ii, Ji in zip(row, self.I, self.J):
+                if c != 0.:
+                    worst = np.maximum(worst, np.abs(np.log(abs(c))+(Ii-kx)*lsx+(Ji-ky)*lsy))
+
+        i, j = np.unravel_index(np.argmin(worst), worst.shape)
+        return float(np.exp(lsx[i, 0])), float(np.exp(lsy[0, j]))
+
+    def scaled(self, dtype):
+        """Compiled coefficients for evaluation in reduced precision, with x and y rescaled into range of dtype.
+
+        Sum is evaluated in x/sx and y/sy, scales are folded into coefficients in float64 before cast to dtype,
+        n*(x**I)*(y**J) = (n*(sx**I)*(sy**J))*((x/sx)**I)*((y/sy)**J), and same for every derivative sum, so that
+        powers with large exponents (up to 58 in region 2) neither overflow nor lose precision in dtype.
+
+        Parameters
+        ----------
+        dtype: dtype
+            floating point type of evaluation, e.g. numpy.float32.
+
+        Returns
+        -------
+        sx, sy: float
+            scales of x and y.
+        coef: ndarray
+            scaled coefficients as array of dtype, same shape as coef.
+        """
+
+        import numpy as np
+
+        dtype = np.dtype(dtype)
+        if dtype not in self._scaled:
+            sx, sy = (1., 1.) if self.domain is None else self._scales()
+
+            coef = np.empty_like(self.coef)
+            for k, (kx, ky) in enumerate(self.SHIFTS[:len(self.coef)]):
+                coef[k] = self.coef[k]*(sx**(self.I-kx).astype(np.float64))*(sy**(self.J-ky).astype(np.float64))
+            self._scaled[dtype] = (sx, sy, coef.astype(dtype))
+        return self._scaled[dtype]
+
+
+class IdealTable:
+    """Compiled coefficients of ideal part sum(no*(tau**Jo)) of basic equations.
+
+    Attributes
+    ----------
+    terms: tuple
+        for every term (Jo, no, no*Jo, no*Jo*(Jo-1)), used by scalar loops.
+    Jo, no: tuple
+        exponents and coefficients.
+    """
+
+    def __init__(self, Jo, no):
+        self.Jo = tuple(Jo)
+        self.no = tuple(no)
+        self.terms = tuple((Jio, nio, nio*Jio, nio*Jio*(Jio-1)) for Jio, nio in zip(Jo, no))
+
+
+class VPTTable:
+    """Compiled coefficients of backward equation v(p,T) of one subregion 3.
+
+    omega = sum(n*(x**I)*(y**J)) with x = (p/press0-a)**c and y = (t/temp0-b)**d, v = vol0*omega**e,
+    or v = vol0*exp(omega) with x = p/press0-a and y = t/temp0-b for subregion 3n.
+
+    Attributes
+    ----------
+    a, b, c, d, e, vol0, press0, temp0: float
+        constants of backward equation.
+    isexp: bool
+        True for exponential form of subregion 3n.
+    poly: PolyTable
+        coefficients and exponents of omega, without derivatives.
+    """
+
+    def __init__(self, key, koef):
+        self.isexp = key == "3n"
+        self.a = float(koef["a"])
+        self.b = float(koef["b"])
+        self.c = 1 if self.isexp else koef["c"]
+        self.d = 1 if self.isexp else koef["d"]
+        self.e = koef["e"]
+        self.vol0 = float(koef["vol0"])
+        self.press0 = float(koef["press0"])
+        self.temp0 = float(koef["temp0"])
+        self.poly = PolyTable(koef["I"], koef["J"], koef["n"], order=0, name="vpt"+key)
+
+
+class BoundTable:
+    """Compiled coefficients of boundary equation t = sum(n*(x**I)) between subregions 3.
+
+    Attributes
+    ----------
+    islog: bool
+        True if x = ln(p/1e3), else x = p/1e3.
+    n, I: tuple
+        coefficients and exponents.
+    terms: tuple
+        for every term (n, I), used by scalar loops.
+    """
+
+    def __init__(self, koef, islog):
+        self.islog = islog
+        self.n = tuple(koef["n"])
+        self.I = tuple(koef["I"])
+        self.terms = tuple(zip(koef["n"], koef["I"]))
+
+
+class ViscTable:
+    """Compiled coefficients of viscosity equation.
+
+    Attributes
+    ----------
+    Hi: tuple
+        coefficients of ideal-gas part, term i is Hi[i]/tau**i.
+    terms: tuple
+        for every term (Hij, I, J) of residual part.
+    maxI, maxJ: int
+        highest exponents of (1/tau-1) and (delta-1).
+    """
+
+    def __init__(self, koef):
+        self.Hi = tuple(koef["Hi"])
+        self.terms = tuple(zip(koef["Hij"], koef["I"], koef["J"]))
+        self.maxI = max(koef["I"])
+        self.maxJ = max(koef["J"])
+
+
+#basic equations, first term of region 3 is logarithmic term and excluded from the sum, domains are magnitudes of
+#x = 7.1-pi, y = tau-1.222 (region 1), x = pi, y = tau-0.5 (region 2), x = delta, y = tau (region 3 and 5)
+REG1 = PolyTable(IJnReg1["I"], IJnReg1["J"], IJnReg1["n"], name="reg1", domain=((1.05, 7.1), (1.0, 3.86)))
+REG2 = PolyTable(IJnReg2["I"], IJnReg2["J"], IJnReg2["n"], name="reg2", domain=((6e-4, 100.), (3e-3, 1.48)))
+REG2SUPP = PolyTable(IJnReg2Supp["I"], IJnReg2Supp["J"], IJnReg2Supp["n"], name="reg2supp", domain=((6e-4, 10.), (3e-3, 1.48)))
+REG3 = PolyTable(IJnReg3["I"][1:], IJnReg3["J"][1:], IJnReg3["n"][1:], name="reg3", domain=((0.3, 3.6), (0.75, 1.04)))
+REG5 = PolyTable(IJnReg5["I"], IJnReg5["J"], IJnReg5["n"], name="reg5", domain=((1e-3, 50.), (0.44, 0.94)))
+N3LOG = IJnReg3["n"][0]
+
+REG2IDEAL = IdealTable(IJnReg2["Jo"], IJnReg2["no"])
+REG2SUPPIDEAL = IdealTable(IJnReg2Supp["Jo"], IJnReg2Supp["no"])
+REG5IDEAL = IdealTable(IJnReg5["Jo"], IJnReg5["no"])
+
+#saturation line and boundary between region 2 and 3
+N4 = tuple(nReg4["n"])
+N23 = tuple(nb23)
+
+#auxiliary equations of saturated density, terms (n, exponent)
+SATLIQ = tuple(zip(nSatRho["b"], nSatRho["Ib"]))
+SATVAP = tuple(zip(nSatRho["c"], nSatRho["Ic"]))
+
+#boundary equations of subregions 3
+BOUNDT3 = {key: BoundTable(koef, key in ("3ab", "3op", "3wx")) for key, koef in InBoundT3.items()}
+
+#viscosity
+VISC = ViscTable(IJH)
+
+
+def __getattr__(name):
+    """Compile VPTREG3, backward equations v(p,T) of subregions 3, on first access."""
+
+    if name == "VPTREG3":
+        from ._IJnVPTReg3 import IJnVPTReg3
+
+        globals()["VPTREG3"] = {key: VPTTable(key, koef) for key, koef in IJnVPTReg3.items()}
+        return globals()["VPTREG3"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
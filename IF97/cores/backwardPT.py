@@ -1,96 +1,190 @@
 """This module contains backward equations that using pressure and temperature as inputs"""
 
-from numpy import exp
-from .basic import Region4
+from bisect import bisect_left
+from .basic import PSAT623, Region3, Region4
 from .boundary import Boundary23, temp3
-from ..coefficients import IJnVPTReg3
+from . import kernel
+from .mathfn import exp
+from .. import coefficients
+
+
+#subregions of region 3, code of subregion is its index+1, code 0 is state out of region 3
+SUBREGIONS = ("3a", "3b", "3c", "3d", "3e", "3f", "3g", "3h", "3i", "3j", "3k", "3l", "3m", "3n", "3o", "3p", "3q", "3r",
+              "3s", "3t", "3u", "3v", "3w", "3x", "3y", "3z")
+
+#constant pressure thresholds (KPa) of subregions, with PSAT623
+PSAT643 = Region4.getSaturPress(tsat=643.15)
+P3CD = 19.00881189173929e3
+
+#decision tree of subregions, pressure bands (lower bound, upper bound] with temperature splits ordered by rising
+#temperature, state belongs to key of first split with t <= boundary (t < boundary if strict), else to last key.
+#Boundary is key of temp3 or "sat" for saturation temperature, key "aux" continues in _AUXBANDS.
+_BANDS = (
+    (PSAT623, P3CD, (("sat", "3c", False),), "3t"),
+    (P3CD, 20.5e3, (("3cd", "3c", False), ("sat", "3s", False)), "3t"),
+    (20.5e3, PSAT643, (("3cd", "3c", False), ("sat", "3s", False), ("3jk", "3r", False)), "3k"),
+    (PSAT643, 22.5e3, (("3cd", "3c", False), ("3qu", "3q", False), ("3rx", "aux", False), ("3jk", "3r", False)), "3k"),
+    (22.5e3, 23e3, (("3cd", "3c", False), ("3gh", "3l", False), ("3mn", "3m", False), ("3ef", "3n", False), ("3op", "3o", False),
+                    ("3ij", "3p", False), ("3jk", "3j", False)), "3k"),
+    (23e3, 23.5e3, (("3cd", "3c", False), ("3gh", "3l", False), ("3ef", "3h", False), ("3ij", "3i", False), ("3jk", "3j", False)), "3k"),
+    (23.5e3, 25e3, (("3cd", "3c", False), ("3gh", "3g", False), ("3ef", "3h", False), ("3ij", "3i", False), ("3jk", "3j", False)), "3k"),
+    (25e3, 4e4, (("3cd", "3c", False), ("3ab", "3d", False), ("3ef", "3e", False)), "3f"),
+    (4e4, 1e5, (("3ab", "3a", False),), "3b"),
+)
+
+#auxiliary subregions near critical point, psat(643.15 K) < p <= 22.5 MPa and T3qu < t <= T3rx, saturated vapor
+#belongs to subregions 3z and 3x
+_AUXBANDS = (
+    (PSAT643, 21.90096265e3, (("sat", "3u", True),), "3x"),
+    (21.90096265e3, 21.93161551e3, (("sat", "3u", True), ("3wx", "3z", False)), "3x"),
+    (21.93161551e3, 22.064e3, (("3uv", "3u", False), ("sat", "3y", True), ("3wx", "3z", False)), "3x"),
+    (22.064e3, 22.11e3, (("3uv", "3u", False), ("3ef", "3y", False), ("3wx", "3z", False)), "3x"),
+    (22.11e3, 22.5e3, (("3uv", "3u", False), ("3ef", "3v", False), ("3wx", "3w", False)), "3x"),
+)
+
+#upper bounds of pressure bands, for binary search
+_UPPER = tuple(band[1] for band in _BANDS)
+_AUXUPPER = tuple(band[1] for band in _AUXBANDS)
+
+
+def _boundary(p, name):
+    """Temperature (K) of boundary name at pressure p, float or ndarray."""
+
+    if name == "sat":
+        if isinstance(p, (float, int)):
+            return Region4.getSaturTemp(psat=p)
+        return Region4.getSaturTempArray(psat=p)[0]
+    return temp3(p, name)
+
+
+def _band(p, bands):
+    """Temperature splits and last key of band of pressure p."""
+
+    upper = _UPPER if bands is _BANDS else _AUXUPPER
+    _, _, splits, last = bands[min(bisect_left(upper, p), len(bands)-1)]
+    return splits, last
+
+
+def _walk(p, t, splits, last):
+    """Key of subregion of scalar state in band, every boundary is evaluated at most once."""
+
+    for name, key, strict in splits:
+        tb = _boundary(p, name)
+        if t < tb or (t == tb and not strict):
+            return key
+    return last
+
+
+def _classify(p, t):
+    """Key of subregion of scalar state in range of limit of region 3, see Region3VPT.subregion."""
+
+    desc = _walk(p, t, *_band(p, _BANDS))
+    if desc == "aux":
+        desc = _walk(p, t, *_band(p, _AUXBANDS))
+    return desc
 
 
 class Region3VPT:
     """Backward equations for region 3.
 
-    staticmethods
-    -------------
-    volPT(p, t, desc="")
-        Backward equation for region 3.
-
     classmethods
     ------------
-    singleRho(cls, p, t)
-        Method for subregion 3a to 3t to get value of density at single phase.
+    volPT(cls, p, t, desc)
+        Backward equation for region 3, key of subregion for scalars or codes of subregions for arrays.
+    subregion(cls, p, t)
+        Find subregion of state by decision tree, key for scalars or codes for arrays.
+    singleRho(cls, p, t, exact=False)
+        Method for subregion 3a to 3z to get value of density at single phase, for scalars or arrays.
     auxEqs(cls, p, t)
         Auxillary equations for subregion 3u to 3z that near critical point.
     """
 
-    @staticmethod
-    def volPT(p, t, desc):
+    @classmethod
+    def volPT(cls, p, t, desc):
         """Method to get specific volume(v) using presssure(p) and temperature(t) as inputs.
 
+        Arrays take codes of subregions as returned by subregion instead of key, states are grouped by code and
+        every group is evaluated with one vectorized call of backward equation of its subregion, then volumes are
+        scattered back to positions of states.
+
         Parameters
         ----------
-        p: float
+        p: float or ndarray
             pressure (KPa).
-        t: float
+        t: float or ndarray
             temperature (K).
-        desc: str
+        desc: str or ndarray
             input key, one of: "3a", "3b", "3c", "3d", "3e", "3f", "3g", "3h", "3i", "3j", "3k", "3l",
-            "3m", "3n", "3o", "3p", "3q", "3r", "3s", "3t", "3u", "3v", "3w", "3x", "3y",  "3z".
+            "3m", "3n", "3o", "3p", "3q", "3r", "3s", "3t", "3u", "3v", "3w", "3x", "3y",  "3z",
+            or array of codes of subregions (index+1 of key in SUBREGIONS, 0 for no subregion) for arrays.
 
         Returns
         -------
-        v: float
-            specific volume (m^3/Kg).
+        v: float or ndarray
+            specific volume (m^3/Kg), nan for code 0 of arrays.
 
         For more details see References[2, 3].
         """
 
-        if desc and desc.lower() != "3n":
-            a = IJnVPTReg3[desc.lower()]["a"]
-            b = IJnVPTReg3[desc.lower()]["b"]
-            c = IJnVPTReg3[desc.lower()]["c"]
-            d = IJnVPTReg3[desc.lower()]["d"]
-            e = IJnVPTReg3[desc.lower()]["e"]
-            I = IJnVPTReg3[desc.lower()]["I"]
-            J = IJnVPTReg3[desc.lower()]["J"]
-            n = IJnVPTReg3[desc.lower()]["n"]
-            v0 = IJnVPTReg3[desc.lower()]["vol0"]
-            p0 = IJnVPTReg3[desc.lower()]["press0"]
-            t0 = IJnVPTReg3[desc.lower()]["temp0"]
-
-            pi = p/p0
-            theta = t/t0
-
-            omega = 0.
-            for Ii, Ji, ni, in zip(I, J, n):
-                omega += ni*(((pi-a)**c)**Ii)*(((theta-b)**d)**Ji)
-
-            v = v0*(omega**e)
-            return v
-        elif desc and desc.lower() == "3n":
-            a = IJnVPTReg3["3n"]["a"]
-            b = IJnVPTReg3["3n"]["b"]
-            I = IJnVPTReg3["3n"]["I"]
-            J = IJnVPTReg3["3n"]["J"]
-            n = IJnVPTReg3["3n"]["n"]
-            v0 = IJnVPTReg3["3n"]["vol0"]
-            p0 = IJnVPTReg3["3n"]["press0"]
-            t0 = IJnVPTReg3["3n"]["temp0"]
-
-            pi = p/p0
-            theta = t/t0
-
-            omega = 0.
-            for Ii, Ji, ni, in zip(I, J, n):
-                omega += ni*((pi-a)**Ii)*((theta-b)**Ji)
-
-            v = v0*exp(omega)
+        if not isinstance(desc, str):
+            return cls._volPTArray(p, t, desc)
+
+        if desc and desc.lower() in coefficients.VPTREG3:
+            koef = coefficients.VPTREG3[desc.lower()]
+
+            pi = p/koef.press0
+            theta = t/koef.temp0
+
+            if koef.isexp:
+                omega = kernel.polyval(pi-koef.a, theta-koef.b, koef.poly)
+                v = koef.vol0*exp(omega)
+            else:
+                omega = kernel.polyval((pi-koef.a)**koef.c, (theta-koef.b)**koef.d, koef.poly)
+                v = koef.vol0*(omega**koef.e)
             return v
         else:
             return None
 
+    @staticmethod
+    def _volPTArray(p, t, codes):
+        """Array version of volPT, takes codes of subregions."""
+
+        import numpy as np
+
+        p, t, codes = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(t, dtype=float), np.asarray(codes))
+        shape = p.shape
+        p = p.ravel()
+        t = t.ravel()
+        codes = codes.ravel()
+        v = np.full(p.size, np.nan)
+
+        #stable sort groups states by code, counts give start and stop of every group
+        order = np.argsort(codes, kind="stable")
+        stops = np.cumsum(np.bincount(codes, minlength=len(SUBREGIONS)+1))
+        for code in range(1, len(SUBREGIONS)+1):
+            idx = order[stops[code-1]:stops[code]]
+            if not idx.size:
+                continue
+
+            koef = coefficients.VPTREG3[SUBREGIONS[code-1]]
+            pi = p[idx]/koef.press0
+            theta = t[idx]/koef.temp0
+            if koef.isexp:
+                omega = kernel.polyval(pi-koef.a, theta-koef.b, koef.poly)
+                v[idx] = koef.vol0*np.exp(omega)
+            else:
+                omega = kernel.polyval((pi-koef.a)**koef.c, (theta-koef.b)**koef.d, koef.poly)
+                v[idx] = koef.vol0*(omega**koef.e)
+        return v.reshape(shape)
+
     @classmethod
-    def singleRho(cls, p, t):
-        """Method to get density at single phase for subregion 3a to 3t.
+    def subregion(cls, p, t):
+        """Find subregion of region 3 of state by precomputed decision tree.
+
+        Pressure selects one band of constant thresholds by binary search, then boundary temperatures of band are
+        evaluated in rising order until t is below one of them, so every boundary function (temp3 or saturation
+        temperature) is evaluated at most once per pressure. Arrays are classified band by band and split by split,
+        each boundary evaluated once over remaining states of band.
 
         Limit
         -----
@@ -100,127 +194,124 @@ class Region3VPT:
 
         Parameters
         ----------
-        p: float
+        p: float or ndarray
             pressure (KPa).
-        t: float
+        t: float or ndarray
+            temperature (K).
+
+        Returns
+        -------
+        desc: str or None or ndarray
+            key of subregion ("3a" to "3z") or None out of range of limit for scalars, or array of codes of subregions
+            for arrays, code is index+1 of key in SUBREGIONS and 0 out of range of limit.
+        """
+
+        if not (isinstance(p, (float, int)) and isinstance(t, (float, int))):
+            return cls._subregionArray(p, t)
+
+        if not (623.15 < t <= 863.15 and Boundary23.getPress(t) < p <= 1e5):
+            return None
+
+        return _classify(float(p), t)
+
+    @classmethod
+    def _subregionArray(cls, p, t):
+        """Array version of subregion, returns codes of subregions."""
+
+        import numpy as np
+
+        p, t = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(t, dtype=float))
+        shape = p.shape
+        p = p.ravel()
+        t = t.ravel()
+        codes = np.zeros(p.size, dtype=int)
+
+        p23 = Boundary23.getPressArray(t)[0]
+        valid = (623.15 < t) & (t <= 863.15) & (p23 < p) & (p <= 1e5)
+
+        def classify(cells, bands, upper):
+            aux = []
+            band = np.minimum(np.searchsorted(upper, p[cells], side="left"), len(bands)-1)
+            for k, (_, _, splits, last) in enumerate(bands):
+                rest = cells[band == k]
+                for name, key, strict in splits:
+                    if not rest.size:
+                        break
+                    tb = _boundary(p[rest], name)
+                    below = (t[rest] < tb) if strict else (t[rest] <= tb)
+                    if key == "aux":
+                        aux.append(rest[below])
+                    else:
+                        codes[rest[below]] = SUBREGIONS.index(key)+1
+                    rest = rest[~below]
+                codes[rest] = SUBREGIONS.index(last)+1
+            return aux
+
+        aux = classify(np.flatnonzero(valid), _BANDS, _UPPER)
+        if aux:
+            classify(np.concatenate(aux), _AUXBANDS, _AUXUPPER)
+        return codes.reshape(shape)
+
+    @classmethod
+    def singleRho(cls, p, t, exact=False):
+        """Method to get density at single phase for subregion 3a to 3z.
+
+        Arrays are classified by subregion and evaluated by volPT group by group, without loop over states.
+
+        Backward equations are not exactly consistent with basic equation of region 3, pressure from basic equation
+        at returned density differs from p by up to about 1e-4 relative. With exact True, density from backward
+        equations is used as initial guess of Newton iteration on basic equation (Region3.solveRho), which takes
+        two evaluations of basic equation to converge.
+
+        Limit
+        -----
+        Valid for:
+            623.15 K < t <= 863.15 K and p23 < p <= 100 MPa or 350 C < t <= 800 C and p23 < p <= 100000 KPa,
+            p23 represent boundary equation between region 2 and region 3.
+
+        Parameters
+        ----------
+        p: float or ndarray
+            pressure (KPa).
+        t: float or ndarray
             temperature (K).
+        exact: bool, optional
+            solve basic equation for density consistent with IF97 basic equation, default False.
 
         Returns
         -------
-        rho: float or None
-            return density (Kg/m^3) or None if pressure(p) and/or temperature(t) are not in or exceed range of limmit, see Limit.
+        rho: float or None or ndarray
+            return density (Kg/m^3) or None if pressure(p) and/or temperature(t) are not in or exceed range of limmit,
+            see Limit, nan instead of None for arrays.
 
         For more details see References[2, 3].
         """
 
-        vol = 0.
-        p3cd = 19.00881189173929e3
-
-        if 623.15 < t <= 863.15 and Boundary23.getPress(t) < p <= 1e5:
-
-            #subregion 3a and 3b
-            if 4e4 < p <= 1e5 and t <= temp3(p, "3ab"):
-                vol = cls.volPT(p, t, "3a")
-            elif 4e4 < p <= 1e5 and t > temp3(p, "3ab"):
-                vol = cls.volPT(p, t, "3b")
-
-            #subregion 3c, 3d, 3e, 3f
-            if 25e3 < p <= 4e4 and t <= temp3(p, "3cd"):
-                vol = cls.volPT(p, t, "3c")
-            elif 25e3 < p <= 4e4 and (temp3(p, "3cd") < t <= temp3(p, "3ab")):
-                vol = cls.volPT(p, t, "3d")
-            elif 25e3 < p <= 4e4 and (temp3(p, "3ab") < t <= temp3(p, "3ef")):
-                vol = cls.volPT(p, t, "3e")
-            elif 25e3 < p <= 4e4 and t > temp3(p, "3ef"):
-                vol = cls.volPT(p, t, "3f")
-
-            #subregion 3c, 3g, 3h, 3i, 3j, 3k
-            if 23.5e3 < p <= 25e3 and t <= temp3(p, "3cd"):
-                vol = cls.volPT(p, t, "3c")
-            elif 23.5e3 < p <= 25e3 and (temp3(p, "3cd") < t <= temp3(p, "3gh")):
-                vol = cls.volPT(p, t, "3g")
-            elif 23.5e3 < p <= 25e3 and (temp3(p, "3gh") < t <= temp3(p, "3ef")):
-                vol = cls.volPT(p, t, "3h")
-            elif 23.5e3 < p <= 25e3 and (temp3(p, "3ef") < t <= temp3(p, "3ij")):
-                vol = cls.volPT(p, t, "3i")
-            elif 23.5e3 < p <= 25e3 and (temp3(p, "3ij") < t <= temp3(p, "3jk")):
-                vol = cls.volPT(p, t, "3j")
-            elif 23.5e3 < p <= 25e3 and t > temp3(p, "3jk"):
-                vol = cls.volPT(p, t, "3k")
-
-            #subregion 3c, 3l, 3h, 3i, 3j, 3k
-            if 23e3 < p <= 23.5e3 and t <= temp3(p, "3cd"):
-                vol = cls.volPT(p, t, "3c")
-            elif 23e3 < p <= 23.5e3 and (temp3(p, "3cd") < t <= temp3(p, "3gh")):
-                vol = cls.volPT(p, t, "3l")
-            elif 23e3 < p <= 23.5e3 and (temp3(p, "3gh") < t <= temp3(p, "3ef")):
-                vol = cls.volPT(p, t, "3h")
-            elif 23e3 < p <= 23.5e3 and (temp3(p, "3ef") < t <= temp3(p, "3ij")):
-                vol = cls.volPT(p, t, "3i")
-            elif 23e3 < p <= 23.5e3 and (temp3(p, "3ij") < t <= temp3(p, "3jk")):
-                vol = cls.volPT(p, t, "3j")
-            elif 23e3 < p <= 23.5e3 and t > temp3(p, "3jk"):
-                vol = cls.volPT(p, t, "3k")
-
-            #subregion 3c, 3l, 3m, 3n, 3o, 3p, 3j, 3k
-            if 22.5e3 < p <= 23e3 and t <= temp3(p, "3cd"):
-                vol = cls.volPT(p, t, "3c")
-            elif 22.5e3 < p <= 23e3 and (temp3(p, "3cd") < t <= temp3(p, "3gh")):
-                vol = cls.volPT(p, t, "3l")
-            elif 22.5e3 < p <= 23e3 and (temp3(p, "3gh") < t <= temp3(p, "3mn")):
-                vol = cls.volPT(p, t, "3m")
-            elif 22.5e3 < p <= 23e3 and (temp3(p, "3mn") < t <= temp3(p, "3ef")):
-                vol = cls.volPT(p, t, "3n")
-            elif 22.5e3 < p <= 23e3 and (temp3(p, "3ef") < t <= temp3(p, "3op")):
-                vol = cls.volPT(p, t, "3o")
-            elif 22.5e3 < p <= 23e3 and (emp3(p, "3op") < t <= temp3(p, "3ij")):
-                vol = cls.volPT(p, t, "3p")
-            elif 22.5e3 < p <= 23e3 and (temp3(p, "3ij") < t <= temp3(p, "3jk")):
-                vol = cls.volPT(p, t, "3j")
-            elif 22.5e3 < p <= 23e3 and t > temp3(p, "3jk"):
-                vol = cls.volPT(p, t, "3k")
-
-            #subregion 3c, 3q, 3r, 3k
-            if Region4.getSaturPress(tsat=643.15) < p <= 22.5e3 and t <= temp3(p, "3cd"):
-                vol = cls.volPT(p, t, "3c")
-            elif Region4.getSaturPress(tsat=643.15) < p <= 22.5e3 and (temp3(p, "3cd") < t <= temp3(p, "3qu")):
-                vol = cls.volPT(p, t, "3q")
-            elif Region4.getSaturPress(tsat=643.15) < p <= 22.5e3 and (temp3(p, "3qu") < t <= temp3(p, "3rx")):
-                vol = cls.auxEqs(p, t)
-            elif Region4.getSaturPress(tsat=643.15) < p <= 22.5e3 and (temp3(p, "3rx") < t <= temp3(p, "3jk")):
-                vol = cls.volPT(p, t, "3r")
-            elif Region4.getSaturPress(tsat=643.15) < p <= 22.5e3 and t > temp3(p, "3jk"):
-                vol = cls.volPT(p, t, "3k")
-
-            #subregion 3c, 3r, 3s, 3k
-            if 20.5e3 < p <= Region4.getSaturPress(tsat=643.15) and t <= temp3(p, "3cd"):
-                vol = cls.volPT(p, t, "3c")
-            elif 20.5e3 < p <= Region4.getSaturPress(tsat=643.15) and (temp3(p, "3cd") < t <= Region4.getSaturTemp(psat=p)):
-                vol = cls.volPT(p, t, "3s")
-            elif 20.5e3 < p <= Region4.getSaturPress(tsat=643.15) and (Region4.getSaturTemp(psat=p) < t <= temp3(p, "3jk")):
-                vol = cls.volPT(p, t, "3r")
-            elif 20.5e3 < p <= Region4.getSaturPress(tsat=643.15) and t > temp3(p, "3jk"):
-                vol = cls.volPT(p, t, "3k")
-
-            #subregion 3c, 3s, 3t
-            if p3cd < p <= 20.5e3 and t <= temp3(p, "3cd"):
-                vol = cls.volPT(p, t, "3c")
-            elif p3cd < p <= 20.5e3 and (temp3(p, "3cd") < t <= Region4.getSaturTemp(psat=p)):
-                vol = cls.volPT(p, t, "3s")
-            elif p3cd < p <= 20.5e3 and t >= Region4.getSaturTemp(psat=p):
-                vol = cls.volPT(p, t, "3t")
-
-            #subregion 3c, 3t
-            if Region4.getSaturPress(tsat=623.15) < p <= p3cd and t <= Region4.getSaturTemp(psat=p):
-                vol = cls.volPT(p, t, "3c")
-            elif Region4.getSaturPress(tsat=623.15) < p <= p3cd and t >= Region4.getSaturTemp(psat=p):
-                vol = cls.volPT(p, t, "3t")
-
-            rho = 1/vol
+        if not (isinstance(p, (float, int)) and isinstance(t, (float, int))):
+            return cls._singleRhoArray(p, t, exact)
+
+        if (desc := cls.subregion(p, t)) is not None:
+            rho = 1/cls.volPT(p, t, desc)
+            if exact:
+                rho, _ = Region3.solveRho(p, t, rho)
             return rho
         else:
             return None
 
+    @classmethod
+    def _singleRhoArray(cls, p, t, exact):
+        """Array version of singleRho, nan out of range of limit."""
+
+        import numpy as np
+
+        p, t = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(t, dtype=float))
+        codes = cls._subregionArray(p, t)
+        rho = 1/cls._volPTArray(p, t, codes)
+        if exact:
+            cells = codes > 0
+            rho[cells], _ = Region3.solveRho(p[cells], t[cells], rho[cells])
+        return rho
+
     @classmethod
     def auxEqs(cls, p, t):
         """Auxillary equation for subregion 3u to 3z near critical point.
@@ -245,45 +336,7 @@ class Region3VPT:
         For more details see References[2, 3]
         """
 
-        vol = 0.
-        if (temp3(p, "3qu") < t <= temp3(p, "3rx")) and Region4.getSaturPress(tsat=643.15) < p <= 22.5e3:
-
-            #subcritical pressure region 3u, 3y
-            if t <= Region4.getSaturTemp(psat=p) and 21.93161551e3 < p <= 22.064e3 and (temp3(p, "3qu") < t <= temp3(p, "3uv")):
-                vol = cls.volPT(p, t, "3u")
-            elif (temp3(p, "3uv") < t <= Region4.getSaturTemp(psat=p)) and 21.93161551e3 < p <= 22.064e3:
-                vol = cls.volPT(p, t, "3y")
-            elif (temp3(p, "3qu") < t <= Region4.getSaturTemp(psat=p) ) and (Region4.getSaturPress(tsat=643.15) < p <= 21.93161551e3):
-                vol = cls.volPT(p, t, "3u")
-
-            #subcritical pressure region 3x, 3z
-            if (Region4.getSaturTemp(psat=p) <= t <= temp3(p, "3wx")) and 21.90096265e3 < p <= 22.064e3:
-                vol = cls.volPT(p, t, "3z")
-            elif t >= Region4.getSaturTemp(psat=p) and 21.90096265e3 < p <= 22.064e3 and (temp3(p, "3wx") < t <= temp3(p, "3rx")):
-                vol = cls.volPT(p, t, "3x")
-            elif (Region4.getSaturTemp(psat=p) <= t <= temp3(p, "3rx")) and Region4.getSaturPress(tsat=643.15) < p <= 21.90096265e3:
-                vol = cls.volPT(p, t, "3x")
-
-            #supercritical pressure region 3u, 3v, 3w, 3x
-            if 22.11e3 < p <= 22.5e3 and (temp3(p, "3qu") < t <= temp3(p, "3uv")):
-                vol = cls.volPT(p, t, "3u")
-            elif 22.11e3 < p <= 22.5e3 and (temp3(p, "3uv") < t <= temp3(p, "3ef")):
-                vol = cls.volPT(p, t, "3v")
-            elif 22.11e3 < p <= 22.5e3 and (temp3(p, "3ef") < t <= temp3(p, "3wx")):
-                vol = cls.volPT(p, t, "3w")
-            elif 22.11e3 < p <= 22.5e3 and (temp3(p, "3wx") < t <= temp3(p, "3rx")):
-                vol = cls.volPT(p, t, "3x")
-
-            # supercritical pressure region 3u, 3x, 3y, 3z
-            if 22.064e3 < p <= 22.11e3 and (temp3(p, "3qu") < t <= temp3(p, "3uv")):
-                vol = cls.volPT(p, t, "3u")
-            elif 22.064e3 < p <= 22.11e3 and (temp3(p, "3uv") < t <= temp3(p, "3ef")):
-                vol = cls.volPT(p, t, "3y")
-            elif 22.064e3 < p <= 22.11e3 and (temp3(p, "3ef") < t <= temp3(p, "3wx")):
-                vol = cls.volPT(p, t, "3z")
-            elif 22.064e3 < p <= 22.11e3 and (temp3(p, "3wx") < t <= temp3(p, "3rx")):
-                vol = cls.volPT(p, t, "3x")
-
-            return vol
+        if (temp3(p, "3qu") < t <= temp3(p, "3rx")) and PSAT643 < p <= 22.5e3:
+            return cls.volPT(p, t, _walk(p, t, *_band(p, _AUXBANDS)))
         else:
-            return None
\ No newline at end of file
+            return None
@@ -1,9 +1,145 @@
 """This module contains all basic and property equations for region 1 to region 5"""
 
-import numpy as np
-from scipy import optimize
+import math
 from ..coefficients import *
 from ..constants import *
+from . import kernel
+from .mathfn import exp, log, sqrt
+
+
+#indices of derivative sums (g, dgdpi, d2gdpi2, dgdtau, d2gdtau2, d2gdpidtau) of Gibbs equations needed by each property
+GIBBSNEEDS = {"v": (1,), "u": (1, 3), "s": (0, 3), "h": (3,), "cp": (4,), "cv": (1, 2, 4, 5), "w": (1, 2, 4, 5),
+              "kappa_t": (1, 2), "alpha_v": (1, 5), "mu_jt": (4, 5), "k_s": (1, 2, 4, 5), "g": (0,), "f": (0, 1)}
+
+#indices of derivative sums (f, dfddel, d2fddel2, dfdtau, d2fdtau2, d2fddeldtau) of Helmholtz equation needed by each property
+HELMNEEDS = {"p": (1,), "v": (), "u": (3,), "s": (0, 3), "h": (1, 3), "cv": (4,), "cp": (1, 2, 4, 5), "w": (1, 2, 4, 5),
+             "kappa_t": (1, 2), "alpha_v": (1, 2, 5), "mu_jt": (1, 2, 4, 5), "k_s": (1, 2, 4, 5), "f": (0,), "g": (0, 1)}
+
+
+#number of intervals of table of saturated densities of region 3, see Region3.saturRho
+SATNODES = 512
+
+#results of _needs by table and requested properties, single-point calls repeat the same few requests
+_needsCache = dict()
+
+
+def _needs(table, props):
+    """Find requested properties and indices of derivative sums they need.
+
+    Parameters
+    ----------
+    table: dict
+        indices of derivative sums needed by each property, GIBBSNEEDS or HELMNEEDS.
+    props: collection of str or str or None
+        requested properties, one name as str, None for all properties.
+
+    Returns
+    -------
+    props: frozenset
+        requested properties which are available.
+    need: frozenset
+        indices of derivative sums to evaluate.
+    """
+
+    if isinstance(props, str):
+        props = (props,)
+    key = (id(table), None if props is None else tuple(props))
+    if (ans := _needsCache.get(key)) is not None:
+        return ans
+
+    if props is None:
+        props = frozenset(table)
+    else:
+        props = frozenset(prop.lower() for prop in props if prop and prop.lower() in table)
+
+    need = frozenset(k for prop in props for k in table[prop])
+    if len(_needsCache) < 256:
+        _needsCache[key] = (props, need)
+    return props, need
+
+
+def _gibbsExtra(props, p, t, pi, tau, g, dgdpi, d2gdpi2, dgdtau, d2gdtau2, d2gdpidtau):
+    """Equations of extended properties from derivatives of dimensionless Gibbs free energy of region 1, 2 or 5.
+
+    Parameters
+    ----------
+    props: frozenset
+        requested properties, only w, kappa_t, alpha_v, mu_jt, k_s, g and f are evaluated.
+    p, t: float or ndarray
+        pressure (KPa) and temperature (K).
+    pi, tau: float or ndarray
+        reduced pressure and inverse reduced temperature of region.
+    g, dgdpi, d2gdpi2, dgdtau, d2gdtau2, d2gdpidtau: float or ndarray
+        dimensionless Gibbs free energy (ideal plus residual part) and its derivatives, None if not needed.
+
+    Returns
+    -------
+    _props: dict
+        requested extended properties, see Available Properties of props of region classes.
+    """
+
+    _props = dict()
+    if "w" in props or "k_s" in props:
+        den = ((dgdpi-tau*d2gdpidtau)**2)/((tau**2)*d2gdtau2)-d2gdpi2
+        if "w" in props:
+            _props["w"] = sqrt(1e3*BIGR*t*(dgdpi**2)/den)
+        if "k_s" in props:
+            _props["k_s"] = dgdpi/(pi*den)
+    if "kappa_t" in props:
+        _props["kappa_t"] = -1*pi*d2gdpi2/(dgdpi*p)
+    if "alpha_v" in props:
+        _props["alpha_v"] = (1-tau*d2gdpidtau/dgdpi)/t
+    if "mu_jt" in props:
+        _props["mu_jt"] = t*pi*d2gdpidtau/(p*tau*d2gdtau2)
+    if "g" in props:
+        _props["g"] = BIGR*t*g
+    if "f" in props:
+        _props["f"] = BIGR*t*(g-pi*dgdpi)
+
+    return _props
+
+
+def _helmExtra(props, rho, t, delta, tau, f, dfddel, d2fddel2, dfdtau, d2fdtau2, d2fddeldtau):
+    """Equations of extended properties from derivatives of dimensionless Helmholtz free energy of region 3.
+
+    Parameters
+    ----------
+    props: frozenset
+        requested properties, only w, kappa_t, alpha_v, mu_jt, k_s, f and g are evaluated.
+    rho, t: float or ndarray
+        density (Kg/m^3) and temperature (K).
+    delta, tau: float or ndarray
+        reduced density and inverse reduced temperature.
+    f, dfddel, d2fddel2, dfdtau, d2fdtau2, d2fddeldtau: float or ndarray
+        dimensionless Helmholtz free energy and its derivatives, None if not needed.
+
+    Returns
+    -------
+    _props: dict
+        requested extended properties, see Available Properties of props of Region3.
+    """
+
+    _props = dict()
+    if props & {"w", "k_s", "kappa_t", "alpha_v", "mu_jt"}:
+        den = 2*delta*dfddel+(delta**2)*d2fddel2
+    if props & {"w", "k_s", "mu_jt"}:
+        sub = ((delta*dfddel-delta*tau*d2fddeldtau)**2)/((tau**2)*d2fdtau2)
+        if "w" in props:
+            _props["w"] = sqrt(1e3*BIGR*t*(den-sub))
+        if "k_s" in props:
+            _props["k_s"] = (den-sub)/(delta*dfddel)
+        if "mu_jt" in props:
+            _props["mu_jt"] = (delta*dfddel+(delta**2)*d2fddel2+delta*tau*d2fddeldtau)/(rho*BIGR*(tau**2)*d2fdtau2*(den-sub))
+    if "kappa_t" in props:
+        _props["kappa_t"] = 1/(rho*BIGR*t*den)
+    if "alpha_v" in props:
+        _props["alpha_v"] = delta*(dfddel-tau*d2fddeldtau)/(t*den)
+    if "f" in props:
+        _props["f"] = BIGR*t*f
+    if "g" in props:
+        _props["g"] = BIGR*t*(f+delta*dfddel)
+
+    return _props
 
 
 #Region 1
@@ -19,10 +155,12 @@ class Region1:
     -------------
     props(cls, p, t, desc)
         Equations of property for region 1.
+    props_all(cls, p, t, props=None)
+        Equations of property for region 1, return all properties.
     """
 
     @staticmethod
-    def _gamma(pi, tau):
+    def _gamma(pi, tau, need=None):
         """Basic equations for region 1.
 
         Parameters
@@ -31,6 +169,8 @@ class Region1:
             pi = p/16.5e3.
         tau: float
             tau = 1386/t.
+        need: collection of int, optional
+            indices of returned derivatives to evaluate, other derivatives are None, default all.
 
         Returns
         -------
@@ -48,27 +188,12 @@ class Region1:
             partial derivative of g to pi and tau.
         """
 
-        #coefficients
-        _I = IJnReg1["I"]
-        _J = IJnReg1["J"]
-        _n = IJnReg1["n"]
-
-        g = 0.
-        dgdpi = 0.
-        d2gdpi2 = 0.
-        dgdtau = 0.
-        d2gdtau2 = 0.
-        d2gdpidtau = 0.
+        #sum is evaluated in x = 7.1-pi, so odd derivatives to pi change sign
+        g, dgdx, d2gdx2, dgdtau, d2gdtau2, d2gdxdtau = kernel.polysum(7.1-pi, tau-1.222, REG1, need=need)
 
-        for Ii, Ji, ni in zip(_I, _J, _n):
-            g += ni*((7.1-pi)**Ii)*((tau-1.222)**Ji)
-            dgdpi += -ni*Ii*((7.1-pi)**(Ii-1))*((tau-1.222)**Ji)
-            d2gdpi2 += ni*Ii*(Ii-1)*((7.1-pi)**(Ii-2))*((tau-1.222)**Ji)
-            dgdtau += ni*Ji*((7.1-pi)**Ii)*((tau-1.222)**(Ji-1))
-            d2gdtau2 += ni*Ji*(Ji-1)*((7.1-pi)**Ii)*((tau-1.222)**(Ji-2))
-            d2gdpidtau += -ni*Ii*Ji*((7.1-pi)**(Ii-1))*((tau-1.222)**(Ji-1))
-
-        return g, dgdpi, d2gdpi2, dgdtau, d2gdtau2, d2gdpidtau
+        dgdpi = None if dgdx is None else -dgdx
+        d2gdpidtau = None if d2gdxdtau is None else -d2gdxdtau
+        return g, dgdpi, d2gdx2, dgdtau, d2gdtau2, d2gdpidtau
 
     @classmethod
     def props(cls, p, t, desc):
@@ -88,6 +213,20 @@ class Region1:
             specific isobaric heat capacity (KJ/Kg*K).
         cv: float
             specific isochoric heat capacity (KJ/Kg*K).
+        w: float
+            speed of sound (m/s).
+        kappa_t: float
+            isothermal compressibility (1/KPa).
+        alpha_v: float
+            isobaric cubic expansion coefficient (1/K).
+        mu_jt: float
+            Joule-Thomson coefficient (K/KPa).
+        k_s: float
+            isentropic exponent.
+        g: float
+            specific Gibbs free energy (KJ/Kg).
+        f: float
+            specific Helmholtz free energy (KJ/Kg).
 
         Parameters
         ----------
@@ -96,7 +235,7 @@ class Region1:
         t: float
             temperature (K).
         desc: str
-            property to return, one of v, u, h, s, cp, and cv.
+            property to return, one of v, u, h, s, cp, cv, w, kappa_t, alpha_v, mu_jt, k_s, g and f.
 
         Returns
         -------
@@ -104,24 +243,58 @@ class Region1:
             return one of available properties, if the property is not available return None instead, see Available Properties.
         """
 
-        pi = p/16.53e3
-        tau = 1386/t
-
-        g, dgdpi, d2gdpi2, dgdtau, d2gdtau2, d2gdpidtau = cls._gamma(pi=pi, tau=tau)
-
-        _props = dict()
-        _props["v"] = BIGR*t*pi*dgdpi/p
-        _props["u"] = BIGR*t*(tau*dgdtau-pi*dgdpi)
-        _props["s"] = BIGR*(tau*dgdtau-g)
-        _props["h"] = BIGR*t*tau*dgdtau
-        _props["cp"] = -1*BIGR*(tau**2)*d2gdtau2
-        _props["cv"] = BIGR*(-1*(tau**2)*d2gdtau2+((dgdpi-tau*d2gdpidtau)**2)/d2gdpi2)
+        _props = cls.props_all(p, t, props=(desc,))
 
         if desc and desc.lower() in _props.keys():
             return _props[desc.lower()]
         else:
             return None
 
+    @classmethod
+    def props_all(cls, p, t, props=None):
+        """Equations of property for region 1, evaluate basic equation once and return all properties.
+
+        Arrays of pressure and temperature are broadcast against each other and evaluated elementwise. Only
+        derivatives of basic equation needed by requested properties are evaluated, see GIBBSNEEDS.
+
+        Parameters
+        ----------
+        p: float or ndarray
+            pressure (KPa).
+        t: float or ndarray
+            temperature (K).
+        props: collection of str or str, optional
+            properties to return, see Available Properties of props, default all properties.
+
+        Returns
+        -------
+        _props: dict
+            return requested available properties, see Available Properties of props, as arrays for array inputs.
+        """
+
+        pi = p/16.53e3
+        tau = 1386/t
+
+        props, need = _needs(GIBBSNEEDS, props)
+        g, dgdpi, d2gdpi2, dgdtau, d2gdtau2, d2gdpidtau = cls._gamma(pi=pi, tau=tau, need=need)
+
+        _props = dict()
+        if "v" in props:
+            _props["v"] = BIGR*t*pi*dgdpi/p
+        if "u" in props:
+            _props["u"] = BIGR*t*(tau*dgdtau-pi*dgdpi)
+        if "s" in props:
+            _props["s"] = BIGR*(tau*dgdtau-g)
+        if "h" in props:
+            _props["h"] = BIGR*t*tau*dgdtau
+        if "cp" in props:
+            _props["cp"] = -1*BIGR*(tau**2)*d2gdtau2
+        if "cv" in props:
+            _props["cv"] = BIGR*(-1*(tau**2)*d2gdtau2+((dgdpi-tau*d2gdpidtau)**2)/d2gdpi2)
+        _props.update(_gibbsExtra(props, p, t, pi, tau, g, dgdpi, d2gdpi2, dgdtau, d2gdtau2, d2gdpidtau))
+
+        return _props
+
 
 #Region 2
 class Region2:
@@ -138,6 +311,8 @@ class Region2:
     -------------
     props(cls, p, t, desc)
         Equations of property for region 2.
+    props_all(cls, p, t, props=None)
+        Equations of property for region 2, return all properties.
     """
 
     @staticmethod
@@ -167,26 +342,23 @@ class Region2:
             partial derivative of go to pi and tau.
         """
 
-        #coefficients
-        _Jo = IJnReg2["Jo"]
-        _no = IJnReg2["no"]
 
-        go = np.log(pi)
+        go = log(pi)
         dgodpi = 1./pi
         d2godpi2 = -1./(pi**2)
         dgodtau = 0.
         d2godtau2 = 0.
         d2godpidtau = 0.
 
-        for Jio, nio in zip(_Jo, _no):
-            go += nio*(tau**Jio)
-            dgodtau += nio*Jio*(tau**(Jio-1))
-            d2godtau2 += nio*Jio*(Jio-1)*(tau**(Jio-2))
+        for Jio, nio, noJo, noJoJo1 in REG2IDEAL.terms:
+            go = go+nio*(tau**Jio)
+            dgodtau += noJo*(tau**(Jio-1))
+            d2godtau2 += noJoJo1*(tau**(Jio-2))
 
         return go, dgodpi, d2godpi2, dgodtau, d2godtau2, d2godpidtau
 
     @staticmethod
-    def _gammar(pi, tau):
+    def _gammar(pi, tau, need=None):
         """Residual part of basic equations for region 2.
 
         Parameters
@@ -195,6 +367,8 @@ class Region2:
             pi = p/1e3.
         tau: float
             tau = 540/t.
+        need: collection of int, optional
+            indices of returned derivatives to evaluate, other derivatives are None, default all.
 
         Returns
         -------
@@ -212,27 +386,7 @@ class Region2:
             partial derivative of gr to pi and tau.
         """
 
-        #coefficients
-        _I = IJnReg2["I"]
-        _J = IJnReg2["J"]
-        _n = IJnReg2["n"]
-
-        gr = 0.
-        dgrdpi = 0.
-        d2grdpi2 = 0.
-        dgrdtau = 0.
-        d2grdtau2 = 0.
-        d2grdpidtau = 0.
-
-        for Ii, Ji, ni in zip(_I, _J, _n):
-            gr += ni*(pi**Ii)*((tau-0.5)**Ji)
-            dgrdpi += ni*Ii*(pi**(Ii-1))*((tau-0.5)**Ji)
-            d2grdpi2 += ni*Ii*(Ii-1)*(pi**(Ii-2))*((tau-0.5)**Ji)
-            dgrdtau += ni*Ji*(pi**Ii)*((tau-0.5)**(Ji-1))
-            d2grdtau2 += ni*Ji*(Ji-1)*(pi**Ii)*((tau-0.5)**(Ji-2))
-            d2grdpidtau += ni*Ii*Ji*(pi**(Ii-1))*((tau-0.5)**(Ji-1))
-
-        return gr, dgrdpi, d2grdpi2, dgrdtau, d2grdtau2, d2grdpidtau
+        return kernel.polysum(pi, tau-0.5, REG2, need=need)
 
     @classmethod
     def props(cls, p, t, desc):
@@ -252,6 +406,20 @@ class Region2:
             specific isobaric heat capacity (KJ/Kg*K).
         cv: float
             specific isochoric heat capacity (KJ/Kg*K).
+        w: float
+            speed of sound (m/s).
+        kappa_t: float
+            isothermal compressibility (1/KPa).
+        alpha_v: float
+            isobaric cubic expansion coefficient (1/K).
+        mu_jt: float
+            Joule-Thomson coefficient (K/KPa).
+        k_s: float
+            isentropic exponent.
+        g: float
+            specific Gibbs free energy (KJ/Kg).
+        f: float
+            specific Helmholtz free energy (KJ/Kg).
 
         Parameters
         ----------
@@ -260,7 +428,7 @@ class Region2:
         t: float
             temperature (K).
         desc: str
-            property to return, one of v, u, h, s, cp, and cv.
+            property to return, one of v, u, h, s, cp, cv, w, kappa_t, alpha_v, mu_jt, k_s, g and f.
 
         Returns
         -------
@@ -268,24 +436,62 @@ class Region2:
             return one of available properties or if the property is not available return None instead, see Available Properties.
         """
 
+        _props = cls.props_all(p, t, props=(desc,))
+
+        if desc and desc.lower() in _props.keys():
+            return _props[desc.lower()]
+        else:
+            return None
+
+    @classmethod
+    def props_all(cls, p, t, props=None):
+        """Equations of property for region 2, evaluate basic equation once and return all properties.
+
+        Arrays of pressure and temperature are broadcast against each other and evaluated elementwise. Only
+        derivatives of basic equation needed by requested properties are evaluated, see GIBBSNEEDS.
+
+        Parameters
+        ----------
+        p: float or ndarray
+            pressure (KPa).
+        t: float or ndarray
+            temperature (K).
+        props: collection of str or str, optional
+            properties to return, see Available Properties of props, default all properties.
+
+        Returns
+        -------
+        _props: dict
+            return requested available properties, see Available Properties of props, as arrays for array inputs.
+        """
+
         pi = p/1e3
         tau = 540/t
 
+        props, need = _needs(GIBBSNEEDS, props)
         go, dgodpi, d2godpi2, dgodtau, d2godtau2, d2godpidtau = cls._gammao(pi, tau)
-        gr, dgrdpi, d2grdpi2, dgrdtau, d2grdtau2, d2grdpidtau = cls._gammar(pi, tau)
+        gr, dgrdpi, d2grdpi2, dgrdtau, d2grdtau2, d2grdpidtau = cls._gammar(pi, tau, need=need)
 
         _props = dict()
-        _props["v"] = BIGR*t*pi*(dgodpi+dgrdpi)/p
-        _props["u"] = BIGR*t*(tau*(dgodtau+dgrdtau)-pi*(dgodpi+dgrdpi))
-        _props["s"] = BIGR*(tau*(dgodtau+dgrdtau)-(go+gr))
-        _props["h"] = BIGR*t*tau*(dgodtau+dgrdtau)
-        _props["cp"] = -1*BIGR*(tau**2)*(d2godtau2+d2grdtau2)
-        _props["cv"] = BIGR*(-1*(tau**2)*(d2godtau2+d2grdtau2)-(((1+pi*dgrdpi-tau*pi*d2grdpidtau)**2)/(1-(pi**2)*d2grdpi2)))
-
-        if desc and desc.lower() in _props.keys():
-            return _props[desc.lower()]
-        else:
-            return None
+        if "v" in props:
+            _props["v"] = BIGR*t*pi*(dgodpi+dgrdpi)/p
+        if "u" in props:
+            _props["u"] = BIGR*t*(tau*(dgodtau+dgrdtau)-pi*(dgodpi+dgrdpi))
+        if "s" in props:
+            _props["s"] = BIGR*(tau*(dgodtau+dgrdtau)-(go+gr))
+        if "h" in props:
+            _props["h"] = BIGR*t*tau*(dgodtau+dgrdtau)
+        if "cp" in props:
+            _props["cp"] = -1*BIGR*(tau**2)*(d2godtau2+d2grdtau2)
+        if "cv" in props:
+            _props["cv"] = BIGR*(-1*(tau**2)*(d2godtau2+d2grdtau2)-(((1+pi*dgrdpi-tau*pi*d2grdpidtau)**2)/(1-(pi**2)*d2grdpi2)))
+        if props-frozenset(("v", "u", "s", "h", "cp", "cv")):
+            ideal = (go, dgodpi, d2godpi2, dgodtau, d2godtau2, d2godpidtau)
+            resid = (gr, dgrdpi, d2grdpi2, dgrdtau, d2grdtau2, d2grdpidtau)
+            total = (None if r is None else o+r for o, r in zip(ideal, resid))
+            _props.update(_gibbsExtra(props, p, t, pi, tau, *total))
+
+        return _props
 
 
 #Supplementary equations of region 2
@@ -327,26 +533,23 @@ class SuppRegion2(Region2):
             partial derivative of go to pi and tau.
         """
 
-        #coefficients
-        _Jo = IJnReg2Supp["Jo"]
-        _no = IJnReg2Supp["no"]
 
-        go = np.log(pi)
+        go = log(pi)
         dgodpi = 1./pi
         d2godpi2 = -1./(pi**2)
         dgodtau = 0.
         d2godtau2 = 0.
         d2godpidtau = 0.
 
-        for Jio, nio in zip(_Jo, _no):
-            go += nio*(tau**Jio)
-            dgodtau += nio*Jio*(tau**(Jio-1))
-            d2godtau2 += nio*Jio*(Jio-1)*(tau**(Jio-2))
+        for Jio, nio, noJo, noJoJo1 in REG2SUPPIDEAL.terms:
+            go = go+nio*(tau**Jio)
+            dgodtau += noJo*(tau**(Jio-1))
+            d2godtau2 += noJoJo1*(tau**(Jio-2))
 
         return go, dgodpi, d2godpi2, dgodtau, d2godtau2, d2godpidtau
 
     @staticmethod
-    def _gammar(pi, tau):
+    def _gammar(pi, tau, need=None):
         """Residual part of supplementary equations for region 2.
 
         Parameters
@@ -355,6 +558,8 @@ class SuppRegion2(Region2):
             pi = p/1e3.
         tau: float
             tau = 540/t.
+        need: collection of int, optional
+            indices of returned derivatives to evaluate, other derivatives are None, default all.
 
         Returns
         -------
@@ -372,27 +577,7 @@ class SuppRegion2(Region2):
             partial derivative of gr to pi and tau.
         """
 
-        #coefficients
-        _I = IJnReg2Supp["I"]
-        _J = IJnReg2Supp["J"]
-        _n = IJnReg2Supp["n"]
-
-        gr = 0.
-        dgrdpi = 0.
-        d2grdpi2 = 0.
-        dgrdtau = 0.
-        d2grdtau2 = 0.
-        d2grdpidtau = 0.
-
-        for Ii, Ji, ni in zip(_I, _J, _n):
-            gr += ni*(pi**Ii)*((tau-0.5)**Ji)
-            dgrdpi += ni*Ii*(pi**(Ii-1))*((tau-0.5)**Ji)
-            d2grdpi2 += ni*Ii*(Ii-1)*(pi**(Ii-2))*((tau-0.5)**Ji)
-            dgrdtau += ni*Ji*(pi**Ii)*((tau-0.5)**(Ji-1))
-            d2grdtau2 += ni*Ji*(Ji-1)*(pi**Ii)*((tau-0.5)**(Ji-2))
-            d2grdpidtau += ni*Ii*Ji*(pi**(Ii-1))*((tau-0.5)**(Ji-1))
-
-        return gr, dgrdpi, d2grdpi2, dgrdtau, d2grdtau2, d2grdpidtau
+        return kernel.polysum(pi, tau-0.5, REG2SUPP, need=need)
 
 
 #Region 3
@@ -406,60 +591,60 @@ class Region3:
 
     Classs Methods
     --------------
-    saturRho(cls, psat, tsat)
-        Calculate saturation densities in region 3
+    saturRho(cls, psat, tsat, exact=False)
+        Calculate saturation densities in region 3 from cached table
+    auxSaturRho(tsat)
+        Auxiliary equations of saturation densities, initial guesses of saturRho
     props(cls, rho, t, desc)
         Calculate properties in region 3
+    props_all(cls, rho, t, props=None)
+        Calculate all properties in region 3
     _iterRho(cls, delta0, p, t)
         Backward equation to calculate density using iterative method
+    solveRho(cls, p, t, rho0, bounds=(0., 800.), tol=1e-9, maxiter=50)
+        Safeguarded Newton iteration of density for scalars or arrays of pressure and temperature
     """
 
+    #saturated liquid and vapor densities on nodes and step of nodes, see _saturNodes
+    _saturTable = None
+
     @staticmethod
-    def _phi(delta, tau):
-        """Basic equations for region 3.
+    def _phi(delta, tau, need=None):
+        """Basic equations for region 3, delta and tau can be arrays and are broadcast against each other.
 
         Parameters
         ----------
-        delta: float
+        delta: float or ndarray
             delta = rho/RHOC.
-        tau: float
+        tau: float or ndarray
             tau = TEMPC/t.
+        need: collection of int, optional
+            indices of returned derivatives to evaluate, other derivatives are None, default all.
 
         Returns
         -------
-        f: float
+        f: float or ndarray
            specific Helmhotz free energy.
-        dfddel: float
+        dfddel: float or ndarray
             first partial derivative of f to delta.
-        d2fddel2: float
+        d2fddel2: float or ndarray
             second partial derivative of f to delta.
-        dfdtau: float
+        dfdtau: float or ndarray
             first partial derivative of f to tau.
-        d2fdtau2: float
+        d2fdtau2: float or ndarray
             second partial derivative of f to tau.
-        dfddeldtau: float
+        dfddeldtau: float or ndarray
             partial derivative of f to delta and tau.
         """
 
-        #coefficients
-        _n = IJnReg3["n"]
-        _I = IJnReg3["I"]
-        _J = IJnReg3["J"]
-
-        f = _n[0]*np.log(delta)
-        dfddel = _n[0]/delta
-        d2fddel2 = (-1*_n[0])/(delta**2)
-        dfdtau = 0.
-        d2fdtau2 = 0.
-        d2fddeldtau = 0.
-
-        for Ii, Ji, ni in zip(_I[1:], _J[1:], _n[1:]):
-            f += ni*(delta**Ii)*(tau**Ji)
-            dfddel += ni*Ii*(delta**(Ii-1))*(tau**Ji)
-            d2fddel2 += ni*Ii*(Ii-1)*(delta**(Ii-2))*(tau**Ji)
-            dfdtau += ni*Ji*(delta**Ii)*(tau**(Ji-1))
-            d2fdtau2 += ni*Ji*(Ji-1)*(delta**Ii)*(tau**(Ji-2))
-            d2fddeldtau += ni*Ii*Ji*(delta**(Ii-1))*(tau**(Ji-1))
+        f, dfddel, d2fddel2, dfdtau, d2fdtau2, d2fddeldtau = kernel.polysum(delta, tau, REG3, need=need)
+
+        if f is not None:
+            f += N3LOG*log(delta)
+        if dfddel is not None:
+            dfddel += N3LOG/delta
+        if d2fddel2 is not None:
+            d2fddel2 += (-1*N3LOG)/(delta**2)
 
         return f, dfddel, d2fddel2, dfdtau, d2fdtau2, d2fddeldtau
 
@@ -482,31 +667,142 @@ class Region3:
             density (Kg/m^3).
         """
 
-        tau = TEMPC/t
-        c = p/(RHOC*BIGR*t)
+        _rho, _ = cls.solveRho(p, t, RHOC*delta0)
+        return _rho
+
+    @classmethod
+    def solveRho(cls, p, t, rho0, bounds=(0., 800.), tol=1e-9, maxiter=50):
+        """Solve basic equation p(rho, t) = p for density with safeguarded Newton iteration.
+
+        Every step evaluates basic equation once for pressure and its derivative to delta. Bracket [lo, hi] of root
+        is narrowed from sign of residual, Newton steps which leave bracket or go against slope of stable isotherm
+        (dp/drho <= 0) are replaced by bisection of bracket, or by doubling of delta while bracket is open. Arrays
+        of p, t and rho0 are broadcast against each other and iterated together, converged elements are removed from
+        later steps. Initial guess out of bounds is replaced by midpoint of bounds.
+
+        Parameters
+        ----------
+        p: float or ndarray
+            pressure (KPa).
+        t: float or ndarray
+            temperature (K).
+        rho0: float or ndarray
+            initial guess of density (Kg/m^3).
+        bounds: tuple, optional
+            (rho_min, rho_max), initial bracket of density (Kg/m^3), default (0, 800), basic equation gives p > 100 MPa
+            at 800 Kg/m^3 over region 3 and is not monotonic above, pass bracket of one phase to select its root
+            where isotherm has three roots.
+        tol: float, optional
+            iteration stops when step of delta = rho/RHOC is not larger than tol.
+        maxiter: int, optional
+            maximum number of steps.
 
-        def func(delta):
-            baseq = cls._phi(delta=delta, tau=tau)
-            f1 = (delta**2)*baseq[1]-c
-            return f1
+        Returns
+        -------
+        _rho: float or ndarray
+            density (Kg/m^3), nan for elements of arrays which did not converge.
+        iters: int or ndarray
+            number of evaluations of basic equation of each element.
+
+        Raises
+        ------
+        RuntimeError
+            if scalar inputs did not converge in maxiter steps.
+        """
 
-        def dfunc(delta):
-            baseq = cls._phi(delta=delta, tau=tau)
-            f1 = 2*delta*baseq[1]+(delta**2)*baseq[2]
-            return f1
+        if not all(isinstance(val, (float, int)) for val in (p, t, rho0)):
+            return cls._solveRhoArray(p, t, rho0, bounds, tol, maxiter)
+
+        tau = TEMPC/t
+        c = p/(RHOC*BIGR*t)
+        lo = bounds[0]/RHOC
+        hi = bounds[1]/RHOC
+
+        _delta = rho0/RHOC
+        if not lo < _delta < hi:
+            _delta = 0.5*(lo+hi)
+
+        for iters in range(1, maxiter+1):
+            _, dfddel, d2fddel2, _, _, _ = cls._phi(delta=_delta, tau=tau, need=(1, 2))
+            f1 = (_delta**2)*dfddel-c
+            if f1 == 0:
+                break
+            df1 = 2*_delta*dfddel+(_delta**2)*d2fddel2
+
+            #residual grows with delta on stable branch, root is below delta if residual is positive
+            if f1 > 0:
+                hi = min(hi, _delta)
+            else:
+                lo = max(lo, _delta)
+
+            new = _delta-f1/df1 if df1 > 0 else math.nan
+            if not lo < new < hi:
+                new = 0.5*(lo+hi) if hi < math.inf else 2*_delta
+
+            step = _delta-new
+            _delta = new
+            if abs(step) <= tol:
+                break
+        else:
+            raise RuntimeError(f"Density of region 3 did not converge at p = {p} KPa and t = {t} K")
 
-        _delta = optimize.newton(func, x0=delta0, fprime=dfunc, tol=1e-9)
         _rho = RHOC*_delta
-        return _rho
+        return _rho, iters
 
     @classmethod
-    def saturRho(cls, psat, tsat):
-        """Calculate saturated liquid and vapor density for region 3.
+    def _solveRhoArray(cls, p, t, rho0, bounds, tol, maxiter):
+        """Array version of solveRho, every element follows the same steps as scalar iteration."""
+
+        import numpy as np
+
+        p, t, rho0 = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(t, dtype=float), np.asarray(rho0, dtype=float))
+        shape = p.shape
+        tau = TEMPC/t.ravel()
+        c = p.ravel()/(RHOC*BIGR*t.ravel())
+        lo = np.full(tau.size, bounds[0]/RHOC)
+        hi = np.full(tau.size, bounds[1]/RHOC)
+
+        _delta = rho0.ravel()/RHOC
+        outside = ~((lo < _delta) & (_delta < hi))
+        _delta[outside] = 0.5*(lo[outside]+hi[outside])
+        iters = np.zeros(tau.size, dtype=int)
+        active = np.arange(tau.size)
+        for _ in range(maxiter):
+            if not active.size:
+                break
+
+            d = _delta[active]
+            _, dfddel, d2fddel2, _, _, _ = cls._phi(delta=d, tau=tau[active], need=(1, 2))
+            iters[active] += 1
+            f1 = (d**2)*dfddel-c[active]
+            df1 = 2*d*dfddel+(d**2)*d2fddel2
+
+            h = np.where(f1 > 0, np.minimum(hi[active], d), hi[active])
+            l = np.where(f1 < 0, np.maximum(lo[active], d), lo[active])
+            hi[active] = h
+            lo[active] = l
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                new = np.where(df1 > 0, d-f1/df1, np.nan)
+            out = ~((l < new) & (new < h))
+            new[out] = np.where(np.isfinite(h[out]), 0.5*(l[out]+h[out]), 2*d[out])
+            new[f1 == 0] = d[f1 == 0]
+
+            _delta[active] = new
+            active = active[np.abs(d-new) > tol]
+
+        _delta[active] = np.nan
+        return (RHOC*_delta).reshape(shape), iters.reshape(shape)
+
+    @staticmethod
+    def auxSaturRho(tsat):
+        """Auxiliary equations of saturated liquid and vapor density, IAPWS SR1-86(1992).
+
+        Equations are fitted to IAPWS-95 and differ from densities of basic equation of region 3 at saturation
+        pressure by less than 0.1 % below 640 K and up to about 3 % near critical point.
 
         Parameters
         ----------
-        psat: float
-            saturation pressure (KPa).
         tsat: float
             saturation temperature (K).
 
@@ -514,19 +810,132 @@ class Region3:
         -------
         rhof: float
             saturated liquid density (Kg/m^3).
-        rhof: float
+        rhog: float
             saturated vapor density (Kg/m^3).
         """
 
-        if 623.15 < tsat <= 647:
-            rhof = cls._iterRho(1.7, psat, tsat)
-            rhog = cls._iterRho(0.4, psat, tsat)
-        elif 647 < tsat < TEMPC:
-            rhof = cls._iterRho(0.999999999, psat, tsat)
-            rhog = cls._iterRho(0.999999999, psat, tsat)
+        theta = 1-tsat/TEMPC
+        rhof = RHOC*(1+sum(n*(theta**I) for n, I in SATLIQ))
+        rhog = RHOC*exp(sum(n*(theta**I) for n, I in SATVAP))
+        return rhof, rhog
+
+    @classmethod
+    def _solveSaturRho(cls, psat, tsat, rhof0, rhog0):
+        """Solve basic equation at saturation pressure for density of each phase.
+
+        Isotherm has three roots below critical temperature, vapor root and unstable root are below critical
+        density and liquid root is above, so every phase is iterated in its own bracket and can not converge to
+        root of other phase.
+        """
+
+        rhof, _ = cls.solveRho(psat, tsat, rhof0, bounds=(RHOC, 800.))
+        rhog, _ = cls.solveRho(psat, tsat, rhog0, bounds=(0., RHOC))
+        return rhof, rhog
+
+    @classmethod
+    def _saturNodes(cls):
+        """Table of saturated densities on SATNODES+1 nodes uniform in sqrt(1-tsat/TEMPC), built on first use.
+
+        Densities of both phases go as RHOC*(1 +- a*sqrt(1-tsat/TEMPC)) near critical point, so they are smooth
+        functions of this variable over whole range from 623.15 K to critical temperature.
+        """
+
+        if cls._saturTable is None:
+            step = math.sqrt(1-623.15/TEMPC)/SATNODES
+            liq = [RHOC]
+            vap = [RHOC]
+            for k in range(1, SATNODES+1):
+                tsat = TEMPC*(1-(k*step)**2)
+                rhof, rhog = cls._solveSaturRho(Region4.getSaturPress(tsat), tsat, *cls.auxSaturRho(tsat))
+                liq.append(rhof)
+                vap.append(rhog)
+            cls._saturTable = (tuple(liq), tuple(vap), step)
+        return cls._saturTable
+
+    @classmethod
+    def saturRho(cls, psat, tsat, exact=False):
+        """Calculate saturated liquid and vapor density for region 3.
+
+        Densities are solved from basic equation at saturation pressure once on dense table of saturation
+        temperatures, with auxiliary equations as initial guesses and each phase kept in its own bracket (liquid above
+        and vapor below critical density), then every call interpolates table by cubic polynomial. Interpolation
+        differs from solved densities by less than 1e-9 relative, except within about 0.005 K of critical temperature
+        where saturation pressure of region 4 is not consistent enough with basic equation to give separate roots and
+        table is interpolated toward critical density. With exact True, interpolated densities are used as initial
+        guesses of Newton iteration on basic equation at psat. Arrays are interpolated elementwise.
+
+        Limit
+        -----
+        Valid for:
+            623.15 K <= tsat <= 647.096 K or 350 C <= tsat <= 373.946 C.
 
+        Parameters
+        ----------
+        psat: float or ndarray
+            saturation pressure (KPa), used only with exact True.
+        tsat: float or ndarray
+            saturation temperature (K).
+        exact: bool, optional
+            solve basic equation at psat for densities, default False.
+
+        Returns
+        -------
+        rhof: float or None or ndarray
+            saturated liquid density (Kg/m^3).
+        rhog: float or None or ndarray
+            saturated vapor density (Kg/m^3), None for both densities if saturation temperature (tsat) exceed
+            and/or is not in range of limit, see Limit, nan instead of None for arrays.
+        """
+
+        if not isinstance(tsat, (float, int)):
+            return cls._saturRhoArray(psat, tsat, exact)
+        if not 623.15 <= tsat <= TEMPC:
+            return None, None
+
+        liq, vap, step = cls._saturNodes()
+        u = math.sqrt(1-tsat/TEMPC)/step
+        k = min(max(int(u)-1, 0), SATNODES-3)
+
+        #Lagrange weights of nodes k to k+3 at x
+        x = u-k
+        x1 = x-1
+        x2 = x-2
+        x3 = x-3
+        w0 = -x1*x2*x3/6
+        w1 = x*x2*x3/2
+        w2 = -x*x1*x3/2
+        w3 = x*x1*x2/6
+        rhof = w0*liq[k]+w1*liq[k+1]+w2*liq[k+2]+w3*liq[k+3]
+        rhog = w0*vap[k]+w1*vap[k+1]+w2*vap[k+2]+w3*vap[k+3]
+
+        if exact and tsat < TEMPC:
+            rhof, rhog = cls._solveSaturRho(psat, tsat, rhof, rhog)
         return rhof, rhog
 
+    @classmethod
+    def _saturRhoArray(cls, psat, tsat, exact):
+        """Array version of saturRho, nan out of range of limit."""
+
+        import numpy as np
+
+        psat, tsat = np.broadcast_arrays(np.asarray(psat, dtype=float), np.asarray(tsat, dtype=float))
+        liq, vap, step = cls._saturNodes()
+        valid = (623.15 <= tsat) & (tsat <= TEMPC)
+
+        u = np.sqrt(1-np.where(valid, tsat, TEMPC)/TEMPC)/step
+        k = np.clip(u.astype(int)-1, 0, SATNODES-3)
+        x = u-k
+        weights = (-(x-1)*(x-2)*(x-3)/6, x*(x-2)*(x-3)/2, -x*(x-1)*(x-3)/2, x*(x-1)*(x-2)/6)
+        liq = np.asarray(liq)
+        vap = np.asarray(vap)
+        rhof = sum(w*liq[k+i] for i, w in enumerate(weights))
+        rhog = sum(w*vap[k+i] for i, w in enumerate(weights))
+
+        if exact:
+            cells = valid & (tsat < TEMPC)
+            rhof[cells], rhog[cells] = cls._solveSaturRho(psat[cells], tsat[cells], rhof[cells], rhog[cells])
+        return np.where(valid, rhof, np.nan), np.where(valid, rhog, np.nan)
+
     @classmethod
     def props(cls, rho, t, desc):
         """Equations of property for region 3.
@@ -535,6 +944,8 @@ class Region3:
         --------------------
         p: float
             pressure (KPa).
+        v: float
+            specific volume (m^3/Kg).
         u: float
             specific internal energy (KJ/Kg).
         h: float
@@ -545,41 +956,92 @@ class Region3:
             specific isobaric heat capacity (KJ/Kg*K).
         cv: float
             specific isochoric heat capacity (KJ/Kg*K).
+        w: float
+            speed of sound (m/s).
+        kappa_t: float
+            isothermal compressibility (1/KPa).
+        alpha_v: float
+            isobaric cubic expansion coefficient (1/K).
+        mu_jt: float
+            Joule-Thomson coefficient (K/KPa).
+        k_s: float
+            isentropic exponent.
+        g: float
+            specific Gibbs free energy (KJ/Kg).
+        f: float
+            specific Helmholtz free energy (KJ/Kg).
 
         Parameters
         ----------
-        rho: float
+        rho: float or ndarray
             density (Kg/m^3).
-        t: float
+        t: float or ndarray
             temperature (K).
         desc: str
-            property to return, one of p, u, h, s, cp, and cv.
+            property to return, one of p, v, u, h, s, cp, cv, w, kappa_t, alpha_v, mu_jt, k_s, g and f.
 
         Returns
         -------
         _props: dict or None
-            return one of available properties or if property is not available return None instead, see Available Properties.
+            return one of available properties or if property is not available return None instead, see Available Properties,
+            as array for array inputs.
         """
 
-        delta = rho/RHOC
-        tau = TEMPC/t
-
-        f, dfddel, d2fddel2, dfdtau, d2fdtau2, d2fddeldtau = cls._phi(delta=delta, tau=tau)
-
-        _props = dict()
-        _props["p"] = rho*BIGR*t*delta*dfddel
-        _props["u"] = BIGR*t*tau*dfdtau
-        _props["s"] = BIGR*(tau*dfdtau-f)
-        _props["h"] = BIGR*t*(tau*dfdtau+delta*dfddel)
-        _props["cv"] = -1*BIGR*(tau**2)*d2fdtau2
-        sub = ((delta*dfddel-delta*tau*d2fddeldtau)**2)/(2*delta*dfddel+(delta**2)*d2fddel2)
-        _props["cp"] = BIGR*(-1*(tau**2)*d2fdtau2+sub)
+        _props = cls.props_all(rho, t, props=(desc,))
 
         if desc and desc.lower() in _props.keys():
             return _props[desc.lower()]
         else:
             return None
 
+    @classmethod
+    def props_all(cls, rho, t, props=None):
+        """Equations of property for region 3, evaluate basic equation once and return all properties.
+
+        Arrays of density and temperature are broadcast against each other and evaluated elementwise. Only
+        derivatives of basic equation needed by requested properties are evaluated, see HELMNEEDS.
+
+        Parameters
+        ----------
+        rho: float or ndarray
+            density (Kg/m^3).
+        t: float or ndarray
+            temperature (K).
+        props: collection of str or str, optional
+            properties to return, see Available Properties of props, default all properties.
+
+        Returns
+        -------
+        _props: dict
+            return requested available properties, see Available Properties of props, as arrays for array inputs.
+        """
+
+        delta = rho/RHOC
+        tau = TEMPC/t
+
+        props, need = _needs(HELMNEEDS, props)
+        f, dfddel, d2fddel2, dfdtau, d2fdtau2, d2fddeldtau = cls._phi(delta=delta, tau=tau, need=need)
+
+        _props = dict()
+        if "p" in props:
+            _props["p"] = rho*BIGR*t*delta*dfddel
+        if "u" in props:
+            _props["u"] = BIGR*t*tau*dfdtau
+        if "s" in props:
+            _props["s"] = BIGR*(tau*dfdtau-f)
+        if "h" in props:
+            _props["h"] = BIGR*t*(tau*dfdtau+delta*dfddel)
+        if "cv" in props:
+            _props["cv"] = -1*BIGR*(tau**2)*d2fdtau2
+        if "cp" in props:
+            sub = ((delta*dfddel-delta*tau*d2fddeldtau)**2)/(2*delta*dfddel+(delta**2)*d2fddel2)
+            _props["cp"] = BIGR*(-1*(tau**2)*d2fdtau2+sub)
+        if "v" in props:
+            _props["v"] = 1/rho
+        _props.update(_helmExtra(props, rho, t, delta, tau, f, dfddel, d2fddel2, dfdtau, d2fdtau2, d2fddeldtau))
+
+        return _props
+
 
 #Region 4
 class Region4:
@@ -591,6 +1053,10 @@ class Region4:
         Method to calculate saturation pressure.
     getSaturTemp(cls, psat)
         Method to calculate saturation temperature.
+    getSaturPressArray(cls, tsat)
+        Method to calculate saturation pressure for array of saturation temperatures.
+    getSaturTempArray(cls, psat)
+        Method to calculate saturation temperature for array of saturation pressures.
     """
 
     @classmethod
@@ -614,13 +1080,13 @@ class Region4:
             and/or is not in range of limit return None instead, see Limit.
         """
 
-        n = nReg4["n"]
+        n = N4
         if 273.15 <= tsat <= TEMPC:
             nu = (tsat/1)+(n[8]/((tsat/1)-n[9]))
             Ai = (nu**2)+n[0]*nu+n[1]
             Bi = n[2]*(nu**2)+n[3]*nu+n[4]
             Ci = n[5]*(nu**2)+n[6]*nu+n[7]
-            psat = 1e3*((2*Ci/(-Bi+np.sqrt(Bi**2-4*Ai*Ci)))**4)
+            psat = 1e3*((2*Ci/(-Bi+math.sqrt(Bi**2-4*Ai*Ci)))**4)
             return psat
         else:
             return None
@@ -646,18 +1112,98 @@ class Region4:
             is not in range of limit return None instead, see Limit.
         """
 
-        n = nReg4["n"]
-        if cls.getSaturPress(tsat=273.15) <= psat <= PRESSC:
+        n = N4
+        if PSAT273 <= psat <= PRESSC:
             beta = (psat/1000)**(1/4)
             Ei = (beta**2)+n[2]*beta+n[5]
             Fi = n[0]*(beta**2)+n[3]*beta+n[6]
             Gi = n[1]*(beta**2)+n[4]*beta+n[7]
-            Di = 2*Gi/(-Fi - np.sqrt((Fi**2) - 4*Ei*Gi))
-            tsat = 1*((n[9]+Di-np.sqrt((n[9]+Di)**2-4*(n[8]+n[9]*Di)))/2)
+            Di = 2*Gi/(-Fi - math.sqrt((Fi**2) - 4*Ei*Gi))
+            tsat = 1*((n[9]+Di-math.sqrt((n[9]+Di)**2-4*(n[8]+n[9]*Di)))/2)
             return tsat
         else:
             return None
 
+    @classmethod
+    def getSaturPressArray(cls, tsat):
+        """Calculate saturation pressure for array of saturation temperatures.
+
+        Limit
+        -----
+        Valid for:
+            273.15 K <= tsat <= 647.096 K or 0 C <= tsat <= 373.946 C.
+
+        Parameters
+        ----------
+        tsat: array_like
+            Saturation temperature (K).
+
+        Returns
+        -------
+        psat: ndarray
+            saturation pressure (KPa), nan where saturation temperature (tsat) exceed and/or is not in range of limit, see Limit.
+        valid: ndarray
+            boolean mask, True where saturation temperature (tsat) is in range of limit.
+        """
+
+        import numpy as np
+
+        n = N4
+        tsat = np.asarray(tsat, dtype=float)
+        valid = (273.15 <= tsat) & (tsat <= TEMPC)
+
+        #states out of range of limit are evaluated at critical temperature and replaced by nan
+        t = np.where(valid, tsat, TEMPC)
+        nu = t+(n[8]/(t-n[9]))
+        Ai = (nu**2)+n[0]*nu+n[1]
+        Bi = n[2]*(nu**2)+n[3]*nu+n[4]
+        Ci = n[5]*(nu**2)+n[6]*nu+n[7]
+        psat = 1e3*((2*Ci/(-Bi+np.sqrt(Bi**2-4*Ai*Ci)))**4)
+        return np.where(valid, psat, np.nan), valid
+
+    @classmethod
+    def getSaturTempArray(cls, psat):
+        """Calculate saturation temperature for array of saturation pressures.
+
+        Limit
+        -----
+        Valid for:
+            0.6112127 KPa <= psat <= 22064 KPa or 0.6112127e-3 MPa <= psat <= 22.064 MPa
+
+        Parameters
+        ----------
+        psat: array_like
+            Saturation presssure (KPa).
+
+        Returns
+        -------
+        tsat: ndarray
+            Saturation temperature (K), nan where saturation pressure (psat) exceed and/or is not in range of limit, see Limit.
+        valid: ndarray
+            boolean mask, True where saturation pressure (psat) is in range of limit.
+        """
+
+        import numpy as np
+
+        n = N4
+        psat = np.asarray(psat, dtype=float)
+        valid = (PSAT273 <= psat) & (psat <= PRESSC)
+
+        #states out of range of limit are evaluated at critical pressure and replaced by nan
+        p = np.where(valid, psat, PRESSC)
+        beta = (p/1000)**(1/4)
+        Ei = (beta**2)+n[2]*beta+n[5]
+        Fi = n[0]*(beta**2)+n[3]*beta+n[6]
+        Gi = n[1]*(beta**2)+n[4]*beta+n[7]
+        Di = 2*Gi/(-Fi - np.sqrt((Fi**2) - 4*Ei*Gi))
+        tsat = 1*((n[9]+Di-np.sqrt((n[9]+Di)**2-4*(n[8]+n[9]*Di)))/2)
+        return np.where(valid, tsat, np.nan), valid
+
+
+#saturation pressures (KPa) at 273.15 K, lower limit of region 4, and at 623.15 K, where region 4 meets region 3
+PSAT273 = Region4.getSaturPress(tsat=273.15)
+PSAT623 = Region4.getSaturPress(tsat=623.15)
+
 
 #Region 5
 class Region5:
@@ -674,6 +1220,8 @@ class Region5:
     -------------
     props(cls, p, t, desc)
         Equations of property for region 5.
+    props_all(cls, p, t, props=None)
+        Equations of property for region 5, return all properties.
     """
 
     @staticmethod
@@ -703,26 +1251,23 @@ class Region5:
             partial derivative of go to pi and tau.
         """
 
-        #coefficients
-        _Jo = IJnReg5["Jo"]
-        _no = IJnReg5["no"]
 
-        go = np.log(pi)
+        go = log(pi)
         dgodpi = 1./pi
         d2godpi2 = -1./(pi**2)
         dgodtau = 0.
         d2godtau2 = 0.
         d2godpidtau = 0.
 
-        for Jio, nio in zip(_Jo, _no):
-            go += nio*(tau**Jio)
-            dgodtau += nio*Jio*(tau**(Jio-1))
-            d2godtau2 += nio*Jio*(Jio-1)*(tau**(Jio-2))
+        for Jio, nio, noJo, noJoJo1 in REG5IDEAL.terms:
+            go = go+nio*(tau**Jio)
+            dgodtau += noJo*(tau**(Jio-1))
+            d2godtau2 += noJoJo1*(tau**(Jio-2))
 
         return go, dgodpi, d2godpi2, dgodtau, d2godtau2, d2godpidtau
 
     @staticmethod
-    def _gammar(pi, tau):
+    def _gammar(pi, tau, need=None):
         """Residual part of basic equations for region 5.
 
         Parameters
@@ -731,6 +1276,8 @@ class Region5:
             pi = p/1e3.
         tau: float
             tau = 1000/t.
+        need: collection of int, optional
+            indices of returned derivatives to evaluate, other derivatives are None, default all.
 
         Returns
         -------
@@ -748,27 +1295,7 @@ class Region5:
             partial derivative of gr to pi and tau.
         """
 
-        #coefficients
-        _I = IJnReg5["I"]
-        _J = IJnReg5["J"]
-        _n = IJnReg5["n"]
-
-        gr = 0.
-        dgrdpi = 0.
-        d2grdpi2 = 0.
-        dgrdtau = 0.
-        d2grdtau2 = 0.
-        d2grdpidtau = 0.
-
-        for Ii, Ji, ni in zip(_I, _J, _n):
-            gr += ni*(pi**Ii)*(tau**Ji)
-            dgrdpi += ni*Ii*(pi**(Ii-1))*(tau**Ji)
-            d2grdpi2 += ni*Ii*(Ii-1)*(pi**(Ii-2))*(tau**Ji)
-            dgrdtau += ni*Ji*(pi**Ii)*(tau**(Ji-1))
-            d2grdtau2 += ni*Ji*(Ji-1)*(pi**Ii)*(tau**(Ji-2))
-            d2grdpidtau += ni*Ii*Ji*(pi**(Ii-1))*(tau**(Ji-1))
-
-        return gr, dgrdpi, d2grdpi2, dgrdtau, d2grdtau2, d2grdpidtau
+        return kernel.polysum(pi, tau, REG5, need=need)
 
     @classmethod
     def props(cls, p, t, desc):
@@ -788,6 +1315,20 @@ class Region5:
             specific isobaric heat capacity (KJ/Kg*K).
         cv: float
             specific isochoric heat capacity (KJ/Kg*K).
+        w: float
+            speed of sound (m/s).
+        kappa_t: float
+            isothermal compressibility (1/KPa).
+        alpha_v: float
+            isobaric cubic expansion coefficient (1/K).
+        mu_jt: float
+            Joule-Thomson coefficient (K/KPa).
+        k_s: float
+            isentropic exponent.
+        g: float
+            specific Gibbs free energy (KJ/Kg).
+        f: float
+            specific Helmholtz free energy (KJ/Kg).
 
         Parameters
         ----------
@@ -796,7 +1337,7 @@ class Region5:
         t: float
             temperature (K).
         desc: str
-            property to return, one of v, u, h, s, cp, and cv.
+            property to return, one of v, u, h, s, cp, cv, w, kappa_t, alpha_v, mu_jt, k_s, g and f.
 
         Returns
         -------
@@ -804,21 +1345,59 @@ class Region5:
             return one of available properties or if property is not available return None instead, see Available Properties.
         """
 
+        _props = cls.props_all(p, t, props=(desc,))
+
+        if desc and desc.lower() in _props.keys():
+            return _props[desc.lower()]
+        else:
+            return None
+
+    @classmethod
+    def props_all(cls, p, t, props=None):
+        """Equations of property for region 5, evaluate basic equation once and return all properties.
+
+        Arrays of pressure and temperature are broadcast against each other and evaluated elementwise. Only
+        derivatives of basic equation needed by requested properties are evaluated, see GIBBSNEEDS.
+
+        Parameters
+        ----------
+        p: float or ndarray
+            pressure (KPa).
+        t: float or ndarray
+            temperature (K).
+        props: collection of str or str, optional
+            properties to return, see Available Properties of props, default all properties.
+
+        Returns
+        -------
+        _props: dict
+            return requested available properties, see Available Properties of props, as arrays for array inputs.
+        """
+
         pi = p/1e3
         tau = 1000/t
 
+        props, need = _needs(GIBBSNEEDS, props)
         go, dgodpi, d2godpi2, dgodtau, d2godtau2, d2godpidtau = cls._gammao(pi, tau)
-        gr, dgrdpi, d2grdpi2, dgrdtau, d2grdtau2, d2grdpidtau = cls._gammar(pi, tau)
+        gr, dgrdpi, d2grdpi2, dgrdtau, d2grdtau2, d2grdpidtau = cls._gammar(pi, tau, need=need)
 
         _props = dict()
-        _props["v"] = (BIGR*t*pi*(dgrdpi+dgodpi))/p
-        _props["u"] = BIGR*t*(tau*(dgodtau+dgrdtau)-pi*(dgodpi+dgrdpi))
-        _props["s"] = BIGR*(tau*(dgodtau+dgrdtau)-(go+gr))
-        _props["h"] = BIGR*t*tau*(dgodtau+dgrdtau)
-        _props["cp"] = -1*BIGR*(tau**2)*(d2godtau2+d2grdtau2)
-        _props["cv"] = BIGR*(-1*(tau**2)*(d2godtau2+d2grdtau2)-(((1+pi*dgrdpi-tau*pi*d2grdpidtau)**2)/(1-(pi**2)*d2grdpi2)))
-
-        if desc and desc.lower() in _props.keys():
-            return _props[desc.lower()]
-        else:
-            return None
\ No newline at end of file
+        if "v" in props:
+            _props["v"] = (BIGR*t*pi*(dgrdpi+dgodpi))/p
+        if "u" in props:
+            _props["u"] = BIGR*t*(tau*(dgodtau+dgrdtau)-pi*(dgodpi+dgrdpi))
+        if "s" in props:
+            _props["s"] = BIGR*(tau*(dgodtau+dgrdtau)-(go+gr))
+        if "h" in props:
+            _props["h"] = BIGR*t*tau*(dgodtau+dgrdtau)
+        if "cp" in props:
+            _props["cp"] = -1*BIGR*(tau**2)*(d2godtau2+d2grdtau2)
+        if "cv" in props:
+            _props["cv"] = BIGR*(-1*(tau**2)*(d2godtau2+d2grdtau2)-(((1+pi*dgrdpi-tau*pi*d2grdpidtau)**2)/(1-(pi**2)*d2grdpi2)))
+        if props-frozenset(("v", "u", "s", "h", "cp", "cv")):
+            ideal = (go, dgodpi, d2godpi2, dgodtau, d2godtau2, d2godpidtau)
+            resid = (gr, dgrdpi, d2grdpi2, dgrdtau, d2grdtau2, d2grdpidtau)
+            total = (None if r is None else o+r for o, r in zip(ideal, resid))
+            _props.update(_gibbsExtra(props, p, t, pi, tau, *total))
+
+        return _props
@@ -1,8 +1,8 @@
 """This module contains all equations of boundary line, boundary equations beetwen region 2 and region 3,
 boundary equations beetwen subregion 3"""
 
-from math import log, sqrt
-from ..coefficients import InBoundT3, nb23
+from .mathfn import log, sqrt
+from ..coefficients import BOUNDT3, N23
 
 
 class Boundary23:
@@ -14,9 +14,13 @@ class Boundary23:
         find pressure at boundary line between region 2 and region 3.
     getTemp(cls, p)
         find temperature at boundary line betweeen region 2 and region 3.
+    getPressArray(cls, t)
+        find pressure at boundary line between region 2 and region 3 for array of temperatures.
+    getTempArray(cls, p)
+        find temperature at boundary line between region 2 and region 3 for array of pressures.
     """
 
-    _n = nb23
+    _n = N23
 
     @classmethod
     def getPress(cls, t):
@@ -39,7 +43,7 @@ class Boundary23:
         """
 
         if 623.15 <= t <= 863.15:
-            _n = nb23
+            _n = N23
             theta = t/1
             p = cls._n[0] + cls._n[1]*theta + cls._n[2]*(theta**2)
             return p*1000
@@ -73,20 +77,81 @@ class Boundary23:
         else:
             return None
 
+    @classmethod
+    def getPressArray(cls, t):
+        """Find pressure at boundary line between region 2 and region 3 for array of temperatures.
+
+        Limit
+        -----
+        Valid for:
+            623.15 K <= t <= 863.15 K or 350 C <= t <= 800 C.
+
+        Parameters
+        ----------
+        t: array_like
+            temperature (K).
+
+        Returns
+        -------
+        p: ndarray
+            presssure (KPa), nan where temperature(t) is not in or exceed range of limit.
+        valid: ndarray
+            boolean mask, True where temperature(t) is in range of limit.
+        """
+
+        import numpy as np
+
+        t = np.asarray(t, dtype=float)
+        valid = (623.15 <= t) & (t <= 863.15)
+        p = (cls._n[0] + cls._n[1]*t + cls._n[2]*(t**2))*1000
+        return np.where(valid, p, np.nan), valid
+
+    @classmethod
+    def getTempArray(cls, p):
+        """Find temperature at boundary line between region 2 and region 3 for array of pressures.
+
+        Limit
+        -----
+        Valid for:
+            16.5291643e3 KPa <= p <= 1e5 KPa or 16.5291643 MPa <= p <= 100 MPa.
+
+        Parameters
+        ----------
+        p: array_like
+            presssure (KPa).
+
+        Returns
+        -------
+        t: ndarray
+            temperature (K), nan where pressure(p) is not in or exceed range of limit.
+        valid: ndarray
+            boolean mask, True where pressure(p) is in range of limit.
+        """
+
+        import numpy as np
+
+        p = np.asarray(p, dtype=float)
+        valid = (16.5291643e3 <= p) & (p <= 1e5)
+
+        #states out of range of limit are evaluated at lower limit and replaced by nan
+        pi = np.where(valid, p, 16.5291643e3)/1000
+        t = cls._n[3] + np.sqrt((pi - cls._n[4])/cls._n[2])
+        return np.where(valid, t, np.nan), valid
+
 
 def temp3(p, desc):
     """Boundary equations for subregion 3.
 
     Parameters
     ----------
-    p: float
+    p: float or ndarray
         presssure (KPa).
     desc: str
         input key, one of: "3ab", "3cd", "3gh", "3ij", "3jk", "3mn", "3op", "3qu", "3rx", "3uv", "3wx".
 
     Returns
     -------
-    t: float or None
+    t: float or ndarray or None
         return temperature (K) or None if value of desc is wrong key.
 
 
@@ -94,27 +159,18 @@ def temp3(p, desc):
     """
 
     pi = p/1e3
+    key = desc.lower() if desc else desc
 
-    if desc and desc.lower() in InBoundT3.keys():
-        if desc.lower() != "3ab" and desc.lower() != "3ef" and desc.lower() != "3op" and desc.lower() != "3wx":
-            koef = InBoundT3[desc.lower()]
-
-            theta = 0.
-            for ni, Ii in zip(koef["n"], koef["I"]):
-                theta += ni*(pi**Ii)
+    if (koef := BOUNDT3.get(key)) is not None:
+        x = log(pi) if koef.islog else pi
 
-            t = theta*1
-            return t
-        elif desc.lower() == "3ab" or desc.lower() == "3op" or desc.lower() == "3wx":
-            koef = InBoundT3[desc.lower()]
+        theta = 0.
+        for ni, Ii in koef.terms:
+            theta += ni*(x**Ii)
 
-            theta = 0.
-            for ni, Ii in zip(koef["n"], koef["I"]):
-                theta += ni*(log(pi)**Ii)
-
-            t = theta*1
-            return t
-    elif desc and desc.lower() == "3ef":
+        t = theta*1
+        return t
+    elif key == "3ef":
         t = 3.727888004*(pi-22.064)+647.096
         return t
     else:
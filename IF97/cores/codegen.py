@@ -0,0 +1,216 @@
+"""This module generates specialised straight-line kernels from compiled coefficient tables.
+
+For every table a Python module of functions without loops is emitted, each sum is Horner-factored in both
+variables, sum(n*(x**I)*(y**J)) = x**I0*(q0(y)+x**(I1-I0)*(q1(y)+...)) where each qk(y) is Horner-factored in y.
+Terms with zero coefficient (e.g. n*I*(I-1) for I = 0 or 1) are dropped from derivative sums.
+
+Generated modules are kept in memory by default. If environment variable IF97_CACHE_DIR is set to a directory, they
+are written there and imported from there on later runs, source is hashed into the file name so changed coefficients
+or generator never load stale modules, and files of older sources of the same table are deleted. Empty
+IF97_CACHE_DIR or unwritable directory keeps generated modules in memory only. Modules are generated lazily on first
+use of each table.
+"""
+
+import glob
+import os
+import re
+import types
+
+
+#version of generator, part of hashed source
+VERSION = 2
+
+#loaded modules by name of table
+_modules = {}
+
+
+def cacheDir():
+    """Directory of generated modules.
+
+    Returns
+    -------
+    path: str or None
+        path of cache directory from IF97_CACHE_DIR, or None if it is not set or empty (memory only).
+    """
+
+    return os.environ.get("IF97_CACHE_DIR") or None
+
+
+def _num(c):
+    """Exact literal of float coefficient."""
+
+    return repr(float(c))
+
+
+def _powName(var, e):
+    """Name of local variable holding var**e."""
+
+    return f"{var}_{e}" if e >= 0 else f"{var}_m{-e}"
+
+
+def _horner(lines, name, pairs, var, powers):
+    """Emit Horner scheme of sum(c*(var**e)) over pairs (e, c) into lines, result in local variable name.
+
+    Coefficients c are literals or names of local variables, powers collects exponents used of var.
+    """
+
+    pairs = sorted(pairs)
+    exps = [e for e, _ in pairs]
+
+    def mul(e):
+        if e == 1:
+            return var
+        powers.add(e)
+        return _powName(var, e)
+
+    lines.append(f"    {name} = {pairs[-1][1]}")
+    for k in range(len(pairs)-2, -1, -1):
+        c = pairs[k][1]
+        sign = "-" if c.startswith("-") else "+"
+        lines.append(f"    {name} = {name}*{mul(exps[k+1]-exps[k])}{sign}{c.lstrip('-')}")
+    if exps[0] != 0:
+        lines.append(f"    {name} = {name}*{mul(exps[0])}")
+
+
+def _sum(lines, name, terms, xpow, ypow):
+    """Emit sum(c*(x**a)*(y**b)) over terms (c, a, b) into lines, result in local variable name."""
+
+    groups = {}
+    for c, a, b in terms:
+        if c != 0.:
+            groups.setdefault(a, []).append((b, _num(c)))
+
+    if not groups:
+        lines.append(f"    {name} = 0.")
+        return
+
+    outer = []
+    for k, a in enumerate(sorted(groups)):
+        inner = f"{name}_{k}"
+        _horner(lines, inner, groups[a], "y", ypow)
+        outer.append((a, inner))
+    _horner(lines, name, outer, "x", xpow)
+
+
+def generateSource(table):
+    """Generate source of kernel module of compiled table.
+
+    Parameters
+    ----------
+    table: PolyTable
+        compiled coefficients and exponents, see coefficients.PolyTable.
+
+    Returns
+    -------
+    source: str
+        source of module with function polysum(x, y) returning same as kernel.polysum if order of table is 2,
+        or function polyval(x, y) returning same as kernel.polyval if order of table is 0. Modules of order 2
+        also have one function for each sum, g, dgdx, d2gdx2, dgdy, d2gdy2 and d2gdxdy, collected in tuple SUMS.
+    """
+
+    I = [Ii for Ii, _ in table.exponents]
+    J = [Ji for _, Ji in table.exponents]
+    coef = table.rows
+
+    if table.order == 2:
+        func = "polysum"
+        names = ("g", "dgdx", "d2gdx2", "dgdy", "d2gdy2", "d2gdxdy")
+        shifts = ((0, 0), (1, 0), (2, 0), (0, 1), (0, 2), (1, 1))
+    else:
+        func = "polyval"
+        names = ("g",)
+        shifts = ((0, 0),)
+
+    lines = [f'"""Generated by IF97.cores.codegen version {VERSION} from table {table.name}, do not edit."""']
+    sums = [[(c, Ii-kx, Ji-ky) for c, Ii, Ji in zip(row, I, J)] for row, (kx, ky) in zip(coef, shifts)]
+    _function(lines, func, names, sums)
+
+    if table.order == 2:
+        #one function for each sum, used when only some derivatives are needed
+        for name, terms in zip(names, sums):
+            _function(lines, name, (name,), (terms,))
+        lines += ["", "", f"SUMS = ({', '.join(names)})"]
+    return "\n".join(lines)+"\n"
+
+
+def _function(lines, func, names, sums):
+    """Emit function func(x, y) returning sums (lists of terms (c, a, b)) as local variables names into lines."""
+
+    body = []
+    xpow = set()
+    ypow = set()
+    for name, terms in zip(names, sums):
+        _sum(body, name, terms, xpow, ypow)
+
+    lines += ["", "", f"def {func}(x, y):"]
+    lines += [f"    {_powName('x', e)} = x**{e}" for e in sorted(xpow)]
+    lines += [f"    {_powName('y', e)} = y**{e}" for e in sorted(ypow)]
+    lines += body
+    lines.append(f"    return {', '.join(names)}")
+
+
+def _prune(path, name, modname):
+    """Delete generated modules (and their bytecode) of older sources of table name from cache directory path."""
+
+    pattern = re.compile(rf"_if97_{re.escape(name)}_[0-9a-f]{{16}}(\.|$)")
+    for filename in glob.glob(os.path.join(path, "*"))+glob.glob(os.path.join(path, "__pycache__", "*")):
+        base = os.path.basename(filename)
+        if pattern.match(base) and not base.startswith(modname+"."):
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+
+
+def _build(table):
+    """Generate kernel module of table, import it from cache directory or keep it in memory."""
+
+    import hashlib
+    import importlib.util
+
+    source = generateSource(table)
+    digest = hashlib.sha1(source.encode()).hexdigest()[:16]
+    modname = f"_if97_{table.name}_{digest}"
+
+    path = cacheDir()
+    if path:
+        filename = os.path.join(path, modname+".py")
+        try:
+            if not os.path.exists(filename):
+                os.makedirs(path, exist_ok=True)
+                tmp = f"{filename}.{os.getpid()}.tmp"
+                with open(tmp, "w") as file:
+                    file.write(source)
+                os.replace(tmp, filename)
+                _prune(path, table.name, modname)
+
+            spec = importlib.util.spec_from_file_location(modname, filename)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+        except (OSError, SyntaxError):
+            pass
+
+    module = types.ModuleType(modname)
+    exec(compile(source, f"<{modname}>", "exec"), module.__dict__)
+    return module
+
+
+def load(table):
+    """Get generated kernel module of compiled table, generate it on first use.
+
+    Parameters
+    ----------
+    table: PolyTable
+        compiled coefficients and exponents with name, see coefficients.PolyTable.
+
+    Returns
+    -------
+    module: module
+        generated module, see generateSource.
+    """
+
+    module = _modules.get(table.name)
+    if module is None:
+        module = _modules[table.name] = _build(table)
+    return module
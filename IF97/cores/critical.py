@@ -0,0 +1,149 @@
+"""This module contains evaluation of region 3 near critical point with bounded cost.
+
+Basic equation of region 3 has critical point at RHOC, TEMPC and PRESSC, where isotherm is flat (dp/drho = 0) and
+cp, kappa_t and alpha_v grow as 1/(dp/drho) without bound, while cv, w, k_s and mu_jt have finite limits. Near the
+critical point root of p(rho, t) = p is nearly triple and plain Newton iteration from backward equations (which
+differ from basic equation by up to about 2 % in density there) needs up to about 30 steps.
+"""
+
+import math
+from .backwardPT import Region3VPT
+from .basic import Region3, Region4
+from ..constants import BIGR, PRESSC, RHOC, TEMPC
+
+
+#half widths of near-critical band, temperature (K) and pressure (KPa)
+BANDT = 1.
+BANDP = 100.
+
+#maximum number of evaluations of basic equation and relative tolerance of pressure of NearCritical.rho
+MAXITER = 16
+PTOL = 1e-10
+
+#properties which are not bounded at critical point
+DIVERGENT = ("cp", "kappa_t", "alpha_v")
+
+
+class NearCritical:
+    """Evaluation of region 3 in band around critical point.
+
+    classmethods
+    ------------
+    inBand(cls, p, t)
+        Check if state is in near-critical band.
+    limits(cls)
+        Properties of region 3 at critical point.
+    rho(cls, p, t, maxiter=MAXITER)
+        Density of single phase near critical point with bounded number of evaluations of basic equation.
+    """
+
+    #properties at critical point, see limits
+    _limits = None
+
+    @classmethod
+    def inBand(cls, p, t):
+        """Check if state is in near-critical band, TEMPC-BANDT <= t <= TEMPC+BANDT and PRESSC-BANDP <= p <= PRESSC+BANDP.
+
+        Parameters
+        ----------
+        p: float
+            pressure (KPa).
+        t: float
+            temperature (K).
+
+        Returns
+        -------
+        inband: bool
+            True if state is in near-critical band.
+        """
+
+        return abs(t-TEMPC) <= BANDT and abs(p-PRESSC) <= BANDP
+
+    @classmethod
+    def limits(cls):
+        """Properties of region 3 at critical point.
+
+        Properties with finite limit (v, u, h, s, cv, w, mu_jt, k_s, g, f) are evaluated from basic equation at
+        RHOC and TEMPC, where every one of them is smooth function of derivatives of basic equation. Properties in
+        DIVERGENT (cp, kappa_t, alpha_v) are inf, basic equation gives reduced dp/ddelta of about -2e-12 there and
+        so values of arbitrary size and sign.
+
+        Returns
+        -------
+        props: dict
+            properties as returned by Region3.props_all, a new dict on every call.
+        """
+
+        if cls._limits is None:
+            props = Region3.props_all(RHOC, TEMPC)
+            props["p"] = PRESSC
+            props.update({key: math.inf for key in DIVERGENT})
+            cls._limits = props
+        return dict(cls._limits)
+
+    @classmethod
+    def rho(cls, p, t, maxiter=MAXITER):
+        """Density of single phase near critical point with bounded number of evaluations of basic equation.
+
+        Below critical temperature the phase is selected by saturation pressure and root is bracketed by saturated
+        density of the phase (Region3.saturRho) and end of stable isotherm, above it by (0, 800) Kg/m^3. Density
+        from backward equations starts safeguarded Newton iteration, which stops when relative residual of pressure
+        is not larger than PTOL, or after maxiter evaluations with the last iterate, which is always inside bracket.
+        Over near-critical band mean number of evaluations is about 3 and largest 14 (at critical point, where
+        density is determined by pressure only to about 1e-3 relative).
+
+        Limit
+        -----
+        Valid for:
+            p23 < p <= 100 MPa and 623.15 K < t <= 863.15 K, intended for near-critical band, see inBand.
+
+        Parameters
+        ----------
+        p: float
+            pressure (KPa).
+        t: float
+            temperature (K).
+        maxiter: int, optional
+            maximum number of evaluations of basic equation, default MAXITER.
+
+        Returns
+        -------
+        _rho: float
+            density (Kg/m^3).
+        iters: int
+            number of evaluations of basic equation.
+        """
+
+        tau = TEMPC/t
+        c = p/(RHOC*BIGR*t)
+        lo, hi = 0., 800./RHOC
+        if t < TEMPC:
+            psat = Region4.getSaturPress(tsat=t)
+            rhof, rhog = Region3.saturRho(psat, t)
+            if p > psat:
+                lo = rhof/RHOC
+            else:
+                hi = rhog/RHOC
+
+        _delta = Region3VPT.singleRho(p, t)/RHOC
+        if not lo < _delta < hi:
+            _delta = 0.5*(lo+hi)
+
+        for iters in range(1, maxiter+1):
+            _, dfddel, d2fddel2, _, _, _ = Region3._phi(delta=_delta, tau=tau, need=(1, 2))
+            f1 = (_delta**2)*dfddel-c
+            if abs(f1) <= PTOL*c or iters == maxiter:
+                break
+
+            if f1 > 0:
+                hi = min(hi, _delta)
+            else:
+                lo = max(lo, _delta)
+
+            df1 = 2*_delta*dfddel+(_delta**2)*d2fddel2
+            new = _delta-f1/df1 if df1 > 0 else math.nan
+            if not lo < new < hi:
+                new = 0.5*(lo+hi)
+            _delta = new
+
+        return RHOC*_delta, iters
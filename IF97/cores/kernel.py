@@ -0,0 +1,293 @@
+"""This module contains shared kernel to evaluate polynomial sums of basic equations and their derivatives
+
+Numpy is imported by array functions only, scalar inputs never import it.
+"""
+
+from . import codegen
+
+
+#number of elements evaluated at once by arrayPolysum
+CHUNK = 4096
+
+#indices of all six sums returned by polysum
+ALL = frozenset(range(6))
+
+#order of derivative to x and y of each sum, row of xidx/yidx holding its exponents
+SHIFTS = ((0, 0), (1, 0), (2, 0), (0, 1), (0, 2), (1, 1))
+
+
+def polysum(x, y, table, need=None):
+    """Evaluate sum(n*(x**I)*(y**J)) and its first and second partial derivatives.
+
+    Array inputs are broadcast against each other and evaluated by arrayPolysum, scalar inputs are evaluated by
+    kernel generated from table, see codegen. Only sums with index in need are evaluated, other sums are None.
+
+    Parameters
+    ----------
+    x: float or ndarray
+        first variable of basic equation.
+    y: float or ndarray
+        second variable of basic equation.
+    table: PolyTable
+        compiled coefficients and exponents of basic equation, see coefficients.PolyTable.
+    need: collection of int, optional
+        indices of sums to evaluate, in order of returned sums (0 for g to 5 for d2gdxdy), default all sums.
+
+    Returns
+    -------
+    g: float or ndarray
+        value of sum.
+    dgdx: float or ndarray
+        first partial derivative of g to x.
+    d2gdx2: float or ndarray
+        second partial derivative of g to x.
+    dgdy: float or ndarray
+        first partial derivative of g to y.
+    d2gdy2: float or ndarray
+        second partial derivative of g to y.
+    d2gdxdy: float or ndarray
+        partial derivative of g to x and y.
+    """
+
+    if not (isinstance(x, (float, int)) and isinstance(y, (float, int))):
+        return arrayPolysum(x, y, table, need=need)
+    if not table.name:
+        return loopPolysum(x, y, table, need=need)
+
+    module = codegen.load(table)
+    if need is None or ALL.issubset(need):
+        return module.polysum(x, y)
+    return tuple(func(x, y) if k in need else None for k, func in enumerate(module.SUMS))
+
+
+def loopPolysum(x, y, table, need=None):
+    """Evaluate sum(n*(x**I)*(y**J)) and its first and second partial derivatives by loop over terms of table.
+
+    Reference for generated kernels, used for tables without name.
+
+    Parameters
+    ----------
+    x: float
+        first variable of basic equation.
+    y: float
+        second variable of basic equation.
+    table: PolyTable
+        compiled coefficients and exponents of basic equation, see coefficients.PolyTable.
+    need: collection of int, optional
+        indices of sums to evaluate, in order of returned sums (0 for g to 5 for d2gdxdy), default all sums.
+
+    Returns
+    -------
+    g, dgdx, d2gdx2, dgdy, d2gdy2, d2gdxdy: float
+        same as polysum.
+    """
+
+    px = [x**e for e in table.xexp]
+    py = [y**e for e in table.yexp]
+
+    g = 0.
+    dgdx = 0.
+    d2gdx2 = 0.
+    dgdy = 0.
+    d2gdy2 = 0.
+    d2gdxdy = 0.
+
+    for ni, nI, nII, nJ, nJJ, nIJ, ix0, ix1, ix2, iy0, iy1, iy2 in table.terms:
+        g += ni*px[ix0]*py[iy0]
+        dgdx += nI*px[ix1]*py[iy0]
+        d2gdx2 += nII*px[ix2]*py[iy0]
+        dgdy += nJ*px[ix0]*py[iy1]
+        d2gdy2 += nJJ*px[ix0]*py[iy2]
+        d2gdxdy += nIJ*px[ix1]*py[iy1]
+
+    sums = (g, dgdx, d2gdx2, dgdy, d2gdy2, d2gdxdy)
+    if need is None:
+        return sums
+    return tuple(val if k in need else None for k, val in enumerate(sums))
+
+
+def _prepare(x, y, table):
+    """Convert x and y to float64 arrays, with exponents and coefficients of table for type of evaluation.
+
+    Evaluation is in float32 if result type of x and y is float32, then x and y are divided by scales of
+    table.scaled so that no power overflows float32, otherwise evaluation is in float64.
+
+    Returns
+    -------
+    x, y: ndarray
+        variables as float64 arrays, rescaled for float32.
+    coef: ndarray
+        coefficients of type of evaluation.
+    """
+
+    import numpy as np
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if np.result_type(x, y) == np.float32:
+        sx, sy, coef = table.scaled(np.float32)
+        return x.astype(np.float64)/sx, y.astype(np.float64)/sy, coef
+    return x.astype(np.float64, copy=False), y.astype(np.float64, copy=False), table.coef
+
+
+def _ladder(v, exps, dtype):
+    """Powers v**exps as matrix of dtype, computed in float64 (float32 pow is slow on underflow)."""
+
+    return (v[:, None]**exps).astype(dtype, copy=False)
+
+
+def arrayPolysum(x, y, table, chunk=CHUNK, need=None):
+    """Evaluate sum(n*(x**I)*(y**J)) and its first and second partial derivatives for arrays of x and y.
+
+    Power ladders are built as matrices of shape (m, number of exponents) and every sum is reduced as one
+    matrix-vector product over coefficients, inputs are processed in chunks of m elements to bound memory.
+    Column x of shape (m, 1) with 1-D y or row y of shape (1, k) is evaluated as full grid by gridPolysum, other
+    shapes (columns x and y of shape (m, 1) are m states) are broadcast element by element. Float32 inputs are
+    evaluated in float32 with rescaled coefficients, see coefficients.PolyTable.scaled, other inputs in float64.
+
+    Parameters
+    ----------
+    x: array_like
+        first variable of basic equation.
+    y: array_like
+        second variable of basic equation.
+    table: PolyTable
+        compiled coefficients and exponents of basic equation, see coefficients.PolyTable.
+    chunk: int
+        number of elements evaluated at once.
+    need: collection of int, optional
+        indices of sums to evaluate, in order of returned sums (0 for g to 5 for d2gdxdy), default all sums.
+
+    Returns
+    -------
+    g, dgdx, d2gdx2, dgdy, d2gdy2, d2gdxdy: ndarray
+        same as polysum, with broadcast shape of x and y.
+    """
+
+    import numpy as np
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x.ndim == 2 and x.shape[1] == 1 and (y.ndim == 1 or (y.ndim == 2 and y.shape[0] == 1)):
+        return gridPolysum(x[:, 0], y.ravel(), table, need=need)
+
+    x, y, coef = _prepare(x, y, table)
+    x, y = np.broadcast_arrays(x, y)
+    shape = x.shape
+    x = x.ravel()
+    y = y.ravel()
+
+    need = ALL if need is None else frozenset(need)
+    xidx = table.xidx
+    yidx = table.yidx
+
+    out = [np.empty(x.size, dtype=coef.dtype) if k in need else None for k in range(6)]
+    for start in range(0, x.size, chunk):
+        stop = start+chunk
+        px = _ladder(x[start:stop], table.xexparr, coef.dtype)
+        py = _ladder(y[start:stop], table.yexparr, coef.dtype)
+
+        for k in need:
+            kx, ky = SHIFTS[k]
+            out[k][start:stop] = (px[:, xidx[kx]]*py[:, yidx[ky]])@coef[k]
+
+    return tuple(None if row is None else row.reshape(shape) for row in out)
+
+
+def gridPolysum(x, y, table, need=None):
+    """Evaluate sum(n*(x**I)*(y**J)) and its first and second partial derivatives on full grid of x and y.
+
+    Every term is separable, so on grid each sum is A*diag(c)*B^T where rows of A and B are power ladders of x
+    and y gathered at exponents of the terms and c is coefficients of the sum, each sum is one matrix product.
+
+    Parameters
+    ----------
+    x: array_like
+        1-D array of first variable of basic equation, with m elements.
+    y: array_like
+        1-D array of second variable of basic equation, with k elements.
+    table: PolyTable
+        compiled coefficients and exponents of basic equation, see coefficients.PolyTable.
+    need: collection of int, optional
+        indices of sums to evaluate, in order of returned sums (0 for g to 5 for d2gdxdy), default all sums.
+
+    Returns
+    -------
+    g, dgdx, d2gdx2, dgdy, d2gdy2, d2gdxdy: ndarray
+        same as polysum, with shape (m, k) and element [i, j] evaluated at x[i] and y[j].
+    """
+
+    x, y, coef = _prepare(x, y, table)
+    px = _ladder(x, table.xexparr, coef.dtype)
+    py = _ladder(y, table.yexparr, coef.dtype)
+    need = ALL if need is None else frozenset(need)
+
+    out = [None]*6
+    for k in need:
+        kx, ky = SHIFTS[k]
+        out[k] = (px[:, table.xidx[kx]]*coef[k])@py[:, table.yidx[ky]].T
+
+    return tuple(out)
+
+
+def polyval(x, y, table):
+    """Evaluate sum(n*(x**I)*(y**J)) without derivatives.
+
+    Inputs are evaluated by kernel generated from table, see codegen, straight-line Horner scheme of kernel is
+    evaluated elementwise on arrays as well. Tables without name are evaluated by power ladders.
+
+    Parameters
+    ----------
+    x: float or ndarray
+        first variable of equation.
+    y: float or ndarray
+        second variable of equation.
+    table: PolyTable
+        compiled coefficients and exponents of equation, see coefficients.PolyTable.
+
+    Returns
+    -------
+    g: float or ndarray
+        value of sum, with broadcast shape of x and y for array inputs.
+    """
+
+    if not (isinstance(x, (float, int)) and isinstance(y, (float, int))):
+        import numpy as np
+
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        if table.name:
+            return codegen.load(table).polyval(x, y)
+        px = x[..., None]**table.xexparr
+        py = y[..., None]**table.yexparr
+        return (px[..., table.xidx[0]]*py[..., table.yidx[0]])@table.coef[0]
+    if table.name:
+        return codegen.load(table).polyval(x, y)
+    return loopPolyval(x, y, table)
+
+
+def loopPolyval(x, y, table):
+    """Evaluate sum(n*(x**I)*(y**J)) by loop over terms of table, reference for generated kernels.
+
+    Parameters
+    ----------
+    x: float
+        first variable of equation.
+    y: float
+        second variable of equation.
+    table: PolyTable
+        compiled coefficients and exponents of equation, see coefficients.PolyTable.
+
+    Returns
+    -------
+    g: float
+        value of sum.
+    """
+
+    px = [x**e for e in table.xexp]
+    py = [y**e for e in table.yexp]
+
+    g = 0.
+    for ni, ix0, iy0 in table.terms:
+        g += ni*px[ix0]*py[iy0]
+
+    return g
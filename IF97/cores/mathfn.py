@@ -0,0 +1,43 @@
+"""This module contains elementary functions shared by scalar and array evaluation.
+
+Python numbers (and numpy float64 scalars, which are subclass of float) are evaluated by module math, so single-point
+calls never create numpy scalars or import numpy, arrays are evaluated by numpy. Out of domain scalars return nan or -inf like numpy,
+without raising ValueError.
+"""
+
+import math
+
+
+def log(x):
+    """Natural logarithm of x."""
+
+    if isinstance(x, (float, int)):
+        if x > 0:
+            return math.log(x)
+        return -math.inf if x == 0 else math.nan
+
+    import numpy as np
+    return np.log(x)
+
+
+def sqrt(x):
+    """Square root of x."""
+
+    if isinstance(x, (float, int)):
+        return math.sqrt(x) if x >= 0 else math.nan
+
+    import numpy as np
+    return np.sqrt(x)
+
+
+def exp(x):
+    """Exponential of x."""
+
+    if isinstance(x, (float, int)):
+        try:
+            return math.exp(x)
+        except OverflowError:
+            return math.inf
+
+    import numpy as np
+    return np.exp(x)
@@ -1,5 +1,8 @@
 import unittest
-from IF97.cores.backwardPT import Region3VPT
+import numpy as np
+from IF97 import if97
+from IF97.cores.backwardPT import Region3VPT, SUBREGIONS, _boundary
+from IF97.cores.basic import Region3
 
 
 class TestBackwardPT(unittest.TestCase):
@@ -187,5 +190,60 @@ class TestBackwardPT(unittest.TestCase):
         self.assertAlmostEqual(Region3VPT.volPT(p=22.064e3, t=647.15, desc="3z"), v2, delta=1e-12)
 
 
+    def test_exact(self):
+        for p, t in ((50e3, 630), (25e3, 650), (22.8e3, 649), (21.1e3, 644), (20e3, 640), (1e5, 750)):
+            rho = Region3VPT.singleRho(p, t)
+            _rho = Region3VPT.singleRho(p, t, exact=True)
+
+            self.assertAlmostEqual(_rho, rho, delta=1e-3*rho)
+            self.assertAlmostEqual(Region3.props_all(_rho, t, props=("p",))["p"], p, delta=1e-11*p)
+            self.assertAlmostEqual(if97(p=p, t=t, exact=True)["v"], 1/_rho, delta=1e-15)
+
+
+    def test_subregion(self):
+        #two points inside every subregion
+        points = ((50e3, 630, "3a"), (80e3, 670, "3a"), (50e3, 710, "3b"), (80e3, 750, "3b"), (20e3, 630, "3c"), (30e3, 650, "3c"),
+                  (26e3, 656, "3d"), (30e3, 670, "3d"), (26e3, 661, "3e"), (30e3, 675, "3e"), (26e3, 671, "3f"), (30e3, 690, "3f"),
+                  (23.6e3, 649, "3g"), (24e3, 650, "3g"), (23.6e3, 652, "3h"), (24e3, 654, "3h"), (23.6e3, 653, "3i"), (24e3, 655, "3i"),
+                  (23.5e3, 655, "3j"), (24e3, 660, "3j"), (23e3, 660, "3k"), (24e3, 670, "3k"), (22.6e3, 646, "3l"), (23e3, 646, "3l"),
+                  (22.6e3, 648.6, "3m"), (22.8e3, 649.3, "3m"), (22.6e3, 649, "3n"), (22.8e3, 649.7, "3n"), (22.6e3, 649.1, "3o"),
+                  (22.8e3, 649.9, "3o"), (22.6e3, 649.4, "3p"), (22.8e3, 650.2, "3p"), (21.1e3, 640, "3q"), (21.8e3, 643, "3q"),
+                  (21.1e3, 644, "3r"), (21.8e3, 648, "3r"), (19.1e3, 635, "3s"), (20e3, 638, "3s"), (17e3, 626, "3t"), (20e3, 640, "3t"),
+                  (21.5e3, 644.6, "3u"), (22e3, 646.1, "3u"), (22.5e3, 648.6, "3v"), (22.3e3, 647.9, "3v"), (22.15e3, 647.5, "3w"),
+                  (22.3e3, 648.1, "3w"), (22.11e3, 648, "3x"), (22e3, 647.5, "3x"), (22e3, 646.84, "3y"), (22.064e3, 647.05, "3y"),
+                  (22e3, 646.89, "3z"), (22.064e3, 647.15, "3z"))
+        for p, t, desc in points:
+            self.assertEqual(Region3VPT.subregion(p, t), desc, msg=f"{p} {t}")
+
+        p = np.array([p for p, _, _ in points]+[10e3, 50e3])
+        t = np.array([t for _, t, _ in points]+[650, 900])
+        codes = [SUBREGIONS.index(desc)+1 for _, _, desc in points]+[0, 0]
+        np.testing.assert_array_equal(Region3VPT.subregion(p, t), codes)
+        self.assertIsNone(Region3VPT.subregion(10e3, 650))
+
+        #int pressure takes scalar path of boundaries
+        self.assertIsInstance(_boundary(20000, "sat"), float)
+        self.assertEqual(Region3VPT.subregion(20000, 638), "3s")
+
+    def test_array(self):
+        p, t = np.meshgrid(np.linspace(16e3, 1e5, 80), np.linspace(620, 870, 90))
+        rho = Region3VPT.singleRho(p, t)
+        _rho = Region3VPT.singleRho(p, t, exact=True)
+        self.assertEqual(rho.shape, p.shape)
+
+        for pi, ti, ri, _ri in zip(p.ravel(), t.ravel(), rho.ravel(), _rho.ravel()):
+            desired = Region3VPT.singleRho(float(pi), float(ti))
+            if desired is None:
+                self.assertTrue(np.isnan(ri) and np.isnan(_ri))
+            else:
+                self.assertAlmostEqual(ri, desired, delta=1e-12*desired)
+                self.assertAlmostEqual(_ri, Region3VPT.singleRho(float(pi), float(ti), exact=True), delta=1e-12*desired)
+
+        codes = np.array([1, 14, 26, 0])
+        v = Region3VPT.volPT(np.array([50e3, 22.6e3, 22e3, 50e3]), np.array([630, 649, 646.89, 900]), codes)
+        np.testing.assert_allclose(v[:3], [1.470853100e-3, 2.923432711e-3, 3.798732962e-3], rtol=1e-9)
+        self.assertTrue(np.isnan(v[3]))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
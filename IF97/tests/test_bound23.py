@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from IF97.cores.boundary import Boundary23
 
 
@@ -14,6 +15,18 @@ class TestBoundary23(unittest.TestCase):
 
         self.assertAlmostEqual(Boundary23.getTemp(p=0.165291643e5), t_des, delta=1e-3)
 
+    def test_array(self):
+        t = np.array([600, 623.15, 700, 863.15, 900])
+        p, valid = Boundary23.getPressArray(t)
+        np.testing.assert_array_equal(valid, [False, True, True, True, False])
+        np.testing.assert_allclose(p[valid], [Boundary23.getPress(ti) for ti in t[valid]], rtol=1e-15)
+        self.assertTrue(np.isnan(p[~valid]).all())
+
+        _t, valid = Boundary23.getTempArray(p=np.array([1e4, 0.165291643e5, 5e4, 1e5, 2e5]))
+        np.testing.assert_array_equal(valid, [False, True, True, True, False])
+        np.testing.assert_allclose(_t[valid], [Boundary23.getTemp(pi) for pi in (0.165291643e5, 5e4, 1e5)], rtol=1e-15)
+        self.assertTrue(np.isnan(_t[~valid]).all())
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from IF97.coefficients import REG1, REG2, REG3, REG5, VPTREG3
+from IF97.cores import codegen, kernel
+
+
+class TestCodegen(unittest.TestCase):
+
+    def test_basic(self):
+        for table, x, y in ((REG1, 7.1-3e3/16.53e3, 1386/300-1.222), (REG2, 3.5/1e3, 540/700-0.5), (REG3, 500/322, 647.096/650),
+                            (REG5, 30e3/1e3, 1000/1500)):
+            np.testing.assert_allclose(kernel.polysum(x, y, table), kernel.loopPolysum(x, y, table), rtol=1e-11)
+
+    def test_vpt(self):
+        for key, koef in VPTREG3.items():
+            self.assertAlmostEqual(kernel.polyval(0.9, 0.9, koef.poly)/kernel.loopPolyval(0.9, 0.9, koef.poly), 1., delta=1e-12, msg=key)
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as path, mock.patch.dict(os.environ, {"IF97_CACHE_DIR": path}):
+            module = codegen._build(REG5)
+            files = [name for name in os.listdir(path) if name.endswith(".py")]
+            self.assertEqual(len(files), 1)
+            self.assertEqual(module.__file__, os.path.join(path, files[0]))
+
+            self.assertEqual(codegen._build(REG5).__file__, module.__file__)
+            self.assertEqual([name for name in os.listdir(path) if name.endswith(".py")], files)
+
+    def test_prune(self):
+        with tempfile.TemporaryDirectory() as path, mock.patch.dict(os.environ, {"IF97_CACHE_DIR": path}):
+            stale = ("_if97_reg5_0123456789abcdef.py", os.path.join("__pycache__", "_if97_reg5_0123456789abcdef.cpython.pyc"))
+            other = ("_if97_reg2supp_0123456789abcdef.py", "notes.txt")
+            os.makedirs(os.path.join(path, "__pycache__"))
+            for name in stale+other:
+                open(os.path.join(path, name), "w").close()
+
+            module = codegen._build(REG5)
+            self.assertTrue(os.path.exists(module.__file__))
+            for name in stale:
+                self.assertFalse(os.path.exists(os.path.join(path, name)))
+            for name in other:
+                self.assertTrue(os.path.exists(os.path.join(path, name)))
+
+    def test_memory_cache(self):
+        with mock.patch.dict(os.environ, {}):
+            os.environ.pop("IF97_CACHE_DIR", None)
+            self.assertIsNone(codegen.cacheDir())
+
+        with mock.patch.dict(os.environ, {"IF97_CACHE_DIR": ""}):
+            module = codegen._build(REG5)
+            self.assertFalse(hasattr(module, "__file__"))
+            self.assertEqual(module.polysum(30., 2/3), kernel.polysum(30., 2/3, REG5))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,54 @@
+import math
+import unittest
+from IF97 import if97, saturationP, saturationT, visc
+from IF97.constants import PRESSC, RHOC, TEMPC
+from IF97.cores.basic import Region3
+from IF97.cores.critical import MAXITER, NearCritical
+
+
+class TestCritical(unittest.TestCase):
+
+    def test_limits(self):
+        crit = NearCritical.limits()
+        for key in ("cp", "kappa_t", "alpha_v"):
+            self.assertEqual(crit[key], math.inf)
+        for key in ("v", "h", "s", "cv", "w", "mu_jt", "k_s"):
+            self.assertTrue(math.isfinite(crit[key]))
+        self.assertAlmostEqual(crit["v"], 1/RHOC, delta=1e-15)
+
+        #limits are continuous along critical isochore
+        above = Region3.props_all(RHOC, TEMPC+1e-3)
+        for key in ("cv", "w", "mu_jt"):
+            self.assertAlmostEqual(crit[key], above[key], delta=2e-2*abs(crit[key]))
+
+    def test_saturation(self):
+        for ans in (saturationT(TEMPC), saturationP(PRESSC), if97(t=TEMPC, x=0.5), if97(p=PRESSC, x=0.5)):
+            cv = ans["cv"][0] if isinstance(ans["cv"], list) else ans["cv"]
+            mu = ans["mu"][0] if isinstance(ans["mu"], list) else ans["mu"]
+            self.assertAlmostEqual(cv, NearCritical.limits()["cv"], delta=1e-12)
+            self.assertAlmostEqual(mu, visc(RHOC, TEMPC), delta=1e-15)
+
+        ans = if97(p=PRESSC, t=TEMPC)
+        self.assertEqual(ans["cp"], math.inf)
+        self.assertTrue(math.isfinite(ans["cv"]) and math.isfinite(ans["mu"]))
+
+    def test_rho(self):
+        for k in range(-4, 5):
+            for j in range(-4, 5):
+                p = PRESSC+25.*k
+                t = TEMPC+0.25*j
+                rho, iters = NearCritical.rho(p, t)
+                self.assertTrue(iters <= MAXITER)
+                self.assertAlmostEqual(Region3.props_all(rho, t, props=("p",))["p"], p, delta=1e-9*p)
+                if (p, t) != (PRESSC, TEMPC):
+                    self.assertAlmostEqual(if97(p=p, t=t, exact=True)["v"], 1/rho, delta=1e-15)
+
+        #phase below critical temperature follows saturation pressure
+        psat = saturationT(TEMPC-0.5)["psat"]
+        rhof, rhog = Region3.saturRho(psat, TEMPC-0.5)
+        self.assertTrue(NearCritical.rho(psat-1., TEMPC-0.5)[0] < rhog)
+        self.assertTrue(NearCritical.rho(psat+1., TEMPC-0.5)[0] > rhof)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
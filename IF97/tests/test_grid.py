@@ -0,0 +1,78 @@
+import math
+import unittest
+import numpy as np
+from IF97 import if97, if97_grid
+from IF97._grid import _regionCodes
+
+
+class TestGrid(unittest.TestCase):
+
+    def test_grid(self):
+        p = np.array([0.5, 3.5, 3e3, 20e3, 25e3, 45e3, 80e3, 1e5, 1.5e5])
+        t = np.array([250, 300, 500, 623.15, 640, 650, 700, 800, 1000, 1100, 1500, 2000, 2500])
+        ans = if97_grid(p, t)
+
+        for i, pi in enumerate(p):
+            for j, tj in enumerate(t):
+                try:
+                    desired = if97(p=pi, t=tj)
+                except ValueError:
+                    desired = None
+
+                for key in ("v", "u", "h", "s", "cp", "cv", "w", "kappa_t", "alpha_v", "mu_jt", "k_s", "g", "f", "mu"):
+                    if desired is None or desired[key] is None:
+                        self.assertTrue(math.isnan(ans[key][i, j]))
+                    else:
+                        self.assertAlmostEqual(ans[key][i, j], desired[key], delta=1e-10*max(1., abs(desired[key])))
+
+    def test_float32(self):
+        """Relative error of float32 against float64 over each region within bounds documented in if97_grid.
+
+        u, h, s, g and f of region 1 vanish at reference state (liquid at triple point), where float32 has no
+        relative accuracy, so they are checked to absolute error of 1e-6 of their largest magnitude in region 1.
+        """
+
+        p = np.geomspace(1, 1e5, 60)
+        t = np.linspace(273.15, 2273.15, 70)
+        desired = if97_grid(p, t)
+        ans = if97_grid(p, t, dtype=np.float32)
+        codes = _regionCodes(p[:, None], t[None, :])
+
+        #region: (largest relative error, of v), region 3 is float64 stored as float32
+        bounds = {1: (3e-3, 2e-5), 2: (5e-5, 5e-5), 3: (1e-7, 1e-7), 5: (2e-6, 2e-6)}
+        for key in desired:
+            self.assertEqual(ans[key].dtype, np.float32)
+            np.testing.assert_array_equal(np.isnan(ans[key]), np.isnan(desired[key]))
+            for region, (rtol, vtol) in bounds.items():
+                cells = codes == region
+                if key == "mu":
+                    #viscosity is evaluated in float32 in every region
+                    rtol = 2e-5
+                    cells &= ~np.isnan(desired[key])
+                elif key == "v":
+                    rtol = vtol
+                elif region == 1 and key in ("u", "h", "s", "g", "f"):
+                    atol = 1e-6*np.max(np.abs(desired[key][cells]))
+                    np.testing.assert_allclose(ans[key][cells], desired[key][cells], rtol=0, atol=atol, err_msg=key)
+                    continue
+                np.testing.assert_allclose(ans[key][cells], desired[key][cells], rtol=rtol, err_msg=f"{key} {region}")
+
+    def test_shape(self):
+        ans = if97_grid([1e3, 2e3], [300, 400, 500])
+
+        self.assertEqual(ans["h"].shape, (2, 3))
+
+
+    def test_props(self):
+        p = np.geomspace(1, 1e5, 20)
+        t = np.linspace(273.15, 2273.15, 30)
+        for dtype in (np.float64, np.float32):
+            full = if97_grid(p, t, dtype=dtype)
+            ans = if97_grid(p, t, dtype=dtype, props=("h", "s", "mu"))
+            self.assertEqual(set(ans), {"h", "s", "mu"})
+            for key in ans:
+                np.testing.assert_array_equal(ans[key], full[key])
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,78 @@
+import unittest
+from unittest import mock
+from IF97 import if97, saturationP, saturationT, visc
+from IF97._if97 import _PROPS
+from IF97.constants import PRESSC, TEMPC
+from IF97.cores.backwardPT import Region3VPT
+from IF97.cores.basic import PSAT273, PSAT623, Region1, Region2, Region3, Region4, Region5
+
+
+class TestIf97(unittest.TestCase):
+
+    def test_singlephase(self):
+        rho = Region3VPT.singleRho(25e3, 650.)
+        for (p, t), ans in (((3e3, 300.), Region1.props_all(3e3, 300.)), ((3.5, 700.), Region2.props_all(3.5, 700.)),
+                            ((30e3, 700.), Region2.props_all(30e3, 700.)), ((25e3, 650.), Region3.props_all(rho, 650.)),
+                            ((3e3, 1500.), Region5.props_all(3e3, 1500.))):
+            props = if97(p=p, t=t)
+            for key in ("v", "h", "s", "cp", "w"):
+                self.assertEqual(props[key], ans[key])
+            self.assertEqual(props["mu"], visc(1/ans["v"], t) if t <= 1173.15 else None)
+
+    def test_mixed(self):
+        for ans, pair in ((if97(t=400, x=0.25), saturationT(400)), (if97(t=640, x=0.25), saturationT(640)),
+                          (if97(p=1e3, x=0.25), saturationP(1e3)), (if97(p=20e3, x=0.25), saturationP(20e3))):
+            self.assertEqual((ans["psat"], ans["tsat"]), (pair["psat"], pair["tsat"]))
+            for key in ("v", "h", "s", "cp"):
+                liq, vap = pair[key]
+                self.assertAlmostEqual(ans[key], liq+0.25*(vap-liq), delta=1e-12*abs(liq))
+            self.assertAlmostEqual(ans["mu"], visc(1/ans["v"], ans["tsat"]), delta=1e-18)
+
+        #saturation pressure of 623.15 K is still region 1 and 2
+        ans = saturationP(PSAT623)
+        self.assertEqual(ans["h"][0], Region1.props_all(PSAT623, Region4.getSaturTemp(psat=PSAT623))["h"])
+        self.assertIsNotNone(saturationP(PSAT273))
+        self.assertIsNone(saturationP(PSAT273*(1-1e-12)))
+        self.assertEqual(if97(p=PRESSC, x=0.5)["tsat"], TEMPC)
+
+    def test_errors(self):
+        messages = (
+            (dict(t=300, x=1.5), "Quality(x)"),
+            (dict(t=700, x=0.5), "Value of saturation temperature(t)"),
+            (dict(p=3e4, x=0.5), "Value of saturation pressure(p)"),
+            (dict(p=3e3, t=200), "Value of temperature(t)"),
+            (dict(p=6e4, t=1500), "Value of temperature(t)"),
+            (dict(p=2e5, t=300), "Value of pressure(p) exceed"),
+            (dict(p=2e5, t=3000), "Value of pressure(p) or temperature(t)"),
+            (dict(p=3e3), "Inputs must be"),
+            (dict(p=3e3, t=300, x=0.5), "Inputs must be"),
+        )
+        for kwargs, message in messages:
+            with self.assertRaises(ValueError) as context:
+                if97(**kwargs)
+            self.assertTrue(str(context.exception).startswith(message), kwargs)
+
+
+    def test_props(self):
+        for kwargs in (dict(p=3e3, t=300), dict(p=25e3, t=650), dict(p=PRESSC, t=TEMPC), dict(p=3e3, t=1500),
+                       dict(t=400, x=0.25), dict(t=640, x=0.25), dict(p=PRESSC, x=0.25)):
+            full = if97(**kwargs)
+            self.assertEqual(set(full), set(_PROPS) | {"mu"} | ({"psat", "tsat"} if "x" in kwargs else set()))
+            for props in (("h", "s"), ("MU", "v"), ("tsat", "unknown"), "cp", ()):
+                names = {props.lower()} if isinstance(props, str) else {prop.lower() for prop in props}
+                self.assertEqual(if97(**kwargs, props=props), {key: full[key] for key in full if key in names}, kwargs)
+
+        for ans, full in ((saturationT(400, props=("h", "psat")), saturationT(400)),
+                          (saturationP(20e3, props=("h", "psat")), saturationP(20e3)),
+                          (saturationT(TEMPC, props=("h", "psat")), saturationT(TEMPC))):
+            self.assertEqual(ans, {"psat": full["psat"], "h": full["h"]})
+
+        #viscosity is evaluated only if mu is requested
+        with mock.patch("IF97._if97.visc", side_effect=AssertionError):
+            if97(p=3e3, t=300, props=("h", "s"))
+            if97(t=400, x=0.5, props=("h", "s"))
+            saturationP(1e3, props=("h", "s"))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
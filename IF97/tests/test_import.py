@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+import unittest
+import IF97
+
+
+class TestImport(unittest.TestCase):
+
+    def run_python(self, statement):
+        root = os.path.dirname(os.path.dirname(IF97.__file__))
+        return subprocess.run([sys.executable, "-c", statement], cwd=root, check=True, capture_output=True, text=True).stdout.split()
+
+    def test_lazy(self):
+        statement = ("import sys; import IF97; IF97.if97(p=3e3, t=300); IF97.if97(p=1e3, x=0.5); IF97.region_of(25e3, 650); "
+                     "print(*(name in sys.modules for name in ('numpy', 'scipy', 'IF97.coefficients._IJnVPTReg3')))")
+
+        self.assertEqual(self.run_python(statement), ["False", "False", "False"])
+
+    def test_on_demand(self):
+        statement = ("import sys; import IF97; from IF97 import if97_grid, if97_many, jacobian; from IF97.coefficients import VPTREG3; "
+                     "IF97.if97(p=25e3, t=650); print(callable(if97_grid), callable(if97_many), callable(jacobian), len(VPTREG3), "
+                     "'numpy' in sys.modules)")
+
+        self.assertEqual(self.run_python(statement), ["True", "True", "True", "26", "True"])
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
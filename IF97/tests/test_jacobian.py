@@ -0,0 +1,61 @@
+import math
+import unittest
+import numpy as np
+from IF97 import if97, jacobian
+from IF97.cores.backwardPT import Region3VPT
+from IF97.cores.basic import Region3
+
+
+class TestJacobian(unittest.TestCase):
+
+    def test_jacobian(self):
+        #states in region 1, 2 and 5
+        for p, t in ((3e3, 300), (3.5, 700), (30e3, 1500)):
+            jac = jacobian(p, t)
+            dp = p*1e-6
+            dt = t*1e-6
+
+            for i, key in enumerate(("h", "v", "s")):
+                val = lambda p, t: if97(p=p, t=t)[key] if key != "v" else 1/if97(p=p, t=t)["v"]
+                dfdp = (val(p+dp, t)-val(p-dp, t))/(2*dp)
+                dfdt = (val(p, t+dt)-val(p, t-dt))/(2*dt)
+
+                self.assertAlmostEqual(jac[i, 0]/dfdp, 1., delta=1e-5)
+                self.assertAlmostEqual(jac[i, 1]/dfdt, 1., delta=1e-5)
+
+    def test_jacobian_region3(self):
+        #density from backward equation is not differentiated, derivatives are checked on basic equation at (rho, t)
+        p, t = 25e3, 650
+        rho = Region3VPT.singleRho(p, t)
+        jac = jacobian(p, t)
+        drho = rho*1e-6
+        dt = t*1e-6
+
+        val = lambda rho, t: Region3.props_all(rho, t, props=("p", "h", "s"))
+        dfdrho = {key: (val(rho+drho, t)[key]-val(rho-drho, t)[key])/(2*drho) for key in ("p", "h", "s")}
+        dfdt = {key: (val(rho, t+dt)[key]-val(rho, t-dt)[key])/(2*dt) for key in ("p", "h", "s")}
+
+        drhodp = 1/dfdrho["p"]
+        drhodt = -1*dfdt["p"]/dfdrho["p"]
+        self.assertAlmostEqual(jac[1, 0]/drhodp, 1., delta=1e-5)
+        self.assertAlmostEqual(jac[1, 1]/drhodt, 1., delta=1e-5)
+        for i, key in ((0, "h"), (2, "s")):
+            self.assertAlmostEqual(jac[i, 0]/(dfdrho[key]*drhodp), 1., delta=1e-5)
+            self.assertAlmostEqual(jac[i, 1]/(dfdt[key]+dfdrho[key]*drhodt), 1., delta=1e-5)
+
+    def test_batch(self):
+        p = np.array([3e3, 3.5, 25e3, 30e3, 2e5])
+        t = np.array([300, 700, 650, 1500, 300])
+        jac = jacobian(p, t)
+
+        self.assertEqual(jac.shape, (5, 3, 2))
+        for i in range(4):
+            np.testing.assert_array_equal(jac[i], jacobian(p[i], t[i]))
+        self.assertTrue(np.isnan(jac[4]).all())
+
+        self.assertEqual(jacobian([[1e3], [2e3]], [300, 400, 500]).shape, (2, 3, 3, 2))
+        self.assertTrue(math.isclose(jacobian(3e3, 300)[0, 1], if97(p=3e3, t=300)["cp"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,104 @@
+import math
+import unittest
+import numpy as np
+from IF97 import if97, if97_many
+from IF97.constants import PRESSC, TEMPC
+
+
+#properties of if97 at single phase, mixed phase adds psat and tsat
+KEYS = ("v", "u", "h", "s", "cp", "cv", "w", "kappa_t", "alpha_v", "mu_jt", "k_s", "g", "f", "mu")
+
+
+class TestMany(unittest.TestCase):
+
+    def assertMatches(self, ans, k, kwargs, keys):
+        try:
+            desired = if97(**kwargs)
+        except ValueError:
+            desired = None
+
+        for key in keys:
+            if desired is None or desired[key] is None:
+                self.assertTrue(math.isnan(ans[key][k]), msg=f"{kwargs} {key}")
+            elif math.isinf(desired[key]):
+                self.assertEqual(ans[key][k], desired[key], msg=f"{kwargs} {key}")
+            else:
+                self.assertAlmostEqual(ans[key][k], desired[key], delta=1e-10*max(1., abs(desired[key])), msg=f"{kwargs} {key}")
+
+    def test_singlephase(self):
+        p, t = np.meshgrid([0.5, 3.5, 3e3, 20e3, 22064., 25e3, 45e3, 80e3, 1e5, 1.5e5],
+                           [250, 300, 500, 623.15, 640, 647.096, 650, 700, 800, 1000, 1100, 1500, 2000, 2500])
+        for exact in (False, True):
+            ans = if97_many(p=p, t=t, exact=exact)
+            self.assertEqual(ans["h"].shape, p.shape)
+            for k, (pk, tk) in enumerate(zip(p.ravel(), t.ravel())):
+                if exact and 646 < tk < 649 and 21.9e3 < pk < 22.2e3:
+                    continue
+                self.assertMatches({key: val.ravel() for key, val in ans.items()}, k, dict(p=float(pk), t=float(tk), exact=exact), KEYS)
+
+    def test_saturation(self):
+        t = np.array([273.15, 300, 500, 623.15, 630, 646, 647, TEMPC, 200, 700])
+        x = np.array([0, 0.3, 1, 0.5, 0.2, 0.9, 0.5, 0.5, 0.5, 0.5])
+        ans = if97_many(t=t, x=x)
+        for k in range(t.size):
+            self.assertMatches(ans, k, dict(t=float(t[k]), x=float(x[k])), KEYS+("psat", "tsat"))
+
+        p = np.array([0.7, 100, 1e3, 1e4, 1.7e4, 2.1e4, 2.2e4, PRESSC, 0.5, 3e4])
+        ans = if97_many(p=p, x=0.5)
+        for k in range(p.size):
+            self.assertMatches(ans, k, dict(p=float(p[k]), x=0.5), KEYS+("psat", "tsat"))
+
+        ans = if97_many(t=500, x=[0, 0.5, 1, 1.5])
+        self.assertTrue(np.isnan(ans["h"][3]))
+        self.assertAlmostEqual(ans["h"][1], 0.5*(ans["h"][0]+ans["h"][2]), delta=1e-9)
+
+    def test_status(self):
+        p = np.array([3e3, -1, 3e3, 2e5, 6e4, 2e5, np.nan])
+        t = np.array([300, 300, 200, 300, 1500, 3000, 300])
+        for errors in ("nan", "mask"):
+            ans = if97_many(p=p, t=t, errors=errors)
+            self.assertEqual(ans["status"].tolist(), [0, 6, 5, 6, 5, 7, 1])
+            for k in range(1, p.size):
+                self.assertTrue(ans["h"][k] is np.ma.masked if errors == "mask" else np.isnan(ans["h"][k]))
+            self.assertAlmostEqual(float(ans["h"][0]), if97(p=3e3, t=300)["h"], delta=1e-10)
+
+        ans = if97_many(t=[400, 700, 400, np.nan], x=[0.5, 0.5, 1.5, 0.5], errors="mask")
+        self.assertEqual(ans["status"].tolist(), [0, 3, 2, 1])
+        self.assertEqual(ans["psat"].mask.tolist(), [False, True, True, True])
+        ans = if97_many(p=[1e3, 3e4, 0.1], x=0.5)
+        self.assertEqual(ans["status"].tolist(), [0, 4, 4])
+
+        #mu is masked above 1173.15 K where it is not defined
+        ans = if97_many(p=3e3, t=[1100, 1500], errors="mask")
+        self.assertEqual(ans["mu"].mask.tolist(), [False, True])
+        self.assertEqual(ans["status"].tolist(), [0, 0])
+
+    def test_raise(self):
+        self.assertEqual(if97_many(p=[3e3, 1e3], t=300, errors="raise")["status"].tolist(), [0, 0])
+        with self.assertRaisesRegex(ValueError, r"Value of temperature\(t\) .* at index \(0, 1\), 2 of 4 states"):
+            if97_many(p=[[3e3, 3e3], [3e3, 3e3]], t=[[300, -1], [200, 300]], errors="raise")
+        with self.assertRaisesRegex(ValueError, "Quality"):
+            if97_many(t=500, x=[0.5, 2], errors="raise")
+        with self.assertRaises(ValueError):
+            if97_many(p=3e3, t=300, errors="ignore")
+
+    def test_inputs(self):
+        with self.assertRaises(ValueError):
+            if97_many(p=1e3)
+        with self.assertRaises(ValueError):
+            if97_many(p=1e3, t=300, x=0.5)
+
+
+    def test_props(self):
+        for kwargs in (dict(p=[3e3, 25e3, 2e5], t=[300, 650, 300]), dict(t=[400, 640, 700], x=0.5),
+                       dict(p=[1e3, PRESSC], x=0.5)):
+            full = if97_many(**kwargs)
+            ans = if97_many(**kwargs, props=("h", "s", "tsat"))
+            self.assertEqual(set(ans), {"h", "s", "status"} | ({"tsat"} if "x" in kwargs else set()))
+            for key in ans:
+                np.testing.assert_array_equal(ans[key], full[key])
+            np.testing.assert_array_equal(if97_many(**kwargs, props=())["status"], full["status"])
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
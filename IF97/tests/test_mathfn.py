@@ -0,0 +1,33 @@
+import math
+import unittest
+import numpy as np
+from IF97 import if97
+from IF97.cores import mathfn
+
+
+class TestMathfn(unittest.TestCase):
+
+    def test_scalar(self):
+        self.assertIs(type(mathfn.log(2.)), float)
+        self.assertIs(type(mathfn.sqrt(np.float64(2.))), float)
+        self.assertIs(type(mathfn.exp(2)), float)
+        self.assertTrue(math.isnan(mathfn.log(-1.)))
+        self.assertEqual(mathfn.log(0.), -math.inf)
+        self.assertTrue(math.isnan(mathfn.sqrt(-1.)))
+        self.assertEqual(mathfn.exp(1e3), math.inf)
+
+    def test_array(self):
+        x = np.array([0.5, 2., 3.])
+
+        np.testing.assert_array_equal(mathfn.log(x), np.log(x))
+        np.testing.assert_array_equal(mathfn.sqrt(x), np.sqrt(x))
+        np.testing.assert_array_equal(mathfn.exp(x), np.exp(x))
+
+    def test_if97_floats(self):
+        for kwargs in (dict(p=3e3, t=300), dict(p=3.5, t=700), dict(p=25e3, t=650), dict(p=1e3, x=0.5), dict(p=30e3, t=1100)):
+            for key, value in if97(**kwargs).items():
+                self.assertIs(type(value), float, msg=f"{kwargs} {key}")
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
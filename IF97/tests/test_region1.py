@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from IF97.cores.basic import Region1
 
 
@@ -50,5 +51,67 @@ class TestRegion1(unittest.TestCase):
         self.assertAlmostEqual(Region1.props(p=3e3, t=500, desc="cv"), cv_des, delta=1e-8)
 
 
+    def test_speed_of_sound(self):
+        self.assertAlmostEqual(Region1.props(p=3e3, t=300, desc="w"), 0.150773921e4, delta=1e-5)
+        self.assertAlmostEqual(Region1.props(p=80e3, t=300, desc="w"), 0.163469054e4, delta=1e-5)
+        self.assertAlmostEqual(Region1.props(p=3e3, t=500, desc="w"), 0.124071337e4, delta=1e-5)
+
+    def test_derivative_props(self):
+        p, t, dp, dt = 3e3, 500, 1e-2, 1e-4
+        ans = Region1.props_all(p, t)
+        v = lambda p, t: Region1.props(p=p, t=t, desc="v")
+        h = lambda p, t: Region1.props(p=p, t=t, desc="h")
+        dhdp = (h(p+dp, t)-h(p-dp, t))/(2*dp)
+        dhdt = (h(p, t+dt)-h(p, t-dt))/(2*dt)
+
+        self.assertAlmostEqual(ans["kappa_t"]*ans["v"], -(v(p+dp, t)-v(p-dp, t))/(2*dp), delta=1e-15)
+        self.assertAlmostEqual(ans["alpha_v"]*ans["v"], (v(p, t+dt)-v(p, t-dt))/(2*dt), delta=1e-13)
+        self.assertAlmostEqual(ans["mu_jt"], -dhdp/dhdt, delta=1e-9)
+        self.assertAlmostEqual(ans["k_s"], (ans["w"]**2)/(1e3*p*ans["v"]), delta=1e-8)
+        self.assertAlmostEqual(ans["g"], ans["h"]-t*ans["s"], delta=1e-9)
+        self.assertAlmostEqual(ans["f"], ans["u"]-t*ans["s"], delta=1e-9)
+
+    def test_props_all(self):
+        ans = Region1.props_all(p=3e3, t=500)
+        self.assertEqual(ans["v"], Region1.props(p=3e3, t=500, desc="v"))
+        self.assertEqual(ans["u"], Region1.props(p=3e3, t=500, desc="u"))
+        self.assertEqual(ans["h"], Region1.props(p=3e3, t=500, desc="h"))
+        self.assertEqual(ans["s"], Region1.props(p=3e3, t=500, desc="s"))
+        self.assertEqual(ans["cp"], Region1.props(p=3e3, t=500, desc="cp"))
+        self.assertEqual(ans["cv"], Region1.props(p=3e3, t=500, desc="cv"))
+
+    def test_props_subset(self):
+        ans = Region1.props_all(p=3e3, t=500)
+        sub = Region1.props_all(p=3e3, t=500, props=("H", "v"))
+        self.assertEqual(set(sub), {"h", "v"})
+        self.assertEqual(sub["h"], ans["h"])
+        self.assertEqual(sub["v"], ans["v"])
+        self.assertEqual(Region1.props_all(p=3e3, t=500, props=("x",)), {})
+        self.assertEqual(Region1.props_all(p=3e3, t=500, props="cp"), {"cp": ans["cp"]})
+
+        p = np.array([3e3, 80e3])
+        t = np.array([300, 500])
+        np.testing.assert_array_equal(Region1.props_all(p, t, props=("cv",))["cv"], Region1.props_all(p, t)["cv"])
+
+    def test_props_all_array(self):
+        p = np.array([3e3, 80e3, 3e3, 20e3])
+        t = np.array([300, 300, 500, 600])
+        ans = Region1.props_all(p, t)
+
+        for key in ("v", "u", "h", "s", "cp", "cv"):
+            desired = [Region1.props_all(pi, ti)[key] for pi, ti in zip(p.tolist(), t.tolist())]
+            np.testing.assert_allclose(ans[key], desired, rtol=1e-12)
+
+    def test_props_all_columns(self):
+        #columns of the same shape are paired states, not grid
+        x = np.array([[3e3], [80e3], [3e3]])
+        t = np.array([[300], [300], [500]])
+        ans = Region1.props_all(x, t)
+
+        for key in ("v", "u", "h", "s", "cp", "cv"):
+            self.assertEqual(ans[key].shape, (3, 1))
+            desired = [Region1.props_all(float(xi), float(ti))[key] for xi, ti in zip(x[:, 0], t[:, 0])]
+            np.testing.assert_allclose(ans[key][:, 0], desired, rtol=1e-12)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from IF97.cores.basic import Region2, SuppRegion2
 
 
@@ -95,5 +96,57 @@ class TestRegion2(unittest.TestCase):
         self.assertAlmostEqual(SuppRegion2.props(p=1.5e3, t=450, desc="cv"), cv_des, delta=1e-8)
 
 
+    def test_speed_of_sound(self):
+        self.assertAlmostEqual(Region2.props(p=3.5, t=300, desc="w"), 0.427920172e3, delta=1e-6)
+        self.assertAlmostEqual(Region2.props(p=3.5, t=700, desc="w"), 0.644289068e3, delta=1e-6)
+        self.assertAlmostEqual(Region2.props(p=30e3, t=700, desc="w"), 0.480386523e3, delta=1e-6)
+        self.assertAlmostEqual(SuppRegion2.props(p=1e3, t=450, desc="w"), 0.498408101e3, delta=1e-6)
+        self.assertAlmostEqual(SuppRegion2.props(p=1e3, t=440, desc="w"), 0.489363295e3, delta=1e-6)
+        self.assertAlmostEqual(SuppRegion2.props(p=1.5e3, t=450, desc="w"), 0.481941819e3, delta=1e-6)
+
+    def test_props_all(self):
+        ans = Region2.props_all(p=3.5, t=700)
+        self.assertEqual(ans["v"], Region2.props(p=3.5, t=700, desc="v"))
+        self.assertEqual(ans["u"], Region2.props(p=3.5, t=700, desc="u"))
+        self.assertEqual(ans["h"], Region2.props(p=3.5, t=700, desc="h"))
+        self.assertEqual(ans["s"], Region2.props(p=3.5, t=700, desc="s"))
+        self.assertEqual(ans["cp"], Region2.props(p=3.5, t=700, desc="cp"))
+        self.assertEqual(ans["cv"], Region2.props(p=3.5, t=700, desc="cv"))
+
+    def test_props_subset(self):
+        ans = Region2.props_all(p=3.5, t=700)
+        for key in ans:
+            self.assertEqual(Region2.props_all(p=3.5, t=700, props=(key,)), {key: ans[key]})
+
+    def test_props_all_array(self):
+        p = np.array([3.5, 3.5, 30e3, 1e3])
+        t = np.array([300, 700, 700, 450])
+        keys = ("v", "u", "h", "s", "cp", "cv")
+        for cls in (Region2, SuppRegion2):
+            ans = cls.props_all(p, t, props=keys)
+
+            for key in keys:
+                desired = [cls.props_all(pi, ti, props=keys)[key] for pi, ti in zip(p.tolist(), t.tolist())]
+                np.testing.assert_allclose(ans[key], desired, rtol=1e-12)
+
+    def test_props_all_broadcast(self):
+        p = np.array([[3.5], [30e3]])
+        t = np.array([300, 700, 1000])
+        ans = Region2.props_all(p, t, props=("h",))
+
+        self.assertEqual(ans["h"].shape, (2, 3))
+        self.assertAlmostEqual(ans["h"][0, 1], Region2.props(p=3.5, t=700, desc="h"), delta=1e-9)
+
+    def test_props_all_columns(self):
+        #columns of the same shape are paired states, not grid
+        x = np.array([[3.5], [3.5], [30e3]])
+        t = np.array([[300], [700], [700]])
+        ans = Region2.props_all(x, t)
+
+        for key in ("v", "u", "h", "s", "cp", "cv"):
+            self.assertEqual(ans[key].shape, (3, 1))
+            desired = [Region2.props_all(float(xi), float(ti))[key] for xi, ti in zip(x[:, 0], t[:, 0])]
+            np.testing.assert_allclose(ans[key][:, 0], desired, rtol=1e-12)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,7 @@
 import unittest
-from IF97.cores.basic import Region3
+import numpy as np
+from IF97.constants import PRESSC, RHOC, TEMPC
+from IF97.cores.basic import Region3, Region4
 
 
 class TestRegion3(unittest.TestCase):
@@ -50,5 +52,109 @@ class TestRegion3(unittest.TestCase):
         self.assertAlmostEqual(Region3.props(rho=500, t=750, desc="cv"), cv_des, delta=1e-8)
 
 
+    def test_speed_of_sound(self):
+        self.assertAlmostEqual(Region3.props(rho=500, t=650, desc="w"), 0.502005554e3, delta=1e-6)
+        self.assertAlmostEqual(Region3.props(rho=200, t=650, desc="w"), 0.383444594e3, delta=1e-6)
+        self.assertAlmostEqual(Region3.props(rho=500, t=750, desc="w"), 0.760696041e3, delta=1e-6)
+
+    def test_derivative_props(self):
+        rho, t = 500, 650
+        ans = Region3.props_all(rho, t)
+
+        self.assertEqual(ans["v"], 1/rho)
+        self.assertAlmostEqual(ans["k_s"], (ans["w"]**2)/(1e3*ans["p"]*ans["v"]), delta=1e-10)
+        self.assertAlmostEqual(ans["mu_jt"], ans["v"]*(t*ans["alpha_v"]-1)/ans["cp"], delta=1e-12)
+        self.assertAlmostEqual(ans["g"], ans["h"]-t*ans["s"], delta=1e-9)
+        self.assertAlmostEqual(ans["f"], ans["u"]-t*ans["s"], delta=1e-9)
+
+    def test_props_all(self):
+        ans = Region3.props_all(rho=500, t=650)
+        self.assertEqual(ans["p"], Region3.props(rho=500, t=650, desc="p"))
+        self.assertEqual(ans["u"], Region3.props(rho=500, t=650, desc="u"))
+        self.assertEqual(ans["h"], Region3.props(rho=500, t=650, desc="h"))
+        self.assertEqual(ans["s"], Region3.props(rho=500, t=650, desc="s"))
+        self.assertEqual(ans["cp"], Region3.props(rho=500, t=650, desc="cp"))
+        self.assertEqual(ans["cv"], Region3.props(rho=500, t=650, desc="cv"))
+
+    def test_props_subset(self):
+        ans = Region3.props_all(rho=500, t=650)
+        for key in ans:
+            self.assertEqual(Region3.props_all(rho=500, t=650, props=(key,)), {key: ans[key]})
+
+    def test_props_array(self):
+        rho = np.array([500, 200, 500])
+        t = np.array([650, 650, 750])
+        p_des = [0.255837018e2, 0.222930643e2, 0.783095639e2]
+        cp_des = [0.138935717e2, 0.446579342e2, 0.634165359e1]
+
+        np.testing.assert_allclose(Region3.props(rho=rho, t=t, desc="p")*1e-3, p_des, atol=1e-7)
+        np.testing.assert_allclose(Region3.props(rho=rho, t=t, desc="cp"), cp_des, atol=1e-7)
+
+    def test_props_all_array(self):
+        rho = np.array([[150], [322], [500], [700]])
+        t = np.array([630, 650, 700, 800])
+        ans = Region3.props_all(rho, t)
+
+        for key in ("p", "u", "h", "s", "cp", "cv"):
+            self.assertEqual(ans[key].shape, (4, 4))
+            for i, j in np.ndindex(4, 4):
+                desired = Region3.props_all(rho=float(rho[i, 0]), t=float(t[j]))[key]
+                self.assertAlmostEqual(ans[key][i, j], desired, delta=1e-11*abs(desired))
+
+    def test_solve_rho(self):
+        #table 33 of IF97, p from (rho, t)
+        for rho, t, p in ((500, 650, 0.255837018e5), (200, 650, 0.222930643e5), (500, 750, 0.783095639e5)):
+            for rho0 in (rho*0.8, 50., 1500.):
+                _rho, iters = Region3.solveRho(p, t, rho0)
+                self.assertAlmostEqual(_rho, rho, delta=1e-4)
+                self.assertTrue(0 < iters < 50)
+
+    def test_solve_rho_array(self):
+        p = np.array([0.255837018e5, 0.222930643e5, 0.783095639e5, 0.255837018e5])
+        t = np.array([650, 650, 750, 650])
+        rho0 = np.array([450, 250, 600, 1500])
+        _rho, iters = Region3.solveRho(p, t, rho0)
+
+        for k in range(4):
+            desired, desiredIters = Region3.solveRho(float(p[k]), float(t[k]), float(rho0[k]))
+            self.assertAlmostEqual(_rho[k], desired, delta=1e-9*desired)
+            self.assertEqual(iters[k], desiredIters)
+
+        _rho, iters = Region3.solveRho(p, t, rho0, maxiter=2)
+        self.assertTrue(np.isnan(_rho).all())
+        np.testing.assert_array_equal(iters, 2)
+        with self.assertRaises(RuntimeError):
+            Region3.solveRho(float(p[0]), float(t[0]), float(rho0[0]), maxiter=2)
+
+    def test_satur_rho(self):
+        for tsat in (623.15, 630, 640, 645, 646.5, 647, 647.09):
+            psat = Region4.getSaturPress(tsat)
+            rhof, rhog = Region3.saturRho(psat, tsat)
+            _rhof, _rhog = Region3.saturRho(psat, tsat, exact=True)
+
+            self.assertTrue(rhof > RHOC > rhog)
+            self.assertAlmostEqual(rhof, _rhof, delta=1e-9*rhof)
+            self.assertAlmostEqual(rhog, _rhog, delta=1e-9*rhog)
+            for rho in (_rhof, _rhog):
+                self.assertAlmostEqual(Region3.props_all(rho, tsat, props=("p",))["p"], psat, delta=1e-9*psat)
+
+            auxf, auxg = Region3.auxSaturRho(tsat)
+            self.assertAlmostEqual(auxf, rhof, delta=3e-2*rhof)
+            self.assertAlmostEqual(auxg, rhog, delta=3e-2*rhog)
+
+        self.assertEqual(Region3.saturRho(PRESSC, TEMPC), (RHOC, RHOC))
+        self.assertEqual(Region3.saturRho(1e4, 600), (None, None))
+
+    def test_props_all_columns(self):
+        #columns of the same shape are paired states, not grid
+        x = np.array([[500], [200], [650]])
+        t = np.array([[650], [650], [750]])
+        ans = Region3.props_all(x, t)
+
+        for key in ("p", "u", "h", "s", "cp", "cv"):
+            self.assertEqual(ans[key].shape, (3, 1))
+            desired = [Region3.props_all(float(xi), float(ti))[key] for xi, ti in zip(x[:, 0], t[:, 0])]
+            np.testing.assert_allclose(ans[key][:, 0], desired, rtol=1e-12)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
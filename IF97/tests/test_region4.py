@@ -1,4 +1,6 @@
+import math
 import unittest
+import numpy as np
 from IF97 import PRESSC, TEMPC, PRESST, TEMPT
 from IF97.cores.basic import Region4
 
@@ -34,5 +36,23 @@ class TestRegion4(unittest.TestCase):
         self.assertAlmostEqual(Region4.getSaturPress(tsat=TEMPC), PRESSC, delta=1e-6)
 
 
+    def test_satur_press_array(self):
+        tsat = np.array([250, TEMPT, 300, 500, 600, TEMPC, 700])
+        psat, valid = Region4.getSaturPressArray(tsat=tsat)
+
+        np.testing.assert_array_equal(valid, [False, True, True, True, True, True, False])
+        self.assertTrue(math.isnan(psat[0]) and math.isnan(psat[-1]))
+        for i in range(1, 6):
+            self.assertAlmostEqual(psat[i], Region4.getSaturPress(tsat=tsat[i]), delta=1e-9*psat[i])
+
+    def test_satur_temp_array(self):
+        psat = np.array([[0.5, PRESST, 100], [1e3, PRESSC, 3e4]])
+        tsat, valid = Region4.getSaturTempArray(psat=psat)
+
+        np.testing.assert_array_equal(valid, [[False, True, True], [True, True, False]])
+        self.assertTrue(math.isnan(tsat[0, 0]) and math.isnan(tsat[1, 2]))
+        for i, j in ((0, 1), (0, 2), (1, 0), (1, 1)):
+            self.assertAlmostEqual(tsat[i, j], Region4.getSaturTemp(psat=psat[i, j]), delta=1e-9*tsat[i, j])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
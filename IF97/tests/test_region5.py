@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from IF97.cores.basic import Region5
 
 
@@ -50,5 +51,44 @@ class TestRegion5(unittest.TestCase):
         self.assertAlmostEqual(Region5.props(p=30e3, t=2000, desc="cv"), cv_des, delta=1e-8)
 
 
+    def test_speed_of_sound(self):
+        self.assertAlmostEqual(Region5.props(p=0.5e3, t=1500, desc="w"), 0.917068690e3, delta=1e-6)
+        self.assertAlmostEqual(Region5.props(p=30e3, t=1500, desc="w"), 0.928548002e3, delta=1e-6)
+        self.assertAlmostEqual(Region5.props(p=30e3, t=2000, desc="w"), 0.106736948e4, delta=1e-5)
+
+    def test_props_all(self):
+        ans = Region5.props_all(p=30e3, t=1500)
+        self.assertEqual(ans["v"], Region5.props(p=30e3, t=1500, desc="v"))
+        self.assertEqual(ans["u"], Region5.props(p=30e3, t=1500, desc="u"))
+        self.assertEqual(ans["h"], Region5.props(p=30e3, t=1500, desc="h"))
+        self.assertEqual(ans["s"], Region5.props(p=30e3, t=1500, desc="s"))
+        self.assertEqual(ans["cp"], Region5.props(p=30e3, t=1500, desc="cp"))
+        self.assertEqual(ans["cv"], Region5.props(p=30e3, t=1500, desc="cv"))
+
+    def test_props_subset(self):
+        ans = Region5.props_all(p=30e3, t=1500)
+        for key in ans:
+            self.assertEqual(Region5.props_all(p=30e3, t=1500, props=(key,)), {key: ans[key]})
+
+    def test_props_all_array(self):
+        p = np.array([0.5e3, 30e3, 30e3, 50e3])
+        t = np.array([1500, 1500, 2000, 1200])
+        ans = Region5.props_all(p, t)
+
+        for key in ("v", "u", "h", "s", "cp", "cv"):
+            desired = [Region5.props_all(pi, ti)[key] for pi, ti in zip(p.tolist(), t.tolist())]
+            np.testing.assert_allclose(ans[key], desired, rtol=1e-12)
+
+    def test_props_all_columns(self):
+        #columns of the same shape are paired states, not grid
+        x = np.array([[0.5e3], [30e3], [30e3]])
+        t = np.array([[1500], [1500], [2000]])
+        ans = Region5.props_all(x, t)
+
+        for key in ("v", "u", "h", "s", "cp", "cv"):
+            self.assertEqual(ans[key].shape, (3, 1))
+            desired = [Region5.props_all(float(xi), float(ti))[key] for xi, ti in zip(x[:, 0], t[:, 0])]
+            np.testing.assert_allclose(ans[key][:, 0], desired, rtol=1e-12)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from IF97 import region_of
+from IF97._region import PEDGES, TEDGES, _exactArray
+from IF97.cores.backwardPT import SUBREGIONS, Region3VPT
+from IF97.cores.basic import Region4
+
+
+class TestRegionOf(unittest.TestCase):
+
+    def test_scalar(self):
+        self.assertEqual(region_of(3e3, 300), (1, None))
+        self.assertEqual(region_of(3.5, 300), (2, None))
+        self.assertEqual(region_of(30e3, 700), (2, None))
+        self.assertEqual(region_of(25e3, 650), (3, "3g"))
+        self.assertEqual(region_of(22.3e3, 647.5), (3, "3u"))
+        self.assertEqual(region_of(50e3, 750), (3, "3b"))
+        self.assertEqual(region_of(30e3, 1500), (5, None))
+        self.assertEqual(region_of(60e3, 1500), (None, None))
+        self.assertEqual(region_of(1e3, 200), (None, None))
+        self.assertEqual(region_of(0, 300), (None, None))
+
+    def test_saturation(self):
+        for tsat in (300., 500., 640.):
+            psat = Region4.getSaturPress(tsat=tsat)
+            self.assertEqual(region_of(psat, tsat), (4, None))
+            self.assertEqual(region_of(np.array([psat]), np.array([tsat]))[0].tolist(), [4])
+
+    def test_array(self):
+        rng = np.random.default_rng(0)
+        n = 100000
+        p = np.concatenate([rng.uniform(0, 1.05e5, n), rng.uniform(16e3, 40e3, n), np.array(PEDGES)[rng.integers(0, len(PEDGES), n)]])
+        t = np.concatenate([rng.uniform(270, 2300, n), rng.uniform(620, 700, n), np.array(TEDGES)[rng.integers(0, len(TEDGES), n)]])
+
+        regions, codes = region_of(p, t)
+        exact = _exactArray(p, t)
+        np.testing.assert_array_equal(regions, exact[0])
+        np.testing.assert_array_equal(codes, exact[1])
+
+        for k in range(0, p.size, 101):
+            region, desc = region_of(float(p[k]), float(t[k]))
+            self.assertEqual(region or 0, regions[k])
+            self.assertEqual(SUBREGIONS.index(desc)+1 if desc else 0, codes[k])
+
+        cells = regions == 3
+        np.testing.assert_array_equal(codes[cells], Region3VPT.subregion(p[cells], t[cells]))
+
+    def test_shape(self):
+        regions, codes = region_of(np.array([[3e3], [25e3]]), np.array([300, 650, 1500]))
+        self.assertEqual(regions.tolist(), [[1, 2, 5], [1, 3, 5]])
+        self.assertEqual(codes.tolist(), [[0, 0, 0], [0, 7, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
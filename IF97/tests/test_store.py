@@ -0,0 +1,32 @@
+import unittest
+import numpy as np
+from IF97.coefficients import IJnReg1, IJnReg3, IJnVPTReg3, REG1, REG3, N3LOG, VPTREG3
+
+
+class TestStore(unittest.TestCase):
+
+    def test_poly_table(self):
+        I = np.array(IJnReg1["I"], dtype=float)
+        J = np.array(IJnReg1["J"], dtype=float)
+        n = np.array(IJnReg1["n"])
+
+        self.assertTrue(REG1.coef.flags["C_CONTIGUOUS"])
+        np.testing.assert_array_equal(REG1.coef[1], n*I)
+        np.testing.assert_array_equal(REG1.coef[2], n*I*(I-1))
+        np.testing.assert_array_equal(REG1.coef[5], n*I*J)
+        np.testing.assert_array_equal(REG1.xexparr[REG1.xidx[1]], I-1)
+        np.testing.assert_array_equal(REG1.yexparr[REG1.yidx[2]], J-2)
+
+    def test_log_term(self):
+        self.assertEqual(N3LOG, IJnReg3["n"][0])
+        self.assertEqual(len(REG3.terms), len(IJnReg3["n"])-1)
+
+    def test_vpt_table(self):
+        self.assertEqual(set(VPTREG3), set(IJnVPTReg3))
+        self.assertTrue(VPTREG3["3n"].isexp)
+        self.assertEqual(VPTREG3["3a"].vol0, IJnVPTReg3["3a"]["vol0"])
+        self.assertEqual(len(VPTREG3["3a"].poly.terms[0]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -1,5 +1,5 @@
-import numpy as np
-from .coefficients import IJH
+from .coefficients import VISC
+from .cores.mathfn import exp, sqrt
 from .constants import *
 
 
@@ -11,11 +11,13 @@ def visc(rho, t):
     Valid for:
         273.15 K <= t <= 1173.15 K or 0 C <= t <= 900 C and 0 MPa < p <= 100 MPa or 0 KPa < p <= 100000 KPa.
 
+    Float32 arrays of rho and t are evaluated in float32, largest relative error against float64 is about 2e-5.
+
     Parameters
     ----------
-    rho: float
+    rho: float or ndarray
         density (Kg/m^3).
-    t: float
+    t: float or ndarray
         temperature (K).
 
     Returns
@@ -28,18 +30,20 @@ def visc(rho, t):
     tau = t/TEMPC
     theta = 1/tau
 
-    Hi = IJH["Hi"]
-    I = IJH["I"]
-    J = IJH["J"]
-    Hij = IJH["Hij"]
-
-    suma = sum((hi/(tau**i) for hi, i in zip(Hi, range(len(Hi)))))
-    mu0 = (100*np.sqrt(tau))/suma
+    suma = sum((hi/(tau**i) for hi, i in zip(VISC.Hi, range(len(VISC.Hi)))))
+    mu0 = (100*sqrt(tau))/suma
 
-    sumb = sum((hij*((delta-1)**Ji)*((theta-1)**Ii) for Ii, Ji, hij in zip(I, J, Hij)))
+    #power ladders of (delta-1) and (theta-1), shared by all terms of the double sum
+    dpow = [1.]
+    for _ in range(VISC.maxJ):
+        dpow.append(dpow[-1]*(delta-1))
+    tpow = [1.]
+    for _ in range(VISC.maxI):
+        tpow.append(tpow[-1]*(theta-1))
+    sumb = sum((hij*dpow[Ji]*tpow[Ii] for hij, Ii, Ji in VISC.terms))
 
     pw = delta*sumb
-    mu1 = np.exp(pw)
+    mu1 = exp(pw)
 
     _mu = mu0*mu1*1e-6
     return _mu
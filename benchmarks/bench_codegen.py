@@ -0,0 +1,42 @@
+"""Micro-benchmark of generated straight-line kernels against loops over compiled tables.
+
+Run from root of repository:
+    python -m benchmarks.bench_codegen
+"""
+
+import timeit
+from IF97.coefficients import REG1, REG2, REG2SUPP, REG3, REG5, VPTREG3
+from IF97.cores import codegen, kernel
+
+
+#table: (x, y), x and y at one state point inside each region
+BASIC = {
+    REG1: (7.1-3e3/16.53e3, 1386/300-1.222),
+    REG2: (3.5/1e3, 540/700-0.5),
+    REG2SUPP: (1e3/1e3, 540/450-0.5),
+    REG3: (500/322, 647.096/650),
+    REG5: (30e3/1e3, 1000/1500),
+}
+
+
+def main(number=20000):
+    print(f"{'table':<12}{'loop (us)':>12}{'generated (us)':>17}{'speedup':>10}")
+    for table, (x, y) in BASIC.items():
+        func = codegen.load(table).polysum
+        tloop = timeit.timeit(lambda: kernel.loopPolysum(x, y, table), number=number)/number*1e6
+        tgen = timeit.timeit(lambda: func(x, y), number=number)/number*1e6
+        print(f"{table.name:<12}{tloop:>12.2f}{tgen:>17.2f}{tloop/tgen:>9.2f}x")
+
+    #backward equations at reduced variables x = y = 0.9, inside range of all subregions
+    tloop = 0.
+    tgen = 0.
+    for koef in VPTREG3.values():
+        func = codegen.load(koef.poly).polyval
+        tloop += timeit.timeit(lambda: kernel.loopPolyval(0.9, 0.9, koef.poly), number=number)/number*1e6
+        tgen += timeit.timeit(lambda: func(0.9, 0.9), number=number)/number*1e6
+    n = len(VPTREG3)
+    print(f"{'vpt (mean)':<12}{tloop/n:>12.2f}{tgen/n:>17.2f}{tloop/tgen:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
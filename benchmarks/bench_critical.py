@@ -0,0 +1,66 @@
+"""Latency and accuracy of region 3 inside near-critical band, +-1 K and +-100 KPa around critical point.
+
+Single phase: density from backward equations alone, polished by Newton iteration of Region3.solveRho from
+backward equations (default bracket) and by NearCritical.rho, with number of evaluations of basic equation and
+largest residual of pressure. Saturation: latency of saturationT below critical temperature and at critical point.
+
+Run from root of repository:
+    python -m benchmarks.bench_critical
+"""
+
+import time
+import numpy as np
+from IF97 import if97, saturationT
+from IF97.constants import PRESSC, TEMPC
+from IF97.cores.backwardPT import Region3VPT
+from IF97.cores.basic import Region3
+from IF97.cores.critical import BANDP, BANDT, NearCritical
+
+
+def band(n=101):
+    """States on n x n grid over near-critical band."""
+
+    p = np.linspace(PRESSC-BANDP, PRESSC+BANDP, n)
+    t = np.linspace(TEMPC-BANDT, TEMPC+BANDT, n)
+    return [(float(pi), float(ti)) for pi in p for ti in t]
+
+
+def single():
+    states = band()
+
+    def backward(p, t):
+        return Region3VPT.singleRho(p, t), 0
+
+    def newton(p, t):
+        return Region3.solveRho(p, t, Region3VPT.singleRho(p, t))
+
+    print(f"{'single phase':<16}{'us/state':>10}{'mean evals':>12}{'max evals':>11}{'largest |p(rho,t)/p-1|':>25}")
+    for name, func in (("backward", backward), ("solveRho", newton), ("NearCritical", NearCritical.rho)):
+        start = time.perf_counter()
+        ans = [func(p, t) for p, t in states]
+        elapsed = (time.perf_counter()-start)/len(states)*1e6
+
+        iters = [it for _, it in ans]
+        error = max(abs(Region3.props_all(rho, t, props=("p",))["p"]/p-1) for (rho, _), (p, t) in zip(ans, states))
+        print(f"{name:<16}{elapsed:>10.2f}{np.mean(iters):>12.2f}{max(iters):>11d}{error:>25.1e}")
+
+    start = time.perf_counter()
+    for p, t in states:
+        if97(p=p, t=t, exact=True)
+    print(f"if97(exact=True) over band: {(time.perf_counter()-start)/len(states)*1e6:.2f} us/state")
+
+
+def saturation(number=2000):
+    for tsat in (TEMPC-1, TEMPC-1e-3, TEMPC):
+        saturationT(tsat)
+        start = time.perf_counter()
+        for _ in range(number):
+            ans = saturationT(tsat)
+        elapsed = (time.perf_counter()-start)/number*1e6
+        print(f"saturationT({tsat:.3f}): {elapsed:7.2f} us, cv {ans['cv'][0]:.4f}, cp {ans['cp'][0]:.4g}, mu {ans['mu'][0]:.4e}")
+
+
+if __name__ == "__main__":
+    single()
+    print()
+    saturation()
@@ -0,0 +1,98 @@
+"""Density of region 3 from pressure and temperature.
+
+Newton iteration on basic equation from cold start, scalar loop against arrays, cost of single-point density
+from backward equations alone, polished by Newton iteration (exact mode) and from cold start, and backward
+density of supercritical sweep over arrays grouped by subregion against scalar loop.
+
+Run from root of repository:
+    python -m benchmarks.bench_density
+"""
+
+import time
+import numpy as np
+from IF97.cores.backwardPT import Region3VPT
+from IF97.cores.basic import Region3
+
+
+def states(n, seed=0):
+    """Random states of region 3 with density from backward equations."""
+
+    rng = np.random.default_rng(seed)
+    p, t, rho = [], [], []
+    while len(p) < n:
+        pi, ti = rng.uniform(20e3, 1e5), rng.uniform(623.15, 863.15)
+        if (rhoi := Region3VPT.singleRho(pi, ti)) is not None:
+            p.append(pi)
+            t.append(ti)
+            rho.append(rhoi)
+    return np.array(p), np.array(t), np.array(rho)
+
+
+def main(n=20000):
+    p, t, rho = states(n)
+    rho0 = np.full(n, 500.)
+
+    start = time.perf_counter()
+    scalar = [Region3.solveRho(pi, ti, ri) for pi, ti, ri in zip(p.tolist(), t.tolist(), rho0.tolist())]
+    tscalar = time.perf_counter()-start
+
+    start = time.perf_counter()
+    _rho, iters = Region3.solveRho(p, t, rho0)
+    tarray = time.perf_counter()-start
+
+    error = np.max(np.abs(_rho/np.array([r for r, _ in scalar])-1))
+    print(f"{n} states of region 3, initial guess 500 Kg/m^3")
+    print(f"scalar loop: {tscalar*1e3:8.1f} ms, {tscalar/n*1e6:6.2f} us/state, mean iterations {np.mean([i for _, i in scalar]):.2f}")
+    print(f"array:       {tarray*1e3:8.1f} ms, {tarray/n*1e6:6.2f} us/state, iterations {iters.min()}..{iters.max()}")
+    #where isotherm has three roots near saturation, cold start can converge to root of other phase
+    other = np.abs(_rho/rho-1) > 1e-3
+    print(f"largest relative difference scalar/array {error:.1e}, states on root of other phase {other.sum()}")
+
+
+def single(n=2000):
+    p, t, _ = states(n, seed=1)
+    p, t = p.tolist(), t.tolist()
+    cases = {
+        "backward": lambda pi, ti: Region3VPT.singleRho(pi, ti),
+        "backward+Newton": lambda pi, ti: Region3VPT.singleRho(pi, ti, exact=True),
+        "cold Newton": lambda pi, ti: Region3._iterRho(1.5, pi, ti),
+    }
+
+    exact = [Region3VPT.singleRho(pi, ti, exact=True) for pi, ti in zip(p, t)]
+    print(f"{'single point':<18}{'us/state':>10}{'largest |p(rho,t)/p-1|':>26}")
+    for name, func in cases.items():
+        start = time.perf_counter()
+        rho = [func(pi, ti) for pi, ti in zip(p, t)]
+        elapsed = (time.perf_counter()-start)/n*1e6
+        error = max(abs(Region3.props_all(ri, ti, props=("p",))["p"]/pi-1) for ri, pi, ti in zip(rho, p, t))
+        print(f"{name:<18}{elapsed:>10.2f}{error:>26.1e}")
+    print(f"states where cold Newton and exact differ: {sum(abs(Region3._iterRho(1.5, pi, ti)/ri-1) > 1e-6 for ri, pi, ti in zip(exact, p, t))}")
+
+
+
+def sweep(n=200000):
+    rng = np.random.default_rng(2)
+    p = rng.uniform(22.064e3, 1e5, n)
+    t = rng.uniform(623.15, 863.15, n)
+
+    for exact in (False, True):
+        start = time.perf_counter()
+        scalar = [Region3VPT.singleRho(pi, ti, exact=exact) for pi, ti in zip(p.tolist(), t.tolist())]
+        tscalar = time.perf_counter()-start
+
+        start = time.perf_counter()
+        rho = Region3VPT.singleRho(p, t, exact=exact)
+        tarray = time.perf_counter()-start
+
+        scalar = np.array([np.nan if ri is None else ri for ri in scalar])
+        error = np.nanmax(np.abs(rho/scalar-1))
+        print(f"sweep of {n} states, exact {exact}: scalar loop {tscalar/n*1e6:6.2f} us/state, "
+              f"array {tarray/n*1e6:6.3f} us/state, largest relative difference {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
+    print()
+    single()
+    print()
+    sweep()
@@ -0,0 +1,88 @@
+"""Per-call overhead of scalar dispatch of if97, latency of if97 minus latency of its region kernels alone.
+
+Kernel of every case is the minimal sequence of calls which computes the same properties from inputs already
+resolved (saturation pressure or temperature is taken as given): property equations of region, with density from
+backward equations in region 3, mixing of phases by quality and viscosity of state. Overhead is everything else
+if97 does: checks of limits, selection of region, boundary and saturation equations and building of returned dict.
+Target is OVERHEAD_TARGET per call in every case, before rewrite of dispatch it was about 2.5 us in region 1, 5 us
+in region 3 and 20 us at mixed phase. It is met with margin at single phase (about 1.5-2 us), at mixed phase given
+pressure overhead is about 3.6-4.7 us over repeated runs, of which saturation temperature equation is about 0.6 us
+alone and 1.5-2 us when interleaved with region equations (timed inside _mixed the rest is about 1.3 us).
+
+Run from root of repository:
+    python -m benchmarks.bench_dispatch
+"""
+
+import timeit
+from IF97 import if97
+from IF97._if97 import _PROPS
+from IF97.cores.backwardPT import Region3VPT
+from IF97.cores.basic import Region1, Region2, Region3, Region4, Region5
+from IF97.visco import visc
+
+
+#target of per-call overhead (us)
+OVERHEAD_TARGET = 5.
+
+
+def single(cls):
+    def kernel(p, t):
+        ans = cls.props_all(p, t)
+        visc(1/ans["v"], t)
+    return kernel
+
+
+def region3(p, t):
+    rho = Region3VPT.singleRho(p, t)
+    Region3.props_all(rho, t)
+    visc(rho, t)
+
+
+def mix(liq, vap, x, tsat):
+    props = {key: liq[key]+x*(vap[key]-liq[key]) for key in _PROPS}
+    visc(1/props["v"], tsat)
+
+
+def mixed(psat, tsat, x):
+    mix(Region1.props_all(psat, tsat), Region2.props_all(psat, tsat), x, tsat)
+
+
+def mixed3(psat, tsat, x):
+    rhof, rhog = Region3.saturRho(psat, tsat)
+    mix(Region3.props_all(rhof, tsat), Region3.props_all(rhog, tsat), x, tsat)
+
+
+#region: inputs of if97 and kernel with its arguments, one state point inside each region
+CASES = {
+    "region 1": (dict(p=3e3, t=300), single(Region1), (3e3, 300)),
+    "region 2": (dict(p=3.5, t=700), single(Region2), (3.5, 700)),
+    "region 3": (dict(p=25e3, t=650), region3, (25e3, 650)),
+    "region 4": (dict(p=1e3, x=0.5), mixed, (1e3, Region4.getSaturTemp(psat=1e3), 0.5)),
+    "region 4/3": (dict(t=640, x=0.5), mixed3, (Region4.getSaturPress(tsat=640), 640, 0.5)),
+    "region 5": (dict(p=30e3, t=1100), single(Region5), (30e3, 1100)),
+}
+
+
+def best(funcs, number, repeat=15):
+    """Best latency (us) of every function, repeats of functions are interleaved so that drift of clock of CPU
+    affects all of them alike."""
+
+    times = [[] for _ in funcs]
+    for _ in range(repeat):
+        for func, samples in zip(funcs, times):
+            samples.append(timeit.timeit(func, number=number)/number*1e6)
+    return [min(samples) for samples in times]
+
+
+def main(number=5000):
+    print(f"{'region':<12}{'if97 (us)':>10}{'kernel (us)':>13}{'overhead (us)':>15}")
+    worst = 0.
+    for name, (kwargs, kernel, args) in CASES.items():
+        latency, base = best((lambda: if97(**kwargs), lambda: kernel(*args)), number)
+        worst = max(worst, latency-base)
+        print(f"{name:<12}{latency:>10.2f}{base:>13.2f}{latency-base:>15.2f}")
+    print(f"largest overhead {worst:.2f} us, target {OVERHEAD_TARGET:.2f} us: {'met' if worst <= OVERHEAD_TARGET else 'not met'}")
+
+
+if __name__ == "__main__":
+    main()
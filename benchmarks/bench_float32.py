@@ -0,0 +1,64 @@
+"""Accuracy and speed of float32 evaluation against float64 evaluation of basic equations and viscosity.
+
+Error is largest relative error over random states of each region, values closer to zero than 1e-3 of largest
+magnitude of property (e.g. alpha_v and mu_jt at their sign change) are skipped.
+
+Run from root of repository:
+    python -m benchmarks.bench_float32
+"""
+
+import timeit
+import numpy as np
+from IF97._grid import _regionCodes
+from IF97.cores.backwardPT import Region3VPT
+from IF97.cores.basic import Region1, Region2, Region3, Region5
+from IF97.visco import visc
+
+
+KEYS = ("v", "u", "h", "s", "cp", "cv", "w", "kappa_t", "alpha_v", "mu_jt", "k_s", "g", "f")
+
+
+def relError(a, b):
+    ok = np.abs(a) > 1e-3*np.max(np.abs(a))
+    return float(np.max(np.abs(b[ok]/a[ok]-1)))
+
+
+def states(n, seed=0):
+    """Random states of regions 1, 2, 5 as (p, t) and of region 3 as (rho, t)."""
+
+    rng = np.random.default_rng(seed)
+    p = 10**rng.uniform(-0.5, 5, n)
+    t = rng.uniform(273.15, 2273.15, n)
+    codes = _regionCodes(p, t)
+
+    cases = {1: (Region1, p[codes == 1], t[codes == 1]), 2: (Region2, p[codes == 2], t[codes == 2]),
+             5: (Region5, p[codes == 5], t[codes == 5])}
+    p3, t3 = p[codes == 3][:2000], t[codes == 3][:2000]
+    cases[3] = (Region3, np.array([Region3VPT.singleRho(pi, ti) for pi, ti in zip(p3, t3)]), t3)
+    return cases
+
+
+def main(n=200000, number=5):
+    cases = states(n)
+
+    print(f"{'region':<8}{'states':>8}{'f64 (ms)':>10}{'f32 (ms)':>10}  largest relative error")
+    for region in (1, 2, 3, 5):
+        cls, x, t = cases[region]
+        x32, t32 = x.astype(np.float32), t.astype(np.float32)
+        a = cls.props_all(x, t)
+        b = cls.props_all(x32, t32)
+        t64 = timeit.timeit(lambda: cls.props_all(x, t), number=number)/number*1e3
+        t32 = timeit.timeit(lambda: cls.props_all(x32, t32), number=number)/number*1e3
+        errors = "  ".join(f"{key} {relError(a[key], b[key]):.1e}" for key in KEYS)
+        print(f"{region:<8}{x.size:>8}{t64:>10.1f}{t32:>10.1f}  {errors}")
+
+    rng = np.random.default_rng(1)
+    rho = rng.uniform(0.01, 1100, n)
+    t = rng.uniform(273.15, 1173.15, n)
+    a = visc(rho, t)
+    b = visc(rho.astype(np.float32), t.astype(np.float32))
+    print(f"{'mu':<8}{n:>8}{'':>20}  mu {relError(a, b):.1e}")
+
+
+if __name__ == "__main__":
+    main()
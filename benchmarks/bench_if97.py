@@ -0,0 +1,30 @@
+"""Latency of single-point calls of if97 in every region.
+
+Run from root of repository:
+    python -m benchmarks.bench_if97
+"""
+
+import timeit
+from IF97 import if97
+
+
+#region: inputs of if97, one state point inside each region
+CASES = {
+    "region 1": dict(p=3e3, t=300),
+    "region 2": dict(p=3.5, t=700),
+    "region 3": dict(p=25e3, t=650),
+    "region 4": dict(p=1e3, x=0.5),
+    "region 4/3": dict(t=640, x=0.5),
+    "region 5": dict(p=30e3, t=1500),
+}
+
+
+def main(number=20000):
+    print(f"{'region':<12}{'if97 (us)':>10}{'type of h':>12}")
+    for name, kwargs in CASES.items():
+        latency = timeit.timeit(lambda: if97(**kwargs), number=number)/number*1e6
+        print(f"{name:<12}{latency:>10.2f}{type(if97(**kwargs)['h']).__name__:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Import time of IF97 in fresh interpreter against budget.
+
+Single-point calls need neither numpy nor backward equations v(p,T) of region 3, they are imported on first use.
+Exits with status 1 if best import time over runs exceeds budget.
+
+Run from root of repository:
+    python -m benchmarks.bench_import
+"""
+
+import subprocess
+import sys
+import time
+
+
+#budget of best import time (ms), python startup included
+BUDGET = 100.
+
+
+def importTime(statement, runs=10):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        best = min(best, time.perf_counter()-start)
+    return best*1e3
+
+
+def main(budget=BUDGET):
+    base = importTime("pass")
+    print(f"{'statement':<40}{'best (ms)':>10}")
+    for statement in ("pass", "import numpy", "import IF97", "import IF97; IF97.if97(p=3e3, t=300)", "from IF97 import if97_grid"):
+        print(f"{statement:<40}{importTime(statement):>10.1f}")
+
+    elapsed = importTime("import IF97")
+    print(f"import IF97: {elapsed:.1f} ms ({elapsed-base:.1f} ms above startup), budget {budget:.0f} ms")
+    if elapsed > budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Micro-benchmark of shared power-table kernel against direct loops over coefficients of basic equations.
+
+Run from root of repository:
+    python -m benchmarks.bench_kernel
+"""
+
+import timeit
+from IF97.coefficients import IJnReg1, IJnReg2, IJnReg2Supp, IJnReg3, IJnReg5, REG1, REG2, REG2SUPP, REG3, REG5
+from IF97.cores import kernel
+
+
+def loopsum(x, y, I, J, n):
+    """Reference loop, every power is computed separately for each of six sums."""
+
+    g = 0.
+    dgdx = 0.
+    d2gdx2 = 0.
+    dgdy = 0.
+    d2gdy2 = 0.
+    d2gdxdy = 0.
+
+    for Ii, Ji, ni in zip(I, J, n):
+        g += ni*(x**Ii)*(y**Ji)
+        dgdx += ni*Ii*(x**(Ii-1))*(y**Ji)
+        d2gdx2 += ni*Ii*(Ii-1)*(x**(Ii-2))*(y**Ji)
+        dgdy += ni*Ji*(x**Ii)*(y**(Ji-1))
+        d2gdy2 += ni*Ji*(Ji-1)*(x**Ii)*(y**(Ji-2))
+        d2gdxdy += ni*Ii*Ji*(x**(Ii-1))*(y**(Ji-1))
+
+    return g, dgdx, d2gdx2, dgdy, d2gdy2, d2gdxdy
+
+
+#region: (x, y, coefficients, compiled table), x and y at one state point inside each region
+CASES = {
+    "region 1": (7.1-3e3/16.53e3, 1386/300-1.222, IJnReg1, REG1),
+    "region 2": (3.5/1e3, 540/700-0.5, IJnReg2, REG2),
+    "region 2 supp": (1e3/1e3, 540/450-0.5, IJnReg2Supp, REG2SUPP),
+    "region 3": (500/322, 647.096/650, {key: val[1:] for key, val in IJnReg3.items()}, REG3),
+    "region 5": (30e3/1e3, 1000/1500, IJnReg5, REG5),
+}
+
+
+def main(number=20000):
+    print(f"{'region':<15}{'loop (us)':>12}{'kernel (us)':>14}{'speedup':>10}")
+    for name, (x, y, coef, table) in CASES.items():
+        I, J, n = coef["I"], coef["J"], coef["n"]
+        tloop = timeit.timeit(lambda: loopsum(x, y, I, J, n), number=number)/number*1e6
+        tkern = timeit.timeit(lambda: kernel.polysum(x, y, table), number=number)/number*1e6
+        print(f"{name:<15}{tloop:>12.2f}{tkern:>14.2f}{tloop/tkern:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
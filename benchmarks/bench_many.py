@@ -0,0 +1,78 @@
+"""Throughput of if97_many against per-row loop of if97 over random states of every region, also with share of
+states out of range of limits (status codes instead of exception per row).
+
+Run from root of repository:
+    python -m benchmarks.bench_many
+"""
+
+import time
+import numpy as np
+from IF97 import if97, if97_many
+
+
+def states(n, seed=0):
+    """Random states at single phase over range of limits of regions 1, 2, 3 and 5."""
+
+    rng = np.random.default_rng(seed)
+    t = rng.uniform(273.15, 2273.15, n)
+    p = np.where(t > 1073.15, rng.uniform(1., 5e4, n), rng.uniform(1., 1e5, n))
+    return p, t
+
+
+def main(n=1000000, loop=20000):
+    p, t = states(n)
+    if97_many(p=p[:10], t=t[:10])
+
+    start = time.perf_counter()
+    for pi, ti in zip(p[:loop].tolist(), t[:loop].tolist()):
+        if97(p=pi, t=ti)
+    tloop = (time.perf_counter()-start)/loop
+
+    start = time.perf_counter()
+    ans = if97_many(p=p, t=t)
+    tmany = (time.perf_counter()-start)/n
+
+    print(f"single phase, {n} states: if97 loop {tloop*1e6:6.2f} us/state, if97_many {tmany*1e6:6.3f} us/state, "
+          f"speedup {tloop/tmany:.0f}x, nan h {np.isnan(ans['h']).sum()}")
+
+    rng = np.random.default_rng(1)
+    tsat = rng.uniform(273.15, 647.096, n)
+    x = rng.uniform(0, 1, n)
+    start = time.perf_counter()
+    for ti, xi in zip(tsat[:loop].tolist(), x[:loop].tolist()):
+        if97(t=ti, x=xi)
+    tloop = (time.perf_counter()-start)/loop
+
+    start = time.perf_counter()
+    if97_many(t=tsat, x=x)
+    tmany = (time.perf_counter()-start)/n
+    print(f"mixed phase, {n} states:  if97 loop {tloop*1e6:6.2f} us/state, if97_many {tmany*1e6:6.3f} us/state, "
+          f"speedup {tloop/tmany:.0f}x")
+
+
+def errors(n=1000000, loop=20000, share=0.1):
+    """States with share of out of range pressures, per-row loop of if97 with try/except against if97_many."""
+
+    p, t = states(n, seed=2)
+    rng = np.random.default_rng(2)
+    p[rng.uniform(0, 1, n) < share] = -1.
+
+    start = time.perf_counter()
+    for pi, ti in zip(p[:loop].tolist(), t[:loop].tolist()):
+        try:
+            if97(p=pi, t=ti)
+        except ValueError:
+            pass
+    tloop = (time.perf_counter()-start)/loop
+
+    for policy in ("nan", "mask"):
+        start = time.perf_counter()
+        ans = if97_many(p=p, t=t, errors=policy)
+        tmany = (time.perf_counter()-start)/n
+        print(f"{share:.0%} invalid, errors={policy!r:<7} if97 loop {tloop*1e6:6.2f} us/state, if97_many {tmany*1e6:6.3f} us/state, "
+              f"status counts {np.bincount(ans['status'].ravel()).tolist()}")
+
+
+if __name__ == "__main__":
+    main()
+    errors()
@@ -0,0 +1,54 @@
+"""Micro-benchmark of evaluation of single properties against evaluation of all properties.
+
+Region equations evaluate h alone, if97 evaluates h and s (as in loop over expansion of turbine) with props
+against all properties and viscosity in every region.
+
+Run from root of repository:
+    python -m benchmarks.bench_props
+"""
+
+import timeit
+from IF97 import if97
+from IF97.cores.basic import Region1, Region2, Region3, Region5
+
+
+#region: (class, first input, temperature), one state point inside each region
+CASES = {
+    "region 1": (Region1, 3e3, 500),
+    "region 2": (Region2, 3.5, 700),
+    "region 3": (Region3, 500, 650),
+    "region 5": (Region5, 30e3, 1500),
+}
+
+
+def main(number=20000):
+    print(f"{'region':<12}{'all (us)':>10}{'h (us)':>10}{'speedup':>10}")
+    for name, (cls, x, t) in CASES.items():
+        tall = timeit.timeit(lambda: cls.props_all(x, t), number=number)/number*1e6
+        th = timeit.timeit(lambda: cls.props_all(x, t, props=("h",)), number=number)/number*1e6
+        print(f"{name:<12}{tall:>10.2f}{th:>10.2f}{tall/th:>9.2f}x")
+
+
+#region: inputs of if97, one state point inside each region
+STATES = {
+    "region 1": dict(p=3e3, t=300),
+    "region 2": dict(p=3.5, t=700),
+    "region 3": dict(p=25e3, t=650),
+    "region 4": dict(p=1e3, x=0.5),
+    "region 4/3": dict(t=640, x=0.5),
+    "region 5": dict(p=30e3, t=1100),
+}
+
+
+def selected(number=20000):
+    print(f"{'if97':<12}{'all (us)':>10}{'h, s (us)':>11}{'speedup':>10}")
+    for name, kwargs in STATES.items():
+        tall = timeit.timeit(lambda: if97(**kwargs), number=number)/number*1e6
+        ths = timeit.timeit(lambda: if97(**kwargs, props=("h", "s")), number=number)/number*1e6
+        print(f"{name:<12}{tall:>10.2f}{ths:>11.2f}{tall/ths:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
+    print()
+    selected()
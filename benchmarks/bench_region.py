@@ -0,0 +1,49 @@
+"""Latency of region_of against classification from boundary equations, for scalars and arrays.
+
+Scalars: states of every region away from boundaries and near boundaries of subregions of region 3, index is used
+only in region 3 and other states fall back to boundary equations (difference is call of region_of). Arrays: random
+states over range of limits and over region 3, with share of states in buckets crossed by boundaries.
+
+Run from root of repository:
+    python -m benchmarks.bench_region
+"""
+
+import time
+import numpy as np
+from IF97 import region_of
+from IF97._region import _DIRTY, _exact, _exactArray, RegionIndex
+
+
+def scalar(number=20000):
+    print(f"{'state':<22}{'region':>12}{'region_of us':>14}{'exact us':>10}")
+    for p, t in ((3e3, 300.), (30e3, 700.), (1e3, 1500.), (50e3, 750.), (25e3, 650.), (22.3e3, 647.5)):
+        times = []
+        for func in (region_of, _exact):
+            start = time.perf_counter()
+            for _ in range(number):
+                func(p, t)
+            times.append((time.perf_counter()-start)/number*1e6)
+        print(f"{f'p={p:g}, t={t:g}':<22}{str(region_of(p, t)):>12}{times[0]:>14.2f}{times[1]:>10.2f}")
+
+
+def array(n=1000000):
+    rng = np.random.default_rng(0)
+    for name, p, t in (("all regions", rng.uniform(1., 1e5, n), rng.uniform(273.15, 2273.15, n)),
+                       ("region 3", rng.uniform(16.6e3, 1e5, n), rng.uniform(623.2, 863.1, n))):
+        times = []
+        for func in (region_of, _exactArray):
+            func(p[:10], t[:10])
+            start = time.perf_counter()
+            func(p, t)
+            times.append((time.perf_counter()-start)/n*1e9)
+        print(f"{name:<12} index {times[0]:6.1f} ns/state, exact {times[1]:6.1f} ns/state")
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    table = RegionIndex.table()
+    print(f"index built in {(time.perf_counter()-start)*1e3:.1f} ms, {sum(code == _DIRTY for code in table)/len(table):.1%} of buckets crossed by boundaries")
+    print()
+    scalar()
+    print()
+    array()